@@ -0,0 +1,304 @@
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError, Route, Request
+
+from utils import perf
+from utils.http import DROPPED_RESPONSE_HEADERS
+
+logger = logging.getLogger("pytest_playwright")
+
+# Only these are served from the cache; documents and XHR/fetch always go to the network
+STATIC_RESOURCE_TYPES = frozenset({"script", "stylesheet", "font", "image", "media"})
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """'public, max-age=3600' -> {'public': None, 'max-age': '3600'}"""
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _seconds(value: str | None) -> int | None:
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _http_date(value: str | None) -> float | None:
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: dict[str, str]) -> float | None:
+    """
+    Seconds a response may be reused without asking the server (shared-cache rules:
+    s-maxage, then max-age, then Expires - Date). None when the response doesn't say;
+    there's no heuristic freshness, so such responses are revalidated on every use.
+    """
+    cc = parse_cache_control(headers.get("cache-control"))
+    if "no-cache" in cc:
+        return 0
+    for directive in ("s-maxage", "max-age"):
+        if directive in cc:
+            return _seconds(cc[directive]) or 0
+    if "expires" in headers:
+        expires = _http_date(headers["expires"])
+        if expires is None:
+            return 0  # an invalid Expires means already expired
+        date = _http_date(headers.get("date")) or time.time()
+        return max(0.0, expires - date)
+    return None
+
+
+@dataclass
+class CachedAsset:
+    status: int
+    headers: dict[str, str]  # lowercase names, wire-encoding headers dropped
+    body: bytes
+    vary: dict[str, str]  # request header values this response was selected by
+    stored_at: float
+    expires_at: float  # == stored_at when every use has to be revalidated
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers that revalidate this response."""
+        conditional = {}
+        if "etag" in self.headers:
+            conditional["if-none-match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            conditional["if-modified-since"] = self.headers["last-modified"]
+        return conditional
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0  # fresh, served without touching the network
+    revalidations: int = 0  # 304 Not Modified, body served from memory
+    misses: int = 0  # full response from the server
+    bytes_served: int = 0  # bodies that came from memory
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.revalidations + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.hits + self.revalidations) / self.requests if self.requests else 0.0
+
+
+class AssetCache:
+    """
+    Session-wide in-memory HTTP cache for static responses (scripts, styles, fonts,
+    images), shared by every browser context through context.route. Honours
+    Cache-Control (no-store, private, no-cache, max-age, s-maxage), Expires, Vary,
+    and revalidates stale entries with their ETag / Last-Modified.
+    Entries are evicted least recently used first above `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        resource_types: frozenset[str] = STATIC_RESOURCE_TYPES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_bytes = max_bytes
+        self.resource_types = resource_types
+        self.clock = clock
+        self.by_type: dict[str, CacheStats] = {}
+        self.evictions = 0
+        self._entries: OrderedDict[str, CachedAsset] = OrderedDict()
+        self._bytes = 0
+
+    # --- Cache policy ---
+    def lookup(self, url: str, request_headers: dict[str, str]) -> CachedAsset | None:
+        entry = self._entries.get(url)
+        if entry is None or any(request_headers.get(name, "") != value for name, value in entry.vary.items()):
+            return None
+        self._entries.move_to_end(url)
+        return entry
+
+    def store(self, url: str, status: int, headers: dict[str, str], body: bytes, request_headers: dict[str, str]) -> bool:
+        """Keep the response if a shared cache may reuse it; False when it isn't stored."""
+        headers = {k.lower(): v for k, v in headers.items() if k.lower() not in DROPPED_RESPONSE_HEADERS}
+        cc = parse_cache_control(headers.get("cache-control"))
+        vary = [name.strip().lower() for name in headers.get("vary", "").split(",") if name.strip()]
+        if (
+            status != 200
+            or "no-store" in cc
+            or "private" in cc
+            or "*" in vary
+            or ("authorization" in request_headers and "public" not in cc and "s-maxage" not in cc)
+            or len(body) > self.max_bytes
+        ):
+            return False
+        lifetime = freshness_lifetime(headers)
+        if not lifetime and "etag" not in headers and "last-modified" not in headers:
+            return False  # can never be reused without a full download
+
+        now = self.clock()
+        age = _seconds(headers.get("age")) or 0
+        entry = CachedAsset(
+            status, headers, body, {name: request_headers.get(name, "") for name in vary},
+            stored_at=now, expires_at=now + max(0, (lifetime or 0) - age),
+        )
+        self._remove(url)
+        self._entries[url] = entry
+        self._bytes += entry.size
+        self._evict()
+        return True
+
+    def refresh(self, entry: CachedAsset, headers: dict[str, str]) -> None:
+        """Update a stale entry from a 304: its headers replace the stored ones."""
+        entry.headers.update({
+            k.lower(): v for k, v in headers.items()
+            if k.lower() not in DROPPED_RESPONSE_HEADERS and k.lower() != "content-type"
+        })
+        now = self.clock()
+        age = _seconds(headers.get("age")) or 0
+        entry.stored_at, entry.expires_at = now, now + max(0, (freshness_lifetime(entry.headers) or 0) - age)
+
+    def _remove(self, url: str) -> None:
+        old = self._entries.pop(url, None)
+        if old is not None:
+            self._bytes -= old.size
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.evictions += 1
+
+    # --- Routing ---
+    def handle(self, route: Route, request: Request) -> None:
+        """context.route handler: fresh hits never reach the network, stale ones are revalidated."""
+        headers = request.headers
+        if (
+            request.method != "GET"
+            or request.resource_type not in self.resource_types
+            or "range" in headers
+            or "no-store" in parse_cache_control(headers.get("cache-control"))
+        ):
+            route.fallback()
+            return
+        stats = self.by_type.setdefault(request.resource_type, CacheStats())
+        entry = self.lookup(request.url, headers)
+        if entry is not None and entry.is_fresh(self.clock()):
+            stats.hits += 1
+            self._serve(route, entry, stats)
+            return
+
+        try:
+            response = route.fetch(headers={**headers, **entry.validators} if entry else None, max_redirects=0)
+            body = b"" if response.status == 304 else response.body()
+        except PlaywrightError:
+            route.fallback()
+            return
+        if response.status == 304 and entry is not None:
+            stats.revalidations += 1
+            self.refresh(entry, response.headers)
+            self._serve(route, entry, stats)
+            return
+        stats.misses += 1
+        self.store(request.url, response.status, response.headers, body, headers)
+        route.fulfill(response=response, body=body)
+
+    def _serve(self, route: Route, entry: CachedAsset, stats: CacheStats) -> None:
+        stats.bytes_served += entry.size
+        age = str(int(self.clock() - entry.stored_at))
+        route.fulfill(status=entry.status, headers={**entry.headers, "age": age}, body=entry.body)
+
+    # --- Reporting ---
+    @property
+    def total(self) -> CacheStats:
+        total = CacheStats()
+        for s in self.by_type.values():
+            total.hits += s.hits
+            total.revalidations += s.revalidations
+            total.misses += s.misses
+            total.bytes_served += s.bytes_served
+        return total
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    def report_lines(self) -> list[str]:
+        lines = [f"{'type':<12}{'requests':>10}{'hits':>7}{'304s':>7}{'misses':>8}{'hit rate':>10}{'KB from memory':>16}"]
+        for name, s in sorted(self.by_type.items()) + [("total", self.total)]:
+            lines.append(
+                f"{name:<12}{s.requests:>10}{s.hits:>7}{s.revalidations:>7}{s.misses:>8}"
+                f"{s.hit_rate:>10.0%}{s.bytes_served / 1024:>16.1f}"
+            )
+        lines.append(
+            f"{len(self)} entries, {self._bytes / 1024:.1f} of {self.max_bytes / 1024:.0f} KB, "
+            f"{self.evictions} evicted"
+        )
+        return lines
+
+
+ASSET_CACHE_KEY = pytest.StashKey[AssetCache]()
+
+
+@pytest.fixture(scope="session")
+def asset_cache(pytestconfig):
+    """Static responses shared by every test's context; None unless --asset-cache."""
+    if not pytestconfig.getoption("asset_cache"):
+        yield None
+        return
+    cache = AssetCache(max_bytes=pytestconfig.getoption("asset_cache_mb") * 1024 * 1024)
+    pytestconfig.stash[ASSET_CACHE_KEY] = cache  # for the terminal summary
+    yield cache
+    total = cache.total
+    logger.info(
+        "Asset cache: %d requests, %.0f%% from memory (%d hits, %d revalidated), %.1f KB not downloaded",
+        total.requests, total.hit_rate * 100, total.hits, total.revalidations, total.bytes_served / 1024,
+    )
+
+
+@pytest.fixture(autouse=True)
+def asset_cache_routing(request, asset_cache):
+    """Route the test's context through the shared asset cache."""
+    if asset_cache is None or "page" not in request.fixturenames:
+        yield
+        return
+    # perf budgets measure transfer sizes and timings, which a cache hit would fake;
+    # with --har the archive already answers every request
+    if (
+        request.node.get_closest_marker("perf_budget")
+        or request.config.getoption("perf_metrics")
+        or request.config.getoption("har") != "off"
+    ):
+        yield
+        return
+
+    context = request.getfixturevalue("page").context
+    context.route("**/*", asset_cache.handle)
+    perf.mark_routed(context)
+    yield
+    perf.unmark_routed(context)
+    try:
+        context.unroute("**/*", asset_cache.handle)
+    except PlaywrightError:
+        pass  # context already closed
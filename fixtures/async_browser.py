@@ -0,0 +1,61 @@
+"""
+asyncio fixtures for the pages_async page objects.
+
+Everything shares one session-wide event loop, so async tests must be marked
+with `async_test` (pytest.mark.asyncio(loop_scope="session")):
+
+    @async_test
+    async def test_many_shoppers(async_page_factory, shop_server):
+        pages = [await async_page_factory() for _ in range(10)]
+        await asyncio.gather(*(ShoppingPage(p).goto(shop_server.url) for p in pages))
+"""
+import pytest
+import pytest_asyncio
+from playwright.async_api import async_playwright
+
+async_test = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_playwright_instance():
+    async with async_playwright() as p:
+        yield p
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_browser(async_playwright_instance, browser_name, browser_type_launch_args):
+    # same --browser / --headed handling as the sync browser fixture from pytest-playwright
+    browser = await getattr(async_playwright_instance, browser_name).launch(**browser_type_launch_args)
+    yield browser
+    await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_page_factory(async_browser, browser_context_args):
+    """
+    Opens pages on demand: `await async_page_factory()` gives a page in its own
+    context (isolated cookies/storage), `shared_context=True` reuses one context per test.
+    Contexts get the same browser_context_args (viewport, base_url, ...) as the sync `page`.
+    """
+    contexts = []
+    shared = None
+
+    async def new_page(shared_context: bool = False):
+        nonlocal shared
+        if shared_context:
+            if shared is None:
+                shared = await async_browser.new_context(**browser_context_args)
+                contexts.append(shared)
+            return await shared.new_page()
+        context = await async_browser.new_context(**browser_context_args)
+        contexts.append(context)
+        return await context.new_page()
+
+    yield new_page
+    for context in contexts:
+        await context.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_page(async_page_factory):
+    return await async_page_factory()
@@ -1,20 +1,164 @@
+from collections import deque
+from pathlib import Path
+
 import pytest
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Error as PlaywrightError
+
+from utils.artifacts import TRACE_DIR, VIDEO_DIR, safe_node_name
+
+# `browser` and `browser_context_args` come from pytest-playwright (--browser, --headed, ...);
+# this module only replaces its `page` fixture with a pooled one.
+
+# Clears web storage for whatever origin the page is on; other origins are caught by
+# the storage_state() check in ContextPool._reset.
+_CLEAR_STORAGE_JS = """
+() => {
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+}
+"""
+
+
+class ContextPool:
+    """
+    Session-wide pool of pre-created browser contexts, each with one warm page.
+    Contexts are reset between tests instead of being recreated; a context that
+    cannot be fully reset is closed and replaced.
+    """
+
+    def __init__(self, browser: Browser, size: int, context_args: dict | None = None, tracing: bool = False):
+        self._browser = browser
+        self._size = size
+        self._tracing = tracing
+        # one video per pooled context would span many tests, so never record here
+        self._context_args = {k: v for k, v in (context_args or {}).items() if k != "record_video_dir"}
+        self._idle: deque[tuple[BrowserContext, Page]] = deque(self._create() for _ in range(size))
+
+    def _create(self) -> tuple[BrowserContext, Page]:
+        context = self._browser.new_context(**self._context_args)
+        if self._tracing:
+            # tracing stays on for the context's lifetime; tests record into chunks
+            _start_tracing(context)
+        page = context.new_page()
+        return context, page
+
+    def acquire(self) -> tuple[BrowserContext, Page]:
+        # a test that needs more contexts than the pool holds gets a temporary one
+        return self._idle.popleft() if self._idle else self._create()
+
+    def release(self, context: BrowserContext, page: Page) -> None:
+        try:
+            clean = self._reset(context, page)
+        except PlaywrightError:
+            clean = False
+
+        if clean and len(self._idle) < self._size:
+            self._idle.append((context, page))
+            return
+
+        context.close()
+        if len(self._idle) < self._size:
+            self._idle.append(self._create())
+
+    def _reset(self, context: BrowserContext, page: Page) -> bool:
+        """Clear cookies, storage, permissions and routes; False if the context must be replaced."""
+        if page.is_closed():
+            return False
+        for other in context.pages:
+            if other is not page:
+                other.close()
+
+        page.unroute_all(behavior="ignoreErrors")
+        context.unroute_all(behavior="ignoreErrors")
+        page.evaluate(_CLEAR_STORAGE_JS)
+        page.goto("about:blank")
+        context.clear_cookies()
+        context.clear_permissions()
+
+        # localStorage of origins the page navigated away from can't be cleared from about:blank
+        return not context.storage_state()["origins"]
+
+    def close(self) -> None:
+        while self._idle:
+            context, _ = self._idle.popleft()
+            context.close()
+
+
+# --- Failure artifacts ---
+# --artifact-mode:
+#   trace (default): tracing with screenshots + DOM snapshots is buffered by the browser for
+#                    every test and only written to artifacts/traces/ when the test fails;
+#                    video is opt-in with @pytest.mark.video
+#   video:           the old setup - every test gets a fresh context recording video
+#   off:             no traces, no video
+def _start_tracing(context: BrowserContext) -> None:
+    context.tracing.start(screenshots=True, snapshots=True)
+
+
+def _test_failed(node) -> bool:
+    # rep_<phase> attributes are set by pytest_runtest_makereport in conftest.py
+    return any(getattr(getattr(node, f"rep_{when}", None), "failed", False) for when in ("setup", "call"))
+
+
+def trace_path(nodeid: str) -> Path:
+    return TRACE_DIR / f"{safe_node_name(nodeid)}.zip"
+
+
+def video_path(nodeid: str) -> Path:
+    return VIDEO_DIR / f"{safe_node_name(nodeid)}.webm"
 
-@pytest.fixture(scope="session")
-def playwright_instance():
-    with sync_playwright() as p:
-        yield p
 
 @pytest.fixture(scope="session")
-def browser(playwright_instance):
-    browser = playwright_instance.chromium.launch(headless=True)
-    yield browser
-    browser.close()
+def context_pool(pytestconfig, browser, browser_context_args):
+    """Warm contexts shared across the session; None when --context-pool-size=0."""
+    size = pytestconfig.getoption("context_pool_size")
+    if size <= 0:
+        yield None
+        return
+    pool = ContextPool(browser, size, browser_context_args, tracing=pytestconfig.getoption("artifact_mode") == "trace")
+    yield pool
+    pool.close()
+
 
 @pytest.fixture(scope="function")
-def page(browser):
-    context = browser.new_context(record_video_dir="artifacts/videos/")
-    page = context.new_page()
+def page(request, pytestconfig, browser, browser_context_args, context_pool):
+    mode = pytestconfig.getoption("artifact_mode")
+    record_video = mode == "video" or (mode == "trace" and request.node.get_closest_marker("video"))
+    nodeid = request.node.nodeid
+    trace_path(nodeid).unlink(missing_ok=True)
+    video_path(nodeid).unlink(missing_ok=True)
+
+    # tests marked fresh_context or video (or any test when pooling is off) get a brand new context
+    fresh = context_pool is None or record_video or request.node.get_closest_marker("fresh_context")
+    if fresh:
+        context_args = dict(browser_context_args)
+        if record_video:
+            context_args["record_video_dir"] = str(VIDEO_DIR)
+        context = browser.new_context(**context_args)
+        if mode == "trace":
+            _start_tracing(context)
+        page = context.new_page()
+    else:
+        context, page = context_pool.acquire()
+
+    if mode == "trace":
+        context.tracing.start_chunk(title=nodeid)
     yield page
+
+    failed = _test_failed(request.node)
+    if mode == "trace":
+        try:
+            # without a path the chunk is dropped, so passing tests never touch the disk
+            context.tracing.stop_chunk(path=trace_path(nodeid) if failed else None)
+        except PlaywrightError:
+            pass
+
+    if not fresh:
+        context_pool.release(context, page)
+        return
     context.close()
+    if record_video and page.video:
+        # the video is only complete once the context is closed
+        if failed:
+            page.video.save_as(video_path(nodeid))
+        page.video.delete()
@@ -0,0 +1,97 @@
+## Seeded generator for synthetic shop catalogs served by fixtures/shop_server.py
+
+import random
+from dataclasses import dataclass, field, asdict
+from typing import List
+
+# sizes offered by the live demo, in the order its filter shows them
+SIZES = ["XS", "S", "M", "ML", "L", "XL", "XXL"]
+
+_STYLES = ["Black", "White", "Grey", "Navy", "Red", "Green", "Orange", "Purple", "Striped", "Print"]
+_GARMENTS = ["T-Shirt", "Hoodie", "Tank Top", "Sweatshirt", "Polo", "Long Sleeve", "Jersey", "Crop Top"]
+_THEMES = ["Cat", "Dog", "Wolf", "Space", "Ocean", "Retro", "Pixel", "Skull", "Tropical", "Mountain"]
+
+
+@dataclass
+class CatalogProduct:
+    id: int
+    sku: str
+    title: str
+    style: str
+    price: float
+    installments: int
+    is_free_shipping: bool
+    available_sizes: List[str]
+    color: str  # used to draw the product images
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class Catalog:
+    products: List[CatalogProduct]
+    sizes: List[str] = field(default_factory=lambda: list(SIZES))
+    seed: int = 0
+
+    def to_dict(self) -> dict:
+        return {"seed": self.seed, "sizes": self.sizes, "products": [p.to_dict() for p in self.products]}
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+
+def generate_catalog(
+    size: int = 16,
+    seed: int = 0,
+    size_weights: dict[str, float] | None = None,
+    sizes_per_product: tuple[int, int] = (1, 3),
+    price_range: tuple[float, float] = (10.0, 100.0),
+    free_shipping_ratio: float = 0.5,
+) -> Catalog:
+    """
+    Build a reproducible catalog of `size` products.
+    - size_weights: relative frequency of each size (defaults to uniform over SIZES)
+    - sizes_per_product: inclusive range of how many sizes each product is offered in
+    - price_range: inclusive min/max price, rounded to cents
+    """
+    rng = random.Random(seed)
+    weights = size_weights or {s: 1.0 for s in SIZES}
+    sizes = [s for s in SIZES if weights.get(s, 0) > 0] + [s for s in weights if s not in SIZES and weights[s] > 0]
+    if not sizes:
+        raise ValueError("size_weights must give at least one size a positive weight")
+
+    low, high = sizes_per_product
+    low, high = max(1, low), min(high, len(sizes))
+    if low > high:
+        raise ValueError(f"sizes_per_product {sizes_per_product} does not fit {len(sizes)} available sizes")
+
+    products = []
+    for product_id in range(1, size + 1):
+        # weighted sampling without replacement, then shown in filter order
+        wanted = rng.randint(low, high)
+        pool = list(sizes)
+        chosen = []
+        for _ in range(wanted):
+            pick = rng.choices(pool, weights=[weights[s] for s in pool])[0]
+            pool.remove(pick)
+            chosen.append(pick)
+        chosen.sort(key=sizes.index)
+
+        # page objects find cards and cart rows with has-text (a substring match),
+        # so no title may contain another one: the "(id)" suffix guarantees that
+        title = f"{rng.choice(_THEMES)} {rng.choice(_GARMENTS)} ({product_id})"
+
+        products.append(CatalogProduct(
+            id=product_id,
+            sku=f"{rng.randrange(10**13, 10**14)}",
+            title=title,
+            style=rng.choice(_STYLES),
+            price=round(rng.uniform(*price_range), 2),
+            installments=rng.choice([0, 3, 5, 9, 12]),
+            is_free_shipping=rng.random() < free_shipping_ratio,
+            available_sizes=chosen,
+            color=f"#{rng.randrange(0x1000000):06x}",
+        ))
+
+    return Catalog(products=products, sizes=sizes, seed=seed)
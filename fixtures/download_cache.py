@@ -0,0 +1,22 @@
+import logging
+
+import pytest
+
+from utils.download_cache import DownloadCache
+
+logger = logging.getLogger("pytest_playwright")
+
+
+@pytest.fixture(scope="session")
+def download_cache(pytestconfig):
+    """Session-wide cache for repo archives (see utils/download_cache.py)."""
+    cache = DownloadCache(
+        max_bytes=pytestconfig.getoption("download_cache_mb") * 1024 * 1024,
+        refresh=pytestconfig.getoption("refresh_downloads"),
+    )
+    yield cache
+    if cache.hits or cache.misses:
+        logger.info(
+            "Download cache: %d revalidated hits, %d downloads (%.1f KB transferred)",
+            cache.hits, cache.misses, cache.bytes_downloaded / 1024,
+        )
@@ -0,0 +1,112 @@
+## Local HTTP file server for download / archive tests: validators, byte ranges and transfer counters
+
+import hashlib
+import re
+import threading
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+class FileServer:
+    """
+    Serves `files[path]` on 127.0.0.1. Responses carry an ETag (a matching If-None-Match
+    gets a 304) and a Last-Modified; single byte ranges are answered with a 206 except for
+    paths in `no_range`. `status[path]` makes a path fail with that status instead.
+    `bodies_sent` / `bytes_sent` count what actually went over the wire.
+    Files can be added or replaced while the server runs.
+    """
+
+    LAST_MODIFIED = "Mon, 06 Oct 2025 10:00:00 GMT"
+
+    def __init__(self, files: dict[str, bytes] | None = None, no_range=(), etag: bool = True, host: str = "127.0.0.1"):
+        self.files = dict(files or {})
+        self.no_range = set(no_range)
+        self.status: dict[str, int] = {}
+        self.etag = etag
+        self.bodies_sent = 0
+        self.bytes_sent = 0
+        self._host = host
+        self._lock = threading.Lock()
+        self._httpd: ThreadingHTTPServer | None = None
+
+    @property
+    def url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("FileServer is not running")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, body: bytes) -> None:
+        with self._lock:
+            self.bodies_sent += 1
+            self.bytes_sent += len(body)
+
+    def start(self) -> "FileServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path in server.status:
+                    self.send_error(server.status[self.path])
+                    return
+                body = server.files.get(self.path)
+                if body is None:
+                    self.send_error(HTTPStatus.NOT_FOUND)
+                    return
+                etag = f'"{hashlib.sha1(body).hexdigest()}"' if server.etag else None
+                if etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                match = _RANGE.fullmatch(self.headers.get("Range", ""))
+                if match and self.path not in server.no_range:
+                    first, last = match.groups()
+                    if not first:  # suffix range: the last N bytes
+                        start, end = max(0, len(body) - int(last)), len(body) - 1
+                    else:
+                        start, end = int(first), min(int(last or len(body) - 1), len(body) - 1)
+                    self.send_response(HTTPStatus.PARTIAL_CONTENT)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+                    body = body[start:end + 1]
+                else:
+                    self.send_response(HTTPStatus.OK)
+                if etag:
+                    self.send_header("ETag", etag)
+                self.send_header("Last-Modified", server.LAST_MODIFIED)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                server._count(body)
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # keep the test output clean
+
+        self._httpd = ThreadingHTTPServer((self._host, 0), Handler)
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever, name="file-server", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "FileServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+@pytest.fixture
+def file_server():
+    """An empty FileServer for the test; put bodies in file_server.files and fetch file_server.url + path."""
+    with FileServer() as server:
+        yield server
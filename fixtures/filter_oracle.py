@@ -0,0 +1,29 @@
+import pytest
+
+from pages.sections.product_list_section import ProductSection
+from utils.filter_oracle import FilterOracle
+
+LIVE_SHOP_URL = "https://automated-test-evaluation.web.app/"
+
+
+@pytest.fixture(scope="session")
+def shop_filter_oracle(shop_catalog):
+    """Expected size-filter results for the local shop, straight from its generated catalog."""
+    return FilterOracle.from_catalog(shop_catalog)
+
+
+@pytest.fixture(scope="session")
+def live_filter_oracle(browser):
+    """
+    Sizes per product for the live demo, learned once per session from single-size
+    scans on a page of its own (the demo has no catalog we can read).
+    """
+    context = browser.new_context()
+    page = context.new_page()
+    try:
+        page.goto(LIVE_SHOP_URL)
+        section = ProductSection(page)
+        section.product_cards.first.wait_for(state="visible")
+        yield FilterOracle.from_ui(section)
+    finally:
+        context.close()
@@ -0,0 +1,213 @@
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError, Route, Request
+
+from utils import perf
+from utils.http import DROPPED_RESPONSE_HEADERS
+
+
+@dataclass
+class HarResponse:
+    status: int
+    status_text: str
+    headers: dict[str, str]
+    body: bytes
+    mime_type: str = ""
+
+
+@dataclass
+class HarArchive:
+    """
+    In-memory HAR 1.2 store keyed by (method, url).
+    Replay never touches disk after load; bodies are kept decoded as bytes.
+    """
+    entries: dict[tuple[str, str], HarResponse] = field(default_factory=dict)
+    raw_entries: list[dict] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: Path) -> "HarArchive":
+        with Path(path).open("r", encoding="utf-8") as f:
+            har = json.load(f)
+
+        archive = cls()
+        for entry in har["log"]["entries"]:
+            request, response = entry["request"], entry["response"]
+            content = response.get("content", {})
+            text = content.get("text", "")
+            body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode("utf-8")
+            archive._store(
+                request["method"],
+                request["url"],
+                HarResponse(
+                    status=response["status"],
+                    status_text=response.get("statusText", ""),
+                    headers={h["name"]: h["value"] for h in response.get("headers", [])},
+                    body=body,
+                    mime_type=content.get("mimeType", ""),
+                ),
+                entry,
+            )
+        return archive
+
+    def add(self, method: str, url: str, response: HarResponse, elapsed_ms: float = 0) -> None:
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in DROPPED_RESPONSE_HEADERS
+        }
+        response = HarResponse(response.status, response.status_text, headers, response.body, response.mime_type)
+        entry = {
+            "startedDateTime": datetime.now(timezone.utc).isoformat(),
+            "time": elapsed_ms,
+            "request": {
+                "method": method,
+                "url": url,
+                "httpVersion": "HTTP/1.1",
+                "headers": [],
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": -1,
+            },
+            "response": {
+                "status": response.status,
+                "statusText": response.status_text,
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": name, "value": value} for name, value in headers.items()],
+                "cookies": [],
+                "content": {
+                    "size": len(response.body),
+                    "mimeType": response.mime_type,
+                    "text": base64.b64encode(response.body).decode("ascii"),
+                    "encoding": "base64",
+                },
+                "redirectURL": headers.get("location", ""),
+                "headersSize": -1,
+                "bodySize": len(response.body),
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": elapsed_ms, "receive": 0},
+        }
+        self._store(method, url, response, entry)
+
+    def _store(self, method: str, url: str, response: HarResponse, entry: dict) -> None:
+        # first recording wins so replay matches what the page saw on first load
+        key = (method.upper(), url)
+        if key not in self.entries:
+            self.entries[key] = response
+            self.raw_entries.append(entry)
+
+    def match(self, method: str, url: str) -> HarResponse | None:
+        return self.entries.get((method.upper(), url))
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        har = {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "nuclera_exercise", "version": "1.0"},
+                "entries": self.raw_entries,
+            }
+        }
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(har, f)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+@pytest.fixture(scope="session")
+def har_archive(pytestconfig):
+    """Session HAR store: filled while recording, loaded once for replay, None when off."""
+    mode = pytestconfig.getoption("har")
+    path = Path(pytestconfig.getoption("har_path"))
+
+    if mode == "off":
+        yield None
+        return
+
+    if mode == "replay":
+        if not path.exists():
+            pytest.exit(f"--har=replay needs a recorded archive at {path}; run once with --har=record", returncode=4)
+        yield HarArchive.load(path)
+        return
+
+    archive = HarArchive()
+    yield archive
+    archive.save(path)
+
+
+@pytest.fixture(autouse=True)
+def har_routing(request, har_archive):
+    """Route every request of the test's page through the HAR archive (record or replay)."""
+    if har_archive is None or "page" not in request.fixturenames:
+        yield
+        return
+
+    page = request.getfixturevalue("page")
+    mode = request.config.getoption("har")
+    strict = request.config.getoption("har_strict")
+    unmatched: list[str] = []
+    # checked after the test body by pytest_runtest_call in conftest, see fail_on_unmatched
+    request.node.har_unmatched = unmatched
+
+    def record(route: Route, req: Request):
+        started = datetime.now()
+        try:
+            # don't follow redirects: the 3xx is recorded and the browser re-requests the target
+            response = route.fetch(max_redirects=0)
+            body = response.body()
+        except PlaywrightError:
+            # a transient network error: let the browser try on its own instead of failing the page
+            route.fallback()
+            return
+        elapsed_ms = (datetime.now() - started).total_seconds() * 1000
+        har_archive.add(
+            req.method,
+            req.url,
+            HarResponse(
+                status=response.status,
+                status_text=response.status_text,
+                headers=response.headers,
+                body=body,
+                mime_type=response.headers.get("content-type", ""),
+            ),
+            elapsed_ms,
+        )
+        route.fulfill(response=response, body=body)
+
+    def replay(route: Route, req: Request):
+        recorded = har_archive.match(req.method, req.url)
+        if recorded is not None:
+            route.fulfill(status=recorded.status, headers=recorded.headers, body=recorded.body)
+        elif strict:
+            unmatched.append(f"{req.method} {req.url}")
+            route.abort("blockedbyclient")
+        else:
+            route.continue_()
+
+    handler = record if mode == "record" else replay
+    page.route("**/*", handler)
+    perf.mark_routed(page)
+    yield
+    perf.unmark_routed(page)
+    try:
+        page.unroute("**/*", handler)
+    except PlaywrightError:
+        pass  # page already closed
+    # only requests made after the test body (by other fixtures' teardown) are left here
+    fail_on_unmatched(request.node)
+
+
+def fail_on_unmatched(node) -> None:
+    """--har-strict: fail with the requests that weren't in the archive (each reported once)."""
+    unmatched = getattr(node, "har_unmatched", None)
+    if unmatched:
+        missing = list(unmatched)
+        unmatched.clear()
+        pytest.fail(f"{len(missing)} request(s) not found in HAR archive (--har-strict):\n" + "\n".join(missing))
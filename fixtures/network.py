@@ -1,17 +1,145 @@
-import pytest
+import heapq
 import json
+from collections import Counter
+from pathlib import Path
 
+import pytest
+from playwright.sync_api import Page, Request, Error as PlaywrightError
 
+from utils.artifacts import NETWORK_LOGGER_DIR, safe_node_name
 
-@pytest.fixture
-def network_logger(page):
-    requests = []
 
-    def log_request(request):
-        requests.append({"url": request.url, "method": request.method})
+def _span(timing: dict, start: str, end: str) -> float | None:
+    # Playwright reports -1 for phases that didn't happen (cached, reused connection...)
+    begin, finish = timing.get(start, -1), timing.get(end, -1)
+    if begin < 0 or finish < 0:
+        return None
+    return round(finish - begin, 2)
+
+
+def timing_breakdown(timing: dict) -> dict:
+    """request.timing (ms offsets from startTime) -> duration of each phase in ms."""
+    return {
+        "dns": _span(timing, "domainLookupStart", "domainLookupEnd"),
+        "connect": _span(timing, "connectStart", "connectEnd"),
+        "tls": _span(timing, "secureConnectionStart", "connectEnd"),
+        "ttfb": _span(timing, "requestStart", "responseStart"),
+        "download": _span(timing, "responseStart", "responseEnd"),
+        "total": round(timing["responseEnd"], 2) if timing.get("responseEnd", -1) >= 0 else None,
+    }
+
+
+class NetworkRecorder:
+    """
+    Streams one JSON line per finished/failed request to `path` as the test runs.
+    Only running totals and the `keep_slowest` slowest requests stay in memory.
+    """
+
+    def __init__(self, path: Path, keep_slowest: int = 10):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", encoding="utf-8", buffering=1)  # line buffered
+        self._keep_slowest = keep_slowest
+        self._slowest: list[tuple[float, int, dict]] = []  # min-heap on duration
+        self.count = 0
+        self.failed = 0
+        self.bytes_by_type: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, request: Request, failure: str | None = None) -> dict:
+        entry = {
+            "url": request.url,
+            "method": request.method,
+            "resource_type": request.resource_type,
+            "status": None,
+            "failure": failure,
+            "request_body_bytes": len(request.post_data_buffer or b""),
+            "response_body_bytes": 0,
+            "request_headers_bytes": 0,
+            "response_headers_bytes": 0,
+            "timing": timing_breakdown(request.timing),
+        }
+        if failure is None:
+            try:
+                response = request.response()
+                sizes = request.sizes()
+            except PlaywrightError:
+                # page/context went away before the sizes could be fetched
+                response, sizes = None, None
+            if response is not None:
+                entry["status"] = response.status
+            if sizes is not None:
+                entry.update(
+                    request_body_bytes=sizes["requestBodySize"],
+                    request_headers_bytes=sizes["requestHeadersSize"],
+                    response_body_bytes=sizes["responseBodySize"],
+                    response_headers_bytes=sizes["responseHeadersSize"],
+                )
+        self.add(entry)
+        return entry
 
-    page.on("request", log_request)
-    yield requests
+    def add(self, entry: dict) -> None:
+        self._file.write(json.dumps(entry) + "\n")
+        self.count += 1
+        self.failed += entry["failure"] is not None
+        self.bytes_by_type[entry["resource_type"]] += (
+            entry["request_body_bytes"] + entry["request_headers_bytes"]
+            + entry["response_body_bytes"] + entry["response_headers_bytes"]
+        )
+        duration = entry["timing"]["total"]
+        if duration is not None:
+            item = (duration, self.count, entry)
+            if len(self._slowest) < self._keep_slowest:
+                heapq.heappush(self._slowest, item)
+            else:
+                heapq.heappushpop(self._slowest, item)
 
-    with open("artifacts/network_logs/network_logs.json", "w") as f:
-        json.dump(requests, f, indent=2)
+    def summary(self) -> dict:
+        slowest = sorted(self._slowest, key=lambda item: item[0], reverse=True)
+        return {
+            "requests": self.count,
+            "failed": self.failed,
+            "total_bytes": sum(self.bytes_by_type.values()),
+            "bytes_by_resource_type": dict(self.bytes_by_type.most_common()),
+            "slowest": [
+                {"url": e["url"], "status": e["status"], "total_ms": ms, "ttfb_ms": e["timing"]["ttfb"]}
+                for ms, _, e in slowest
+            ],
+            "log": str(self.path),
+        }
+
+    def attach(self, page: Page) -> None:
+        page.on("requestfinished", self._on_finished)
+        page.on("requestfailed", self._on_failed)
+
+    def detach(self, page: Page) -> None:
+        page.remove_listener("requestfinished", self._on_finished)
+        page.remove_listener("requestfailed", self._on_failed)
+
+    def _on_finished(self, request: Request) -> None:
+        self.record(request)
+
+    def _on_failed(self, request: Request) -> None:
+        self.record(request, failure=request.failure or "failed")
+
+    @property
+    def summary_path(self) -> Path:
+        return self.path.with_suffix(".summary.json")
+
+    def close(self) -> None:
+        """Close the log and write the one summary, after teardown requests have been recorded."""
+        self._file.close()
+        with self.summary_path.open("w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+@pytest.fixture
+def network_logger(request, page):
+    recorder = NetworkRecorder(NETWORK_LOGGER_DIR / f"{safe_node_name(request.node.nodeid)}.jsonl")
+    recorder.attach(page)
+    yield recorder
+    # pooled pages outlive the test, so don't leave the listeners behind
+    recorder.detach(page)
+    recorder.close()
@@ -0,0 +1,167 @@
+// DOM-compatible stand-in for https://automated-test-evaluation.web.app/
+// Class names mirror the styled-components output of the live app so the page objects
+// in pages/ work unchanged. The catalog is injected by fixtures/shop_server.py.
+(function () {
+  const catalog = JSON.parse(document.getElementById("catalog").textContent);
+  const products = catalog.products;
+  const byId = new Map(products.map(p => [p.id, p]));
+
+  const state = {
+    sizes: new Set(),
+    cart: [],  // [{id, quantity}] in the order products were added
+    open: false,
+  };
+
+  const escape = text => String(text).replace(/[&<>"']/g,
+    c => ({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c]));
+  const money = value => value.toFixed(2);
+
+  // --- Size filters ---
+  const filters = document.getElementById("size-filters");
+  filters.innerHTML = catalog.sizes.map(size => `
+    <div class="sc-bj2vay-2">
+      <label>
+        <input data-testid="checkbox" type="checkbox" value="${escape(size)}" />
+        <span class="checkmark">${escape(size)}</span>
+      </label>
+    </div>`).join("");
+  filters.addEventListener("change", event => {
+    const input = event.target;
+    if (input.checked) state.sizes.add(input.value);
+    else state.sizes.delete(input.value);
+    renderProducts();
+  });
+
+  const visibleProducts = () => state.sizes.size === 0
+    ? products
+    : products.filter(p => p.available_sizes.some(size => state.sizes.has(size)));
+
+  // --- Product grid ---
+  const grid = document.getElementById("product-grid");
+  const countLabel = document.getElementById("product-count");
+
+  const productCard = p => {
+    const [whole, fraction] = money(p.price).split(".");
+    const installment = p.installments
+      ? `<p class="sc-124al1g-7"><span>or ${p.installments} x</span><b> $${money(p.price / p.installments)}</b></p>`
+      : "";
+    const shipping = p.is_free_shipping ? `<div class="sc-124al1g-3">Free shipping</div>` : "";
+    return `
+      <div class="sc-124al1g-2" tabindex="${p.id}">
+        ${shipping}
+        <div class="sc-124al1g-1 product-image-${p.id}" alt="${escape(p.title)}"></div>
+        <p class="sc-124al1g-4">${escape(p.title)}</p>
+        <div class="sc-124al1g-5">
+          <p class="sc-124al1g-6"><small>$</small><b>${whole}</b><span>.${fraction}</span></p>
+          ${installment}
+        </div>
+        <button class="sc-124al1g-0" data-product-id="${p.id}">Add to cart</button>
+      </div>`;
+  };
+
+  function renderProducts() {
+    const list = visibleProducts();
+    countLabel.textContent = `${list.length} Product(s) found`;
+    grid.innerHTML = list.map(productCard).join("");
+  }
+
+  grid.addEventListener("click", event => {
+    const button = event.target.closest("button[data-product-id]");
+    if (!button) return;
+    const id = Number(button.dataset.productId);
+    const line = state.cart.find(item => item.id === id);
+    if (line) line.quantity += 1;
+    else state.cart.push({id, quantity: 1});
+    renderCart();
+  });
+
+  // --- Cart ---
+  const cart = document.getElementById("cart");
+  const toggle = document.getElementById("cart-toggle");
+  const content = document.getElementById("cart-content");
+
+  const totals = () => state.cart.reduce((acc, line) => ({
+    quantity: acc.quantity + line.quantity,
+    price: acc.price + byId.get(line.id).price * line.quantity,
+  }), {quantity: 0, price: 0});
+
+  const cartItem = line => {
+    const p = byId.get(line.id);
+    return `
+      <div class="sc-11uohgb-0 hDmOrM" data-product-id="${p.id}">
+        <button class="sc-11uohgb-5" title="remove product from cart" data-action="remove"></button>
+        <div class="sc-11uohgb-1 product-image-${p.id}"></div>
+        <div class="sc-11uohgb-6">
+          <p class="sc-11uohgb-2 elbkhN">${escape(p.title)}</p>
+          <p class="sc-11uohgb-3 gKtloF">${escape(p.available_sizes[0])} | ${escape(p.style)} <br />Quantity: ${line.quantity}</p>
+        </div>
+        <div class="sc-11uohgb-4 bnZqjD">
+          <p>$  ${money(p.price)}</p>
+          <div>
+            <button class="sc-11uohgb-7" data-action="decrease" ${line.quantity === 1 ? "disabled" : ""}>-</button>
+            <button class="sc-11uohgb-7" data-action="increase">+</button>
+          </div>
+        </div>
+      </div>`;
+  };
+
+  function renderCart() {
+    const total = totals();
+    cart.className = state.open ? "sc-1h98xa9-1 kQlqIC" : "sc-1h98xa9-1";
+
+    // only one "cart quantity" element may exist at a time, as on the live app
+    toggle.hidden = state.open;
+    toggle.innerHTML = state.open ? "" : `<div title="Products in cart quantity">${total.quantity}</div>`;
+
+    content.hidden = !state.open;
+    if (!state.open) {
+      content.innerHTML = "";
+      return;
+    }
+    const empty = `<p class="sc-7th5t8-1">Add some products in the cart <br />:)</p>`;
+    content.innerHTML = `
+      <button class="sc-1h98xa9-0" data-action="close">X</button>
+      <div class="sc-1h98xa9-2">
+        <div class="sc-1h98xa9-3">${total.quantity}</div>
+        <span class="sc-1h98xa9-6">Cart</span>
+      </div>
+      <div class="sc-7th5t8-0">${state.cart.length ? state.cart.map(cartItem).join("") : empty}</div>
+      <div class="sc-1h98xa9-7">
+        <p>SUBTOTAL</p>
+        <div class="sc-1h98xa9-8 bciIxg">
+          <p class="sc-1h98xa9-9 jzywDV">$ ${money(total.price)}</p>
+        </div>
+        <button class="sc-1h98xa9-10" data-action="checkout">Checkout</button>
+      </div>`;
+  }
+
+  toggle.addEventListener("click", () => {
+    state.open = true;
+    renderCart();
+  });
+
+  content.addEventListener("click", event => {
+    const button = event.target.closest("button[data-action]");
+    if (!button || button.disabled) return;
+    const action = button.dataset.action;
+
+    if (action === "close") {
+      state.open = false;
+    } else if (action === "checkout") {
+      const total = totals();
+      if (total.quantity) alert(`Checkout - Subtotal: $ ${money(total.price)}`);
+      else alert("Add some product in the cart!");
+      return;
+    } else {
+      const id = Number(button.closest("[data-product-id]").dataset.productId);
+      const line = state.cart.find(item => item.id === id);
+      if (action === "increase") line.quantity += 1;
+      if (action === "decrease" && line.quantity > 1) line.quantity -= 1;
+      if (action === "remove") state.cart = state.cart.filter(item => item.id !== id);
+    }
+    renderCart();
+  });
+
+  renderProducts();
+  renderCart();
+})();
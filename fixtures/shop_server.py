@@ -0,0 +1,171 @@
+## Local stand-in for the shop app, serving a generated catalog with the live DOM structure
+
+import hashlib
+import json
+import re
+import threading
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+from fixtures.catalog import Catalog, generate_catalog
+
+APP_DIR = Path(__file__).resolve().parent / "shop_app"
+
+_STATIC_TYPES = {".js": "application/javascript", ".css": "text/css", ".svg": "image/svg+xml"}
+_IMAGE_PATH = re.compile(r"^/images/(\d+)-([12])\.svg$")
+
+
+def _product_image_rules(catalog: Catalog) -> str:
+    # one resting and one :hover rule per product, like the styled-components output
+    rules = []
+    for p in catalog.products:
+        rules.append(f".product-image-{p.id}{{background-image:url(/images/{p.id}-1.svg)}}")
+        rules.append(f".sc-124al1g-2:hover .product-image-{p.id}{{background-image:url(/images/{p.id}-2.svg)}}")
+    return "\n".join(rules)
+
+
+def _product_image(color: str, variant: str) -> bytes:
+    shape = '<circle cx="50" cy="60" r="30" fill="#fff" opacity="0.6"/>' if variant == "2" else ""
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="135" viewBox="0 0 100 135">'
+        f'<rect width="100" height="135" fill="{color}"/>{shape}</svg>'
+    ).encode("utf-8")
+
+
+class ShopServer:
+    """
+    Serves a DOM-compatible copy of the shop app for `catalog` on 127.0.0.1.
+    Usable as a context manager outside pytest (load generation, benchmarks).
+    """
+
+    def __init__(self, catalog: Catalog, host: str = "127.0.0.1", port: int = 0):
+        self.catalog = catalog
+        self._host = host
+        self._port = port
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+        catalog_json = json.dumps(catalog.to_dict())
+        index = (APP_DIR / "index.html").read_text(encoding="utf-8")
+        index = index.replace("__PRODUCT_IMAGE_RULES__", _product_image_rules(catalog))
+        # "</" would end the inline <script> early
+        index = index.replace("__CATALOG__", catalog_json.replace("</", "<\\/"))
+        self._routes: dict[str, tuple[bytes, str, bool]] = {
+            "/": (index.encode("utf-8"), "text/html; charset=utf-8", False),
+            "/api/products.json": (catalog_json.encode("utf-8"), "application/json", False),
+            "/linkedin": (
+                b"<!DOCTYPE html><html><head><title>Jeremy | LinkedIn (local stand-in)</title></head>"
+                b"<body><h1>Jeremy</h1></body></html>",
+                "text/html; charset=utf-8",
+                False,
+            ),
+        }
+        for path in APP_DIR.iterdir():
+            if path.suffix in _STATIC_TYPES:
+                self._routes[f"/static/{path.name}"] = (path.read_bytes(), _STATIC_TYPES[path.suffix], True)
+
+    @property
+    def url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("ShopServer is not running")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def resolve(self, path: str) -> tuple[bytes, str, bool] | None:
+        """Return (body, content type, cacheable) for a request path, or None for a 404."""
+        path = path.split("?", 1)[0]
+        if path in self._routes:
+            return self._routes[path]
+        match = _IMAGE_PATH.match(path)
+        if match:
+            product_id, variant = int(match.group(1)), match.group(2)
+            if 1 <= product_id <= len(self.catalog.products):
+                color = self.catalog.products[product_id - 1].color
+                return _product_image(color, variant), "image/svg+xml", True
+        return None
+
+    def start(self) -> "ShopServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                resolved = server.resolve(self.path)
+                if resolved is None:
+                    self.send_error(HTTPStatus.NOT_FOUND)
+                    return
+                body, content_type, cacheable = resolved
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if cacheable and self.headers.get("If-None-Match") == etag:
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if cacheable:
+                    self.send_header("Cache-Control", "public, max-age=3600")
+                    self.send_header("ETag", etag)
+                else:
+                    self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # keep the test output clean
+
+        self._httpd = ThreadingHTTPServer((self._host, self._port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="shop-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "ShopServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def parse_size_weights(value: str | None) -> dict[str, float] | None:
+    """Parse "XS=1,S=3,M=3" into a weight mapping (None keeps the uniform default)."""
+    if not value:
+        return None
+    weights = {}
+    for part in value.split(","):
+        size, _, weight = part.partition("=")
+        weights[size.strip()] = float(weight) if weight else 1.0
+    return weights
+
+
+def parse_price_range(value: str) -> tuple[float, float]:
+    """Parse "10:100" into (10.0, 100.0)."""
+    low, _, high = value.partition(":")
+    return float(low), float(high or low)
+
+
+@pytest.fixture(scope="session")
+def shop_catalog(pytestconfig) -> Catalog:
+    """Seeded synthetic catalog configured by the --shop-* options."""
+    return generate_catalog(
+        size=pytestconfig.getoption("shop_catalog_size"),
+        seed=pytestconfig.getoption("shop_seed"),
+        size_weights=parse_size_weights(pytestconfig.getoption("shop_size_weights")),
+        price_range=parse_price_range(pytestconfig.getoption("shop_price_range")),
+    )
+
+
+@pytest.fixture(scope="session")
+def shop_server(shop_catalog):
+    """Local shop app for the session; navigate page objects to shop_server.url."""
+    with ShopServer(shop_catalog) as server:
+        yield server
@@ -1,6 +1,7 @@
 from playwright.sync_api import Page, Locator
-from utils import wait
+from utils import perf, wait
 from utils.logger import get_logger
+from utils.tracing import traced
 
 class BasePage:
     """Base class for all page objects with logging + wait wrappers."""
@@ -10,46 +11,71 @@ class BasePage:
         self.logger = get_logger(self.__class__.__name__)
 
     # ---------- Navigation ----------
+    @traced(attributes=("url",))
     def goto(self, url: str):
-        self.logger.info(f"Navigating to URL: {url}")
+        self.logger.info("Navigating to URL: %s", url)
         self.page.goto(url)
+        # page-load metrics, only collected while a perf capture is running (see utils/perf.py)
+        metrics = perf.record(self.page)
+        if metrics:
+            self.logger.info("Page metrics for %s: %s", url, metrics)
 
     def current_url(self) -> str:
         return self.page.url
 
     # ---------- Wait helpers ----------
+    @traced(attributes=("locator", "timeout"))
     def wait_for_visible(self, locator: Locator, timeout: float = 5000):
-        self.logger.info(f"Waiting for element {locator} to be visible (timeout={timeout}ms)")
+        self.logger.info("Waiting for element %s to be visible (timeout=%sms)", locator, timeout)
         wait.wait_for_element_visible(locator, timeout)
 
+    @traced(attributes=("locator", "timeout"))
     def wait_for_hidden(self, locator: Locator, timeout: float = 5000):
-        self.logger.info(f"Waiting for element {locator} to be hidden (timeout={timeout}ms)")
+        self.logger.info("Waiting for element %s to be hidden (timeout=%sms)", locator, timeout)
         wait.wait_for_element_hidden(locator, timeout)
 
+    @traced(attributes=("locator", "text", "timeout"))
     def wait_for_text(self, locator: Locator, text: str, timeout: float = 5000):
-        self.logger.info(f"Waiting for text '{text}' in {locator} (timeout={timeout}ms)")
+        self.logger.info("Waiting for text '%s' in %s (timeout=%sms)", text, locator, timeout)
         wait.wait_for_text(locator, text, timeout)
 
+    @traced(attributes=("fragment", "timeout"))
     def wait_for_url_contains(self, fragment: str, timeout: float = 5000):
-        self.logger.info(f"Waiting for URL to contain '{fragment}' (timeout={timeout}ms)")
+        self.logger.info("Waiting for URL to contain '%s' (timeout=%sms)", fragment, timeout)
         wait.wait_for_url(self.page, fragment, timeout)
 
+    @traced(attributes=("locator", "quiet_ms", "timeout", "no_change_ms"))
+    def settle_after(
+        self, locator: Locator, action, quiet_ms: float = 50, timeout: float = 5000, no_change_ms: float | None = None
+    ) -> wait.SettleResult:
+        """Run `action` and wait for the subtree under locator to change and stop mutating for quiet_ms."""
+        self.logger.info("Waiting for %s to settle after the action (quiet=%sms, timeout=%sms)", locator, quiet_ms, timeout)
+        result = wait.settle_after(locator, action, quiet_ms, timeout, no_change_ms)
+        self.logger.info(
+            "%s settled after %.0fms (%d mutations, %.0fms total)", locator, result.elapsed_ms, result.mutations, result.total_ms
+        )
+        return result
+
     # ---------- Utility interactions ----------
+    @traced(attributes=("locator", "url_fragment", "timeout"))
     def click_and_wait(self, locator: Locator, url_fragment: str, timeout: float = 5000):
-        self.logger.info(f"Clicking {locator} and waiting for URL to contain '{url_fragment}'")
+        self.logger.info("Clicking %s and waiting for URL to contain '%s'", locator, url_fragment)
         locator.click()
         self.wait_for_url_contains(url_fragment, timeout)
 
+    @traced(attributes=("locator",))
     def fill_and_log(self, locator: Locator, text: str):
-        self.logger.info(f"Filling {locator} with text '{text}'")
+        self.logger.info("Filling %s with text '%s'", locator, text)
         locator.fill(text)
 
+    @traced(attributes=("locator",), record_result=True)
     def get_text_and_log(self, locator: Locator) -> str:
         text = locator.text_content()
-        self.logger.info(f"Extracted text from {locator}: '{text}'")
+        self.logger.info("Extracted text from %s: '%s'", locator, text)
         return text
 
+    @traced(attributes=("locator",), record_result=True)
     def is_visible(self, locator: Locator) -> bool:
         visible = locator.is_visible()
-        self.logger.info(f"Is {locator} visible? {visible}")
+        self.logger.info("Is %s visible? %s", locator, visible)
         return visible
@@ -1,12 +1,21 @@
 from playwright.sync_api import Page, Locator, expect, Download,sync_playwright, TimeoutError
-import zipfile
 from pathlib import Path
+from urllib.parse import urljoin
 import logging
 import os
 
+from utils.download_cache import CachedDownload, DownloadCache
+from utils.zip_manifest import ZipManifest, manifest_from_file, manifest_from_url
+
 logger = logging.getLogger("pytest_playwright")
 
 
+def _file_key(zip_path) -> tuple[str, int, int]:
+    # a re-download or a replaced cache blob changes mtime/size, so its manifest is read again
+    stat = os.stat(zip_path)
+    return str(zip_path), stat.st_mtime_ns, stat.st_size
+
+
 
 
 class GitHubRepoPage:
@@ -35,6 +44,9 @@ class GitHubRepoPage:
         # Download ZIP link (the actual <a> inside the open dropdown)
         self.download_zip_link = self.page.locator("ul.prc-ActionList-ActionList-X4RiC >> a:has-text('Download ZIP')")
 
+        # archive manifests already read, by (zip path, mtime, size) / url
+        self._manifests: dict[str | tuple[str, int, int], ZipManifest] = {}
+
 
 
 
@@ -90,7 +102,7 @@ class GitHubRepoPage:
         Clicks the Download ZIP link in the Code menu and saves
         the downloaded file to the given path.
         """
-        self.logger.info(f"Initiating download of ZIP file to {path}...")
+        self.logger.info("Initiating download of ZIP file to %s...", path)
 
         # Wait for the download to start when clicking the link
         with self.page.expect_download() as download_info:
@@ -99,21 +111,64 @@ class GitHubRepoPage:
         download = download_info.value
         download.save_as(path)
 
-        self.logger.info(f"Download completed: {path}")
+        self.logger.info("Download completed: %s", path)
         return download
 
 
 
 
+    def download_zip_cached(self, cache: DownloadCache) -> CachedDownload:
+        """
+        Fetch the archive behind the Download ZIP link through `cache`: a repeat run only
+        revalidates it (ETag / Last-Modified) and reuses the cached file when unchanged.
+        """
+        download = cache.fetch(self.zip_download_url())
+        self.logger.info(
+            "Repo ZIP %s: %s (%d bytes)", "unchanged, from cache" if download.from_cache else "downloaded",
+            download.path, download.size,
+        )
+        return download
+
+    def get_zip_manifest(self, zip_path: str) -> ZipManifest:
+        """Member names of a downloaded ZIP, read from its central directory only (cached per file version)."""
+        key = _file_key(zip_path)
+        if key not in self._manifests:
+            self._manifests[key] = manifest_from_file(zip_path)
+            self.logger.info("ZIP '%s' has %d entries", zip_path, len(self._manifests[key]))
+        return self._manifests[key]
+
     def verify_zip_contains_file(self, zip_path: str, filename: str = "README.md") -> bool:
         """Verify that the downloaded ZIP contains a specific file."""
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            filenames = zip_ref.namelist()
-            self.logger.info(f"Files in ZIP '{zip_path}': {filenames}")
+        if filename not in self.get_zip_manifest(zip_path):
+            self.logger.error("File '%s' not found in ZIP '%s'", filename, zip_path)
+            assert False, f"{filename} not found in zip"
 
-            if filename not in [f.split('/')[-1] for f in filenames]:
-                self.logger.error(f"File '{filename}' not found in ZIP '{zip_path}'")
-                assert False, f"{filename} not found in zip"
+        self.logger.info("Verified '%s' exists in ZIP '%s'", filename, zip_path)
+        return True
 
-            self.logger.info(f"Verified '{filename}' exists in ZIP '{zip_path}'")
-            return True
\ No newline at end of file
+    def zip_download_url(self) -> str:
+        """Absolute URL behind the 'Download ZIP' link (opens the Code menu)."""
+        self.open_code_menu()
+        return urljoin(self.page.url, self.download_zip_link.get_attribute("href"))
+
+    def get_remote_zip_manifest(self, url: str | None = None) -> ZipManifest:
+        """
+        Manifest of the repo archive without saving it: HTTP range requests fetch only the
+        ZIP's tail and central directory (servers without range support are read into memory).
+        """
+        url = url or self.zip_download_url()
+        if url not in self._manifests:
+            manifest, reader = manifest_from_url(url)
+            self.logger.info(
+                "ZIP at %s has %d entries (%d bytes fetched in %d requests, archive is %s bytes)",
+                url, len(manifest), reader.bytes_fetched, reader.requests, reader.size,
+            )
+            self._manifests[url] = manifest
+        return self._manifests[url]
+
+    def verify_remote_zip_contains_file(self, filename: str = "README.md", url: str | None = None) -> bool:
+        """verify_zip_contains_file() for the archive behind the Download ZIP link, without a download."""
+        manifest = self.get_remote_zip_manifest(url)
+        assert filename in manifest, f"{filename} not found in remote zip"
+        self.logger.info("Verified '%s' exists in remote ZIP", filename)
+        return True
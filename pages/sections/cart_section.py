@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from playwright.sync_api import Page, expect
 
+from utils.tracing import traced
+
 if TYPE_CHECKING:
     # only imported during type checking, avoids circular import
     from pages.shop_page import ShoppingPage
@@ -16,7 +18,75 @@ class CartProduct:
     title: str
     quantity: int
     price: float  # single-item price
-    subtotal: float  # quantity × price
+    subtotal: float  # quantity × price, see line_subtotal
+
+
+def line_subtotal(price: float, quantity: int) -> float:
+    """quantity × price rounded to cents, as the shop shows it; every CartProduct uses this."""
+    return round(price * quantity, 2)
+
+
+# immutable view of the whole cart, read in a single DOM evaluation
+@dataclass(frozen=True)
+class CartSnapshot:
+    items: tuple[CartProduct, ...]
+    total_price: float  # subtotal as displayed in the cart footer
+    cart_count: int  # quantity shown on the header cart button
+
+    @property
+    def total_quantity(self) -> int:
+        return sum(item.quantity for item in self.items)
+
+    def get_item(self, title: str) -> CartProduct | None:
+        return next((item for item in self.items if item.title == title), None)
+
+
+# Collects the line items, footer subtotal and header quantity in one round trip so
+# they all describe the same render of the cart.
+_CART_SNAPSHOT_JS = """
+selectors => {
+    const text = (root, selector) => {
+        const el = root ? root.querySelector(selector) : null;
+        return el ? el.innerText.trim() : null;
+    };
+    const root = document.querySelector(selectors.root);
+    const items = root ? Array.from(root.querySelectorAll(selectors.item)) : [];
+    return {
+        items: items.map(item => ({
+            title: text(item, selectors.title),
+            quantity: text(item, selectors.quantity),
+            price: text(item, selectors.price),
+        })),
+        total: text(root, selectors.total),
+        count: text(document, selectors.count),
+    };
+}
+"""
+
+
+_CART_SNAPSHOT_SELECTORS = {
+    "root": "div.sc-1h98xa9-4",
+    "item": "div.sc-11uohgb-0.hDmOrM",
+    "title": "p.sc-11uohgb-2",
+    "quantity": "p.sc-11uohgb-3",
+    "price": "div.sc-11uohgb-4 p",
+    "total": "div.sc-1h98xa9-8.bciIxg > p.sc-1h98xa9-9.jzywDV",
+    "count": "div[title='Products in cart quantity'], div.sc-1h98xa9-3",
+}
+
+
+def _cart_snapshot_from_raw(raw: dict) -> CartSnapshot:
+    """Parse the result of _CART_SNAPSHOT_JS (shared with the async page objects)."""
+    items = []
+    for item in raw["items"]:
+        match = re.search(r"Quantity:\s*(\d+)", item["quantity"] or "")
+        quantity = int(match.group(1)) if match else 1
+        price = float((item["price"] or "0").replace("$", "").strip())
+        items.append(CartProduct(item["title"] or "", quantity, price, line_subtotal(price, quantity)))
+
+    total = float((raw["total"] or "0").replace("$", "").strip())
+    count = int(raw["count"]) if raw["count"] else 0
+    return CartSnapshot(items=tuple(items), total_price=total, cart_count=count)
 
 
 class CartSection:
@@ -47,6 +117,7 @@ class CartSection:
 
 
     # --- Methods ---
+    @traced()
     def open_cart(self) -> None:
         """Ensure the cart section is visible by clicking the cart quantity button from ShoppingPage if necessary."""
         if not self.section_root.is_visible():
@@ -78,10 +149,11 @@ class CartSection:
         price = float(price_text.replace("$", "").strip())
 
         # Subtotal (price * quantity)
-        subtotal = round(price * quantity, 2)
+        subtotal = line_subtotal(price, quantity)
 
         return CartProduct(title=title, quantity=quantity, price=price, subtotal=subtotal)
 
+    @traced(record_result=True)
     def click_checkout(self, capture_alert: bool = True) -> str | None:
         """Click checkout and capture the native alert message."""
         alert_message = None
@@ -92,18 +164,20 @@ class CartSection:
                 alert_message = dialog.message
                 dialog.accept()
 
-            self.page.on("dialog", handle_dialog)
+            self.page.once("dialog", handle_dialog)
 
         expect(self.checkout_button).to_be_visible()
         self.checkout_button.click()
 
         return alert_message
 
+    @traced()
     def close_cart(self) -> None:
         expect(self.cart_close_button).to_be_visible()
         self.cart_close_button.click()
         expect(self.section_root).to_be_hidden()
 
+    @traced()
     def get_all_cart_products(self) -> list[CartProduct]:
         """Return all products in the cart as structured CartProduct objects."""
         products: list[CartProduct] = []
@@ -121,17 +195,23 @@ class CartSection:
             price_text = item.locator("div.sc-11uohgb-4 p").first.inner_text().strip()
             price = float(price_text.replace("$", "").strip())
 
-            subtotal = price * quantity
+            subtotal = line_subtotal(price, quantity)
 
             products.append(CartProduct(title, quantity, price, subtotal))
 
         return products
     
+    @traced()
+    def get_snapshot(self) -> CartSnapshot:
+        """Return line items, subtotal and header count from a single DOM evaluation."""
+        return _cart_snapshot_from_raw(self.page.evaluate(_CART_SNAPSHOT_JS, _CART_SNAPSHOT_SELECTORS))
+
     def get_total_price(self) -> float:
         """Return the cart total as a float."""
         text = self.total_price.inner_text().replace("$", "").strip()
         return float(text)
 
+    @traced(attributes=("item_name", "times"))
     def increase_quantity(self, item_name: str, times: int = 1) -> None:
         item = self.cart_items.locator(f"p:has-text('{item_name}')").locator("..").locator("..")
         plus_button = item.locator("button:has-text('+')")
@@ -139,6 +219,7 @@ class CartSection:
             expect(plus_button).to_be_enabled()
             plus_button.click()
 
+    @traced(attributes=("item_name", "times"))
     def decrease_quantity(self, item_name: str, times: int = 1) -> None:
         item = self.cart_items.locator(f"p:has-text('{item_name}')").locator("..").locator("..")
         minus_button = item.locator("button:has-text('-')")
@@ -146,6 +227,7 @@ class CartSection:
             if minus_button.is_enabled():
                 minus_button.click()
 
+    @traced(attributes=("item_name", "target_quantity"))
     def set_quantity(self, item_name: str, target_quantity: int) -> None:
         item = self.cart_items.locator(f"p:has-text('{item_name}')").locator("..").locator("..")
         qty_text = item.locator("p.sc-11uohgb-3").inner_text()
@@ -163,6 +245,7 @@ class CartSection:
                 if minus_button.is_enabled():
                     minus_button.click()
 
+    @traced(attributes=("item_name",))
     def remove_item(self, item_name: str) -> None:
         item = self.cart_items.locator(f"p:has-text('{item_name}')").locator("..").locator("..")
         remove_button = item.locator("button[title='remove product from cart']")
@@ -175,6 +258,7 @@ class CartSection:
 
 
     #Ensure Empty Cart UI elements are displayed when sideboard is opened with no items in cart
+    @traced()
     def verify_section_visible(self):
         """
         Assert that the cart section root and key inner elements are visible,
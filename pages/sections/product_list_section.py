@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from typing import List
 from playwright.sync_api import Page, Locator, expect
 import re
+from utils import wait
+from utils.tracing import traced
 
 
 @dataclass
@@ -14,6 +16,104 @@ class Product:
     images: List[str]
 
 
+def _extract_url(bg_value: str) -> str | None:
+    """Pull the URL out of a CSS background-image value such as url("...")."""
+    if bg_value and bg_value != "none":
+        match = re.search(r'url\(["\']?(.*?)["\']?\)', bg_value)
+        if match:
+            return match.group(1)
+    return None
+
+
+# Reads every product card in one evaluate_all call. Field-for-field this mirrors
+# get_all_products; the hover image is resolved from the stylesheet ':hover' rules
+# (styled-components injects them via CSSOM) instead of physically hovering each card.
+_PRODUCT_SNAPSHOT_JS = """
+cards => {
+    const hoverRules = [];
+    const collect = (rules, base) => {
+        for (const rule of Array.from(rules || [])) {
+            if (rule.cssRules && !rule.selectorText) {
+                collect(rule.cssRules, base);  // @media / @supports blocks
+                continue;
+            }
+            if (!rule.selectorText || !rule.style || !rule.style.backgroundImage) continue;
+            const selectors = rule.selectorText.split(',')
+                .filter(sel => sel.includes(':hover'))
+                .map(sel => sel.replace(/:hover/g, '').trim());
+            if (selectors.length) {
+                hoverRules.push({selector: selectors.join(', '), value: rule.style.backgroundImage, base});
+            }
+        }
+    };
+    for (const sheet of Array.from(document.styleSheets)) {
+        try {
+            collect(sheet.cssRules, sheet.href || document.baseURI);
+        } catch (e) {
+            // cross-origin stylesheets cannot be read
+        }
+    }
+
+    // Computed styles report absolute URLs, so resolve the raw rule value the same way
+    const absolute = (value, base) => value.replace(/url\\(["']?(.*?)["']?\\)/g,
+        (whole, raw) => { try { return `url("${new URL(raw, base).href}")`; } catch (e) { return whole; } });
+
+    const text = (card, selector) => {
+        const el = card.querySelector(selector);
+        return el ? el.innerText : null;
+    };
+
+    return cards.map(card => {
+        const container = card.querySelector('div.sc-124al1g-1');
+        let hoverImage = null;
+        if (container) {
+            for (const rule of hoverRules) {
+                try {
+                    if (container.matches(rule.selector)) hoverImage = absolute(rule.value, rule.base);
+                } catch (e) {
+                    // selector not supported by matches()
+                }
+            }
+        }
+        return {
+            title: text(card, 'p.sc-124al1g-4'),
+            small: text(card, 'p.sc-124al1g-6 small'),
+            main: text(card, 'p.sc-124al1g-6 b'),
+            fraction: text(card, 'p.sc-124al1g-6 span'),
+            shipping: text(card, 'div.sc-124al1g-3'),
+            hasImage: !!container,
+            image: container ? window.getComputedStyle(container).backgroundImage : null,
+            hoverImage,
+        };
+    });
+}
+"""
+
+
+def _product_from_snapshot(card: dict) -> Product:
+    """Build a Product from one card of _PRODUCT_SNAPSHOT_JS (shared with the async page objects)."""
+    title = card["title"] or ""
+
+    price = ""
+    if card["small"] is not None and card["main"] is not None and card["fraction"] is not None:
+        price = f"{card['small']}{card['main']}{card['fraction']}"
+
+    shipping = card["shipping"] or ""
+
+    images = []
+    if card["hasImage"]:
+        url1 = _extract_url(card["image"])
+        if url1:
+            images.append(url1)
+
+        # Without a matching :hover rule the hovered style equals the resting one
+        url2 = _extract_url(card["hoverImage"] or card["image"])
+        if url2 and url2 not in images:
+            images.append(url2)
+
+    return Product(title=title, price=price, shipping=shipping, images=images)
+
+
 class ProductSection:
     def __init__(self, page: Page, logger=None):
         self.page = page
@@ -53,6 +153,10 @@ class ProductSection:
         fraction = card.locator("p.sc-124al1g-6 span").inner_text()
         return f"{small}{main}{fraction}"
 
+    def get_product_titles(self) -> List[str]:
+        """Titles of every card currently shown, in one round trip."""
+        return self.product_cards.locator("p.sc-124al1g-4").all_inner_texts()
+
     def get_product_shipping(self, index: int) -> str:
         return self.get_product_card(index).locator("div.sc-124al1g-3").inner_text()
 
@@ -68,6 +172,7 @@ class ProductSection:
         expect(button).to_be_visible()
         button.click()
 
+    @traced(attributes=("title",))
     def click_add_to_cart_by_title(self, title: str):
         card = self.product_cards.locator(f"p:has-text('{title}')").first
         expect(card).to_be_visible()
@@ -75,6 +180,7 @@ class ProductSection:
         expect(button).to_be_visible()
         button.click()
 
+    @traced()
     def get_all_products(self) -> list[Product]:
         products = []
         for i in range(self.count_products()):
@@ -100,38 +206,42 @@ class ProductSection:
             images = []
             image_container = card.locator("div.sc-124al1g-1")
             if image_container.count() > 0:
-                def extract_url(bg_value: str) -> str | None:
-                    if bg_value and bg_value != "none":
-                        match = re.search(r'url\(["\']?(.*?)["\']?\)', bg_value)
-                        if match:
-                            return match.group(1)
-                    return None
-
                 bg_image = image_container.evaluate("el => window.getComputedStyle(el).backgroundImage")
-                url1 = extract_url(bg_image)
+                url1 = _extract_url(bg_image)
                 if url1:
                     images.append(url1)
 
                 image_container.hover()
                 bg_image2 = image_container.evaluate("el => window.getComputedStyle(el).backgroundImage")
-                url2 = extract_url(bg_image2)
+                url2 = _extract_url(bg_image2)
                 if url2 and url2 not in images:
                     images.append(url2)
 
             products.append(Product(title=title, price=price, shipping=shipping, images=images))
         return products
 
+    @traced()
+    def get_all_products_bulk(self) -> list[Product]:
+        """
+        Drop-in replacement for get_all_products that reads every card in a single
+        round trip instead of a dozen locator calls (and a hover) per card.
+        """
+        return [_product_from_snapshot(card) for card in self.product_cards.evaluate_all(_PRODUCT_SNAPSHOT_JS)]
+
 
     # --- Size filter methods ---
+    @traced(attributes=("size",))
     def select_size(self, size: str):
         checkbox = self.size_filter_container.locator(f"input[data-testid='checkbox'][value='{size}']")
         checkbox.check(force=True)
 
+    @traced(attributes=("size",))
     def deselect_size(self, size: str):
         checkbox = self.size_filter_container.locator(f"input[data-testid='checkbox'][value='{size}']")
         if checkbox.is_checked():
             checkbox.uncheck(force=True)
 
+    @traced()
     def deselect_all_sizes(self):
         checkboxes = self.size_filter_container.locator("input[data-testid='checkbox']")
         for i in range(checkboxes.count()):
@@ -157,7 +267,25 @@ class ProductSection:
                 sizes.append(size_value)
         return sizes
 
+    # --- Helper to run a filter action and wait for the grid and product count label to re-render ---
+    @traced(attributes=("description", "no_change_ms", "quiet_ms", "timeout"))
+    def settle_after(
+        self, action, description: str = "update", no_change_ms: float | None = None,
+        quiet_ms: float = 50, timeout: float = 5000,
+    ) -> wait.SettleResult:
+        """
+        Run `action` with the product list observed from before it starts. Pass no_change_ms
+        when the action may leave the grid as it was (e.g. same products for both selections).
+        """
+        result = wait.settle_after(self.section_root, action, quiet_ms, timeout, no_change_ms)
+        if self.logger:
+            self.logger.info(
+                "Product list settled %.0fms after %s (%d mutations)", result.elapsed_ms, description, result.mutations
+            )
+        return result
+
     # --- Helper to check section visibility ---
+    @traced()
     def verify_section_visible(self):
         expect(self.section_root).to_be_visible()
         expect(self.product_cards.first).to_be_visible()
@@ -165,6 +293,7 @@ class ProductSection:
         expect(self.repo_star_link).to_be_visible()
 
     # --- Robust size filter validation ---
+    @traced(record_result=True)
     def validate_all_sizes(self) -> dict[str, int]:
         """
         Validates all available product size filters dynamically:
@@ -175,12 +304,15 @@ class ProductSection:
         results = {}
         total_products = self.count_products()
         for size in self.get_available_sizes():
-            self.deselect_all_sizes()
-            self.select_size(size)
-            self.page.wait_for_timeout(100)  # small delay for UI to update
+            def show_only(size=size):
+                self.deselect_all_sizes()
+                self.select_size(size)
+
+            # a size every product comes in leaves the grid untouched
+            self.settle_after(show_only, f"select '{size}'", no_change_ms=wait.NO_CHANGE_MS)
 
             # Get filtered product cards
-            filtered_products = self.get_all_products()
+            filtered_products = self.get_all_products_bulk()
 
             # Verify UI count matches actual cards
             try:
@@ -197,18 +329,17 @@ class ProductSection:
             for p in filtered_products:
                 assert p.title, "Product missing title"
                 assert p.price, f"Product '{p.title}' missing price"
-                if not p.shipping:
-                    self.logger.warning(f"Product '{p.title}' missing shipping info")
+                if not p.shipping and self.logger:
+                    self.logger.warning("Product '%s' missing shipping info", p.title)
                 assert p.images and all(p.images), f"Product '{p.title}' missing images"
 
             results[size] = len(filtered_products)
 
             # Deselect filter for next iteration
-            self.deselect_size(size)
-            self.page.wait_for_timeout(50)
+            self.settle_after(lambda: self.deselect_size(size), f"deselect '{size}'", no_change_ms=wait.NO_CHANGE_MS)
 
         # Confirm unfiltered product count is consistent
-        unfiltered_products = self.get_all_products()
+        unfiltered_products = self.get_all_products_bulk()
         assert len(unfiltered_products) == total_products, (
             f"After clearing filters: expected {total_products} products, found {len(unfiltered_products)}"
         )
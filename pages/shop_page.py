@@ -37,7 +37,7 @@ class ShoppingPage (BasePage):
 
     # Page-level methods
     def go_to_page(self, url: str):
-        self.page.goto(url)
+        self.goto(url)
 
     # Method to get the page title and verify page has loaded
     def verify_page_loaded(self, expected_title: str = "Typescript React Shopping cart"):
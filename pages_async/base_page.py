@@ -0,0 +1,71 @@
+from playwright.async_api import Page, Locator
+from utils import async_wait as wait
+from utils import perf
+from utils.logger import get_logger
+
+class BasePage:
+    """asyncio twin of pages.base_page.BasePage: same methods, awaitable."""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.logger = get_logger(self.__class__.__name__)
+
+    # ---------- Navigation ----------
+    async def goto(self, url: str):
+        self.logger.info("Navigating to URL: %s", url)
+        await self.page.goto(url)
+        # page-load metrics, only collected while a perf capture is running (see utils/perf.py)
+        metrics = await perf.record_async(self.page)
+        if metrics:
+            self.logger.info("Page metrics for %s: %s", url, metrics)
+
+    def current_url(self) -> str:
+        return self.page.url
+
+    # ---------- Wait helpers ----------
+    async def wait_for_visible(self, locator: Locator, timeout: float = 5000):
+        self.logger.info("Waiting for element %s to be visible (timeout=%sms)", locator, timeout)
+        await wait.wait_for_element_visible(locator, timeout)
+
+    async def wait_for_hidden(self, locator: Locator, timeout: float = 5000):
+        self.logger.info("Waiting for element %s to be hidden (timeout=%sms)", locator, timeout)
+        await wait.wait_for_element_hidden(locator, timeout)
+
+    async def wait_for_text(self, locator: Locator, text: str, timeout: float = 5000):
+        self.logger.info("Waiting for text '%s' in %s (timeout=%sms)", text, locator, timeout)
+        await wait.wait_for_text(locator, text, timeout)
+
+    async def wait_for_url_contains(self, fragment: str, timeout: float = 5000):
+        self.logger.info("Waiting for URL to contain '%s' (timeout=%sms)", fragment, timeout)
+        await wait.wait_for_url(self.page, fragment, timeout)
+
+    async def settle_after(
+        self, locator: Locator, action, quiet_ms: float = 50, timeout: float = 5000, no_change_ms: float | None = None
+    ) -> wait.SettleResult:
+        """Await `action` and wait for the subtree under locator to change and stop mutating for quiet_ms."""
+        self.logger.info("Waiting for %s to settle after the action (quiet=%sms, timeout=%sms)", locator, quiet_ms, timeout)
+        result = await wait.settle_after(locator, action, quiet_ms, timeout, no_change_ms)
+        self.logger.info(
+            "%s settled after %.0fms (%d mutations, %.0fms total)", locator, result.elapsed_ms, result.mutations, result.total_ms
+        )
+        return result
+
+    # ---------- Utility interactions ----------
+    async def click_and_wait(self, locator: Locator, url_fragment: str, timeout: float = 5000):
+        self.logger.info("Clicking %s and waiting for URL to contain '%s'", locator, url_fragment)
+        await locator.click()
+        await self.wait_for_url_contains(url_fragment, timeout)
+
+    async def fill_and_log(self, locator: Locator, text: str):
+        self.logger.info("Filling %s with text '%s'", locator, text)
+        await locator.fill(text)
+
+    async def get_text_and_log(self, locator: Locator) -> str:
+        text = await locator.text_content()
+        self.logger.info("Extracted text from %s: '%s'", locator, text)
+        return text
+
+    async def is_visible(self, locator: Locator) -> bool:
+        visible = await locator.is_visible()
+        self.logger.info("Is %s visible? %s", locator, visible)
+        return visible
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from urllib.parse import urljoin
+
+from playwright.async_api import Page, Locator, expect
+
+from pages.repo_page import _file_key
+from utils.download_cache import CachedDownload, DownloadCache
+from utils.zip_manifest import ZipManifest, manifest_from_file, manifest_from_url
+
+
+class GitHubRepoPage:
+    """asyncio twin of pages.repo_page.GitHubRepoPage."""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.logger = logging.getLogger("pytest_playwright")  # Use the same logger as in conftest.py
+
+        # --- Locators (same as the sync page object) ---
+        self.code_button = self.page.get_by_role("button", name="Code")
+        self.code_menu = self.page.locator("div.react-overview-code-button-action-list")
+        self.sign_in_prompt: Locator = self.page.locator("text=Sign in")
+        self.download_zip_link = self.page.locator("ul.prc-ActionList-ActionList-X4RiC >> a:has-text('Download ZIP')")
+
+        # archive manifests already read, by (zip path, mtime, size) / url
+        self._manifests: dict[str | tuple[str, int, int], ZipManifest] = {}
+
+    async def get_title(self):
+        return await self.page.title()
+
+    async def go_to(self, url: str):
+        await self.page.goto(url)
+
+    # --- Methods ---
+    async def open_code_menu(self):
+        """Open the Code dropdown menu if not already expanded."""
+        if await self.code_button.get_attribute("aria-expanded") != "true":
+            await self.code_button.click()
+            await expect(self.code_menu).to_be_visible()
+            await self.download_zip_link.wait_for(state="visible", timeout=5000)
+
+    async def is_public(self) -> bool:
+        """Returns True if the repository is public (accessible without sign-in)."""
+        if await self.sign_in_prompt.count() > 0:
+            return False
+        return await self.code_button.is_visible()
+
+    async def can_access_download_zip(self) -> bool:
+        """Returns True if the 'Download ZIP' link is visible and accessible."""
+        if not await self.is_public():
+            return False
+
+        try:
+            assert await self.code_button.is_visible(), "Code button not visible"
+            await self.open_code_menu()
+            assert await self.code_menu.is_visible(), "Code menu did not open"
+            assert await self.download_zip_link.is_visible()
+            return True
+        except Exception:
+            return False
+
+    async def download_zip(self, path: str):
+        """Clicks the Download ZIP link in the Code menu and saves the download to the given path."""
+        self.logger.info("Initiating download of ZIP file to %s...", path)
+
+        async with self.page.expect_download() as download_info:
+            await self.download_zip_link.click()
+
+        download = await download_info.value
+        await download.save_as(path)
+
+        self.logger.info("Download completed: %s", path)
+        return download
+
+    async def download_zip_cached(self, cache: DownloadCache) -> CachedDownload:
+        """Archive behind the Download ZIP link through `cache` (the transfer runs off the event loop)."""
+        download = await asyncio.to_thread(cache.fetch, await self.zip_download_url())
+        self.logger.info(
+            "Repo ZIP %s: %s (%d bytes)", "unchanged, from cache" if download.from_cache else "downloaded",
+            download.path, download.size,
+        )
+        return download
+
+    async def get_zip_manifest(self, zip_path: str) -> ZipManifest:
+        """Member names of a downloaded ZIP from its central directory (read off the event loop, cached)."""
+        key = _file_key(zip_path)
+        if key not in self._manifests:
+            self._manifests[key] = await asyncio.to_thread(manifest_from_file, zip_path)
+            self.logger.info("ZIP '%s' has %d entries", zip_path, len(self._manifests[key]))
+        return self._manifests[key]
+
+    async def verify_zip_contains_file(self, zip_path: str, filename: str = "README.md") -> bool:
+        """Verify that the downloaded ZIP contains a specific file."""
+        if filename not in await self.get_zip_manifest(zip_path):
+            self.logger.error("File '%s' not found in ZIP '%s'", filename, zip_path)
+            assert False, f"{filename} not found in zip"
+
+        self.logger.info("Verified '%s' exists in ZIP '%s'", filename, zip_path)
+        return True
+
+    async def zip_download_url(self) -> str:
+        await self.open_code_menu()
+        return urljoin(self.page.url, await self.download_zip_link.get_attribute("href"))
+
+    async def get_remote_zip_manifest(self, url: str | None = None) -> ZipManifest:
+        """Manifest of the repo archive through HTTP range requests, without saving it."""
+        url = url or await self.zip_download_url()
+        if url not in self._manifests:
+            manifest, reader = await asyncio.to_thread(manifest_from_url, url)
+            self.logger.info(
+                "ZIP at %s has %d entries (%d bytes fetched in %d requests, archive is %s bytes)",
+                url, len(manifest), reader.bytes_fetched, reader.requests, reader.size,
+            )
+            self._manifests[url] = manifest
+        return self._manifests[url]
+
+    async def verify_remote_zip_contains_file(self, filename: str = "README.md", url: str | None = None) -> bool:
+        manifest = await self.get_remote_zip_manifest(url)
+        assert filename in manifest, f"{filename} not found in remote zip"
+        self.logger.info("Verified '%s' exists in remote ZIP", filename)
+        return True
@@ -0,0 +1,139 @@
+from __future__ import annotations  # allows forward references in type hints
+
+import re
+from typing import TYPE_CHECKING
+from playwright.async_api import Page, expect
+from pages.sections.cart_section import (
+    CartProduct,
+    CartSnapshot,
+    _CART_SNAPSHOT_JS,
+    _CART_SNAPSHOT_SELECTORS,
+    _cart_snapshot_from_raw,
+    line_subtotal,
+)
+
+if TYPE_CHECKING:
+    # only imported during type checking, avoids circular import
+    from pages_async.shop_page import ShoppingPage
+
+
+# asyncio twin of pages.sections.cart_section.CartSection
+class CartSection:
+    def __init__(self, page: Page, shop_page: "ShoppingPage") -> None:
+        self.page = page
+        self.shop_page = shop_page
+
+        # same locators as the sync CartSection
+        self.section_root = page.locator("div.sc-1h98xa9-4")
+        self.cart_items = self.section_root.locator("div.sc-11uohgb-0.hDmOrM")
+        self.checkout_button = self.section_root.get_by_role("button", name="Checkout")
+        self.remove_buttons = self.section_root.get_by_title("remove product from cart")
+        self.cart_close_button = self.section_root.locator("button:has-text('X')")
+        self.cart_quantity_button = page.locator("div[title='Products in cart quantity']")
+        self.total_price = self.section_root.locator("div.sc-1h98xa9-8.bciIxg > p.sc-1h98xa9-9.jzywDV")
+
+    # --- Methods ---
+    async def open_cart(self) -> None:
+        """Ensure the cart section is visible by clicking the cart quantity button from ShoppingPage if necessary."""
+        if not await self.section_root.is_visible():
+            await expect(self.shop_page.cart_quantity).to_be_visible()
+            await self.shop_page.cart_quantity.click()
+            await expect(self.section_root).to_be_visible()
+
+    async def get_cart_count(self) -> int:
+        count_text = await self.shop_page.cart_quantity.inner_text()
+        return int(count_text.strip())
+
+    async def get_cart_item(self, index: int) -> CartProduct:
+        """Return the cart item at the given index as a structured object."""
+        item = self.cart_items.nth(index)
+        title = await item.locator("p.sc-11uohgb-2.elbkhN").inner_text()
+
+        quantity_text = await item.locator("p.sc-11uohgb-3.gKtloF").inner_text()
+        match = re.search(r"Quantity:\s*(\d+)", quantity_text)
+        quantity = int(match.group(1)) if match else 1
+
+        price_text = await item.locator("div.sc-11uohgb-4.bnZqjD > p").inner_text()
+        price = float(price_text.replace("$", "").strip())
+
+        return CartProduct(title=title, quantity=quantity, price=price, subtotal=line_subtotal(price, quantity))
+
+    async def click_checkout(self, capture_alert: bool = True) -> str | None:
+        """Click checkout and capture the native alert message."""
+        alert_message = None
+
+        if capture_alert:
+            async def handle_dialog(dialog):
+                nonlocal alert_message
+                alert_message = dialog.message
+                await dialog.accept()
+
+            self.page.once("dialog", handle_dialog)
+
+        await expect(self.checkout_button).to_be_visible()
+        await self.checkout_button.click()
+
+        return alert_message
+
+    async def close_cart(self) -> None:
+        await expect(self.cart_close_button).to_be_visible()
+        await self.cart_close_button.click()
+        await expect(self.section_root).to_be_hidden()
+
+    async def get_all_cart_products(self) -> list[CartProduct]:
+        return list((await self.get_snapshot()).items)
+
+    async def get_snapshot(self) -> CartSnapshot:
+        """Return line items, subtotal and header count from a single DOM evaluation."""
+        return _cart_snapshot_from_raw(await self.page.evaluate(_CART_SNAPSHOT_JS, _CART_SNAPSHOT_SELECTORS))
+
+    async def get_total_price(self) -> float:
+        text = (await self.total_price.inner_text()).replace("$", "").strip()
+        return float(text)
+
+    def _item(self, item_name: str):
+        return self.cart_items.locator(f"p:has-text('{item_name}')").locator("..").locator("..")
+
+    async def increase_quantity(self, item_name: str, times: int = 1) -> None:
+        plus_button = self._item(item_name).locator("button:has-text('+')")
+        for _ in range(times):
+            await expect(plus_button).to_be_enabled()
+            await plus_button.click()
+
+    async def decrease_quantity(self, item_name: str, times: int = 1) -> None:
+        minus_button = self._item(item_name).locator("button:has-text('-')")
+        for _ in range(times):
+            if await minus_button.is_enabled():
+                await minus_button.click()
+
+    async def set_quantity(self, item_name: str, target_quantity: int) -> None:
+        qty_text = await self._item(item_name).locator("p.sc-11uohgb-3").inner_text()
+        match = re.search(r"Quantity:\s*(\d+)", qty_text)
+        current_quantity = int(match.group(1)) if match else 0
+
+        if current_quantity < target_quantity:
+            await self.increase_quantity(item_name, target_quantity - current_quantity)
+        elif current_quantity > target_quantity:
+            await self.decrease_quantity(item_name, current_quantity - target_quantity)
+
+    async def remove_item(self, item_name: str) -> None:
+        remove_button = self._item(item_name).locator("button[title='remove product from cart']")
+        await expect(remove_button).to_be_visible()
+        await remove_button.click()
+
+    async def verify_item_in_cart(self, item_name: str) -> None:
+        await expect(self.cart_items.locator(f"p:has-text('{item_name}')")).to_be_visible()
+
+    async def verify_section_visible(self):
+        """Assert that the cart panel, checkout and close buttons are visible."""
+        cart_panel = self.page.locator("div.sc-1h98xa9-1.kQlqIC")
+        await cart_panel.wait_for(state="visible", timeout=5000)
+
+        if await self.cart_items.count() > 0:
+            await expect(self.cart_items.first).to_be_visible(timeout=5000)
+
+        await expect(self.checkout_button).to_be_visible(timeout=5000)
+
+        self.cart_close_button = cart_panel.locator("button:has-text('X')")
+        await self.cart_close_button.wait_for(state="visible", timeout=5000)
+        await expect(self.cart_close_button).to_be_visible()
@@ -0,0 +1,242 @@
+## asyncio twin of pages.sections.product_list_section - same locators and methods, awaitable
+
+import asyncio
+import re
+from typing import List
+from playwright.async_api import Page, Locator, expect
+from pages.sections.product_list_section import Product, _PRODUCT_SNAPSHOT_JS, _extract_url, _product_from_snapshot
+from utils import async_wait as wait
+
+
+class ProductSection:
+    def __init__(self, page: Page, logger=None):
+        self.page = page
+        self.logger = logger  # optional logger
+        # --- Section root ---
+        self.section_root: Locator = page.locator("main.sc-ebmerl-1.bmmyxu")
+        # --- Inner elements ---
+        self.product_cards: Locator = self.section_root.locator("div.sc-124al1g-2")
+        self.add_to_cart_buttons: Locator = self.product_cards.locator("button.sc-124al1g-0")
+        self.size_filter_container: Locator = self.section_root.locator(
+            "div.sc-bj2vay-0.DCKcC:has(h4:has-text('Sizes:'))"
+        )
+        self.repo_star_link: Locator = self.section_root.locator(
+            "a[aria-label='Star jeffersonRibeiro/react-shopping-cart on GitHub']"
+        )
+        self.product_count_label: Locator = self.section_root.locator("main.sc-ebmerl-4 p")
+
+    # --- Product methods ---
+    async def get_displayed_product_count(self) -> int:
+        text = (await self.product_count_label.inner_text()).strip()
+        match = re.search(r"(\d+)\s+Product", text)
+        return int(match.group(1)) if match else 0
+
+    async def count_products(self) -> int:
+        return await self.product_cards.count()
+
+    def get_product_card(self, index: int) -> Locator:
+        return self.product_cards.nth(index)
+
+    async def get_product_title(self, index: int) -> str:
+        return await self.get_product_card(index).locator("p.sc-124al1g-4").inner_text()
+
+    async def get_product_price(self, index: int) -> str:
+        card = self.get_product_card(index)
+        small = await card.locator("p.sc-124al1g-6 small").inner_text()
+        main = await card.locator("p.sc-124al1g-6 b").inner_text()
+        fraction = await card.locator("p.sc-124al1g-6 span").inner_text()
+        return f"{small}{main}{fraction}"
+
+    async def get_product_titles(self) -> List[str]:
+        return await self.product_cards.locator("p.sc-124al1g-4").all_inner_texts()
+
+    async def get_product_shipping(self, index: int) -> str:
+        return await self.get_product_card(index).locator("div.sc-124al1g-3").inner_text()
+
+    def get_product_images(self, index: int) -> List[Locator]:
+        card = self.get_product_card(index)
+        return [
+            card.locator("img.sc-124al1g-0"),
+            card.locator("img.sc-124al1g-1")
+        ]
+
+    async def click_add_to_cart(self, index: int):
+        button = self.add_to_cart_buttons.nth(index)
+        await expect(button).to_be_visible()
+        await button.click()
+
+    async def click_add_to_cart_by_title(self, title: str):
+        card = self.product_cards.locator(f"p:has-text('{title}')").first
+        await expect(card).to_be_visible()
+        button = card.locator("button:has-text('Add to cart')").first
+        await expect(button).to_be_visible()
+        await button.click()
+
+    async def get_all_products(self) -> list[Product]:
+        products = []
+        for i in range(await self.count_products()):
+            card = self.get_product_card(i)
+
+            title_locator = card.locator("p.sc-124al1g-4")
+            title = await title_locator.inner_text() if await title_locator.count() > 0 else ""
+
+            small = card.locator("p.sc-124al1g-6 small")
+            main = card.locator("p.sc-124al1g-6 b")
+            fraction = card.locator("p.sc-124al1g-6 span")
+            price = ""
+            if await small.count() > 0 and await main.count() > 0 and await fraction.count() > 0:
+                price = f"{await small.inner_text()}{await main.inner_text()}{await fraction.inner_text()}"
+
+            shipping_locator = card.locator("div.sc-124al1g-3")
+            shipping = await shipping_locator.inner_text() if await shipping_locator.count() > 0 else ""
+
+            images = []
+            image_container = card.locator("div.sc-124al1g-1")
+            if await image_container.count() > 0:
+                url1 = _extract_url(await image_container.evaluate("el => window.getComputedStyle(el).backgroundImage"))
+                if url1:
+                    images.append(url1)
+
+                await image_container.hover()
+                url2 = _extract_url(await image_container.evaluate("el => window.getComputedStyle(el).backgroundImage"))
+                if url2 and url2 not in images:
+                    images.append(url2)
+
+            products.append(Product(title=title, price=price, shipping=shipping, images=images))
+        return products
+
+    async def get_all_products_bulk(self) -> list[Product]:
+        """Every card in a single round trip (see the sync ProductSection.get_all_products_bulk)."""
+        return [_product_from_snapshot(card) for card in await self.product_cards.evaluate_all(_PRODUCT_SNAPSHOT_JS)]
+
+    # --- Size filter methods ---
+    async def select_size(self, size: str):
+        checkbox = self.size_filter_container.locator(f"input[data-testid='checkbox'][value='{size}']")
+        await checkbox.check(force=True)
+
+    async def deselect_size(self, size: str):
+        checkbox = self.size_filter_container.locator(f"input[data-testid='checkbox'][value='{size}']")
+        if await checkbox.is_checked():
+            await checkbox.uncheck(force=True)
+
+    async def deselect_all_sizes(self):
+        checkboxes = self.size_filter_container.locator("input[data-testid='checkbox']")
+        for i in range(await checkboxes.count()):
+            cb = checkboxes.nth(i)
+            if await cb.is_checked():
+                await cb.uncheck(force=True)
+
+    async def get_selected_sizes(self) -> List[str]:
+        selected = []
+        checkboxes = self.size_filter_container.locator("input[data-testid='checkbox']")
+        for i in range(await checkboxes.count()):
+            cb = checkboxes.nth(i)
+            if await cb.is_checked():
+                selected.append(await cb.get_attribute("value"))
+        return selected
+
+    async def get_available_sizes(self) -> List[str]:
+        sizes = []
+        checkboxes = self.size_filter_container.locator("input[data-testid='checkbox']")
+        for i in range(await checkboxes.count()):
+            size_value = await checkboxes.nth(i).get_attribute("value")
+            if size_value:
+                sizes.append(size_value)
+        return sizes
+
+    # --- Helper to run a filter action and wait for the grid and product count label to re-render ---
+    async def settle_after(
+        self, action, description: str = "update", no_change_ms: float | None = None,
+        quiet_ms: float = 50, timeout: float = 5000,
+    ) -> wait.SettleResult:
+        """Await `action` with the product list observed from before it starts (see the sync ProductSection)."""
+        result = await wait.settle_after(self.section_root, action, quiet_ms, timeout, no_change_ms)
+        if self.logger:
+            self.logger.info(
+                "Product list settled %.0fms after %s (%d mutations)", result.elapsed_ms, description, result.mutations
+            )
+        return result
+
+    # --- Helper to check section visibility ---
+    async def verify_section_visible(self):
+        await expect(self.section_root).to_be_visible()
+        await expect(self.product_cards.first).to_be_visible()
+        await expect(self.size_filter_container).to_be_visible()
+        await expect(self.repo_star_link).to_be_visible()
+
+    # --- Robust size filter validation ---
+    async def validate_size(self, size: str) -> int:
+        """Show only `size`, check the cards against the count label and return how many are shown."""
+        async def show_only():
+            await self.deselect_all_sizes()
+            await self.select_size(size)
+
+        # a size every product comes in leaves the grid untouched
+        await self.settle_after(show_only, f"select '{size}'", no_change_ms=wait.NO_CHANGE_MS)
+
+        filtered_products = await self.get_all_products_bulk()
+        try:
+            ui_count = int(re.search(r"(\d+)", await self.product_count_label.inner_text()).group(1))
+        except Exception:
+            ui_count = len(filtered_products)
+
+        assert len(filtered_products) == ui_count, (
+            f"Size '{size}' filter: expected {ui_count} products, found {len(filtered_products)}"
+        )
+        for p in filtered_products:
+            assert p.title, "Product missing title"
+            assert p.price, f"Product '{p.title}' missing price"
+            if not p.shipping and self.logger:
+                self.logger.warning("Product '%s' missing shipping info", p.title)
+            assert p.images and all(p.images), f"Product '{p.title}' missing images"
+
+        await self.settle_after(lambda: self.deselect_size(size), f"deselect '{size}'", no_change_ms=wait.NO_CHANGE_MS)
+        return len(filtered_products)
+
+    async def validate_all_sizes(self, concurrent: bool = False, batch_size: int = 1, new_page=None) -> dict[str, int]:
+        """
+        Validates all available product size filters (same checks as the sync
+        ProductSection.validate_all_sizes) and returns dict mapping size -> products displayed.
+
+        concurrent=True fans the sizes out over extra pages in the same browser, `batch_size`
+        sizes per page, validated at the same time. `new_page` is an async callable returning
+        a fresh page (default: a new page in this page's context).
+        """
+        total_products = await self.count_products()
+        sizes = await self.get_available_sizes()
+
+        if not concurrent:
+            results = {}
+            for size in sizes:
+                results[size] = await self.validate_size(size)
+        else:
+            batches = [sizes[i:i + batch_size] for i in range(0, len(sizes), max(1, batch_size))]
+            batch_results = await asyncio.gather(
+                *(self._validate_batch(batch, total_products, new_page or self.page.context.new_page) for batch in batches)
+            )
+            merged = {size: count for batch in batch_results for size, count in batch.items()}
+            results = {size: merged[size] for size in sizes}  # same order as the sequential run
+
+        unfiltered_products = await self.get_all_products_bulk()
+        assert len(unfiltered_products) == total_products, (
+            f"After clearing filters: expected {total_products} products, found {len(unfiltered_products)}"
+        )
+        return results
+
+    async def _validate_batch(self, sizes: List[str], total_products: int, new_page) -> dict[str, int]:
+        """Validate `sizes` one after another on a page of their own."""
+        page = await new_page()
+        try:
+            await page.goto(self.page.url)
+            section = ProductSection(page, logger=self.logger)
+            await expect(section.product_cards.first).to_be_visible()
+            results = {size: await section.validate_size(size) for size in sizes}
+
+            # every worker page must be back to the full catalog once its filters are cleared
+            unfiltered = await section.count_products()
+            assert unfiltered == total_products, (
+                f"After clearing {sizes}: expected {total_products} products, found {unfiltered}"
+            )
+            return results
+        finally:
+            await page.close()
@@ -0,0 +1,42 @@
+from pages_async.base_page import BasePage
+from pages_async.sections.work_abroad_section import WorkInNetherlandsSection
+from pages_async.sections.product_list_section import ProductSection
+from pages_async.sections.cart_section import CartSection
+from playwright.async_api import Page
+
+class ShoppingPage (BasePage):
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.page = page
+        self.work_abroad_section = WorkInNetherlandsSection(page)
+        self.product_list_section = ProductSection(self.page, logger=self.logger)
+        self.cart_section = CartSection(page, self)
+
+        # same locators as pages.shop_page.ShoppingPage
+        self.repo_cat_link = page.locator("a[aria-label='View source on Github']")
+        self.repo_cat_svg  = self.repo_cat_link.locator("svg")
+        self.repo_star_link = page.locator('a[aria-label="Star jeffersonRibeiro/react-shopping-cart on GitHub"]')
+        self.cart_quantity = page.locator(
+            "div[title='Products in cart quantity'], div.sc-1h98xa9-3"
+        )
+        self.error_message_locator = page.locator(".error, .alert, [role='alert']")
+
+
+    #Return Page Title
+    async def get_title(self):
+        return await self.page.title()
+
+    # Page-level methods
+    async def go_to_page(self, url: str):
+        await self.goto(url)
+
+    # Method to get the page title and verify page has loaded
+    async def verify_page_loaded(self, expected_title: str = "Typescript React Shopping cart"):
+        assert await self.get_title() == expected_title
+
+    #Method to get any page error message
+    async def get_error_message(self) -> str:
+        """Returns the text of the first visible error message, or None if none exist."""
+        if await self.error_message_locator.first.is_visible():
+            return (await self.error_message_locator.first.inner_text()).strip()
+        return None
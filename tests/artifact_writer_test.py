@@ -0,0 +1,59 @@
+# tests/artifact_writer_test.py
+import gzip
+import io
+import json
+
+import pytest
+from utils import artifact_writer
+from utils.artifact_writer import ArtifactWriter
+
+
+def test_identical_screenshots_are_written_once(tmp_path):
+    writer = ArtifactWriter()
+    first = writer.save_screenshot(b"png-bytes-1", tmp_path, "tests/a_test.py::test_a")
+    second = writer.save_screenshot(b"png-bytes-1", tmp_path, "tests/b_test.py::test_b")
+    third = writer.save_screenshot(b"png-bytes-2", tmp_path, "tests/c_test.py::test_c")
+    assert writer.close() == []
+
+    assert first == second != third
+    assert first.read_bytes() == b"png-bytes-1" and third.read_bytes() == b"png-bytes-2"
+    assert (writer.written, writer.deduplicated) == (2, 1)
+    assert json.loads((tmp_path / "index.json").read_text()) == {
+        "tests/a_test.py::test_a": first.name,
+        "tests/b_test.py::test_b": first.name,
+        "tests/c_test.py::test_c": third.name,
+    }
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_json_attachments_are_serialised_and_compressed_in_background(tmp_path):
+    writer = ArtifactWriter(max_workers=1)
+    path = writer.save_json({"requests": 3}, tmp_path / "summary.json", compress=True)
+    writer.close()
+    assert path.name == "summary.json.gz"
+    assert json.loads(gzip.decompress(path.read_bytes())) == {"requests": 3}
+
+
+def test_lossy_formats_without_pillow_use_browser_jpeg(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifact_writer, "Image", None)
+    assert artifact_writer.capture_format("png") == "png"
+    assert artifact_writer.capture_format("webp") == "jpeg"
+
+    writer = ArtifactWriter()
+    path = writer.save_screenshot(b"\xff\xd8jpeg", tmp_path, "tests/a_test.py::test_a", fmt="webp", quality=50)
+    writer.close()
+    assert path.suffix == ".jpg" and path.read_bytes() == b"\xff\xd8jpeg"
+    with pytest.raises(ValueError):
+        writer.save_screenshot(b"x", tmp_path, "t", fmt="gif")
+
+
+def test_pillow_reencodes_png_as_lossy_format(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), "red").save(buffer, format="PNG")
+
+    writer = ArtifactWriter()
+    path = writer.save_screenshot(buffer.getvalue(), tmp_path, "tests/a_test.py::test_a", fmt="webp", quality=40)
+    writer.close()
+    assert path.suffix == ".webp"
+    assert Image.open(path).format == "WEBP"
@@ -0,0 +1,174 @@
+# tests/asset_cache_test.py
+import pytest
+from fixtures.asset_cache import AssetCache, freshness_lifetime
+
+URL = "http://127.0.0.1:8000/static/app.js"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRequest:
+    def __init__(self, url=URL, resource_type="script", method="GET", headers=None):
+        self.url, self.resource_type, self.method = url, resource_type, method
+        self.headers = headers or {}
+
+
+class FakeResponse:
+    def __init__(self, status, headers, body=b""):
+        self.status, self.headers, self._body = status, headers, body
+
+    def body(self) -> bytes:
+        return self._body
+
+
+class FakeRoute:
+    """Records what the handler did; fetch() answers from `server` like the real origin would."""
+
+    def __init__(self, server):
+        self.server = server
+        self.fetched_with = None
+        self.fulfilled = None
+        self.fell_back = False
+
+    def fetch(self, headers=None, max_redirects=None):
+        self.fetched_with = headers or {}
+        return self.server(self.fetched_with)
+
+    def fulfill(self, response=None, status=None, headers=None, body=None):
+        self.fulfilled = {"status": status or response.status, "headers": headers, "body": body}
+
+    def fallback(self):
+        self.fell_back = True
+
+
+def origin(body=b"bundle", cache_control="public, max-age=3600", etag='"v1"'):
+    def server(request_headers):
+        if request_headers.get("if-none-match") == etag:
+            return FakeResponse(304, {"etag": etag, "cache-control": cache_control})
+        return FakeResponse(200, {"etag": etag, "cache-control": cache_control, "content-length": "6"}, body)
+    return server
+
+
+def test_freshness_lifetime():
+    assert freshness_lifetime({"cache-control": "public, max-age=3600"}) == 3600
+    assert freshness_lifetime({"cache-control": "max-age=60, s-maxage=600"}) == 600
+    assert freshness_lifetime({"cache-control": "no-cache, max-age=60"}) == 0
+    assert freshness_lifetime({
+        "expires": "Mon, 06 Oct 2025 11:00:00 GMT", "date": "Mon, 06 Oct 2025 10:00:00 GMT",
+    }) == 3600
+    assert freshness_lifetime({"expires": "0"}) == 0
+    assert freshness_lifetime({"etag": '"v1"'}) is None
+
+
+@pytest.mark.parametrize("status, headers, request_headers", [
+    (200, {"cache-control": "no-store"}, {}),
+    (200, {"cache-control": "private, max-age=60"}, {}),
+    (200, {"cache-control": "max-age=60", "vary": "*"}, {}),
+    (200, {"cache-control": "max-age=60"}, {"authorization": "Bearer x"}),
+    (200, {}, {}),  # neither a lifetime nor a validator
+    (404, {"cache-control": "max-age=60"}, {}),
+])
+def test_uncacheable_responses_are_not_stored(status, headers, request_headers):
+    cache = AssetCache()
+    assert not cache.store(URL, status, headers, b"x", request_headers)
+    assert len(cache) == 0
+
+
+def test_fresh_hit_never_reaches_the_network():
+    clock = Clock()
+    cache = AssetCache(clock=clock)
+    first, second = FakeRoute(origin()), FakeRoute(origin())
+
+    cache.handle(first, FakeRequest())
+    clock.now += 60
+    cache.handle(second, FakeRequest())
+
+    assert first.fetched_with == {} and first.fulfilled["body"] == b"bundle"
+    assert second.fetched_with is None  # served from memory
+    assert second.fulfilled["body"] == b"bundle" and second.fulfilled["headers"]["age"] == "60"
+    assert "content-length" not in second.fulfilled["headers"]
+    stats = cache.by_type["script"]
+    assert (stats.hits, stats.revalidations, stats.misses, stats.hit_rate) == (1, 0, 1, 0.5)
+
+
+def test_stale_entry_is_revalidated_with_its_etag():
+    clock = Clock()
+    cache = AssetCache(clock=clock)
+    cache.handle(FakeRoute(origin()), FakeRequest())
+
+    clock.now += 3601
+    stale = FakeRoute(origin())
+    cache.handle(stale, FakeRequest())
+    assert stale.fetched_with["if-none-match"] == '"v1"'
+    assert stale.fulfilled["status"] == 200 and stale.fulfilled["body"] == b"bundle"
+
+    # the 304 made it fresh again
+    fresh = FakeRoute(origin())
+    cache.handle(fresh, FakeRequest())
+    assert fresh.fetched_with is None
+    assert (cache.total.hits, cache.total.revalidations, cache.total.misses) == (1, 1, 1)
+
+
+def test_no_cache_is_stored_but_always_revalidated():
+    cache = AssetCache(clock=Clock())
+    cache.handle(FakeRoute(origin(cache_control="no-cache")), FakeRequest())
+    changed = FakeRoute(origin(body=b"new bundle", cache_control="no-cache", etag='"v2"'))
+    cache.handle(changed, FakeRequest())
+    assert changed.fetched_with["if-none-match"] == '"v1"'
+    assert changed.fulfilled["body"] == b"new bundle"
+    assert cache.lookup(URL, {}).body == b"new bundle"
+
+
+def test_documents_and_posts_go_to_the_network():
+    cache = AssetCache()
+    for request in (FakeRequest(resource_type="document"), FakeRequest(method="POST"),
+                    FakeRequest(headers={"range": "bytes=0-10"})):
+        route = FakeRoute(origin())
+        cache.handle(route, request)
+        assert route.fell_back and route.fetched_with is None
+    assert cache.total.requests == 0
+
+
+def test_vary_selects_the_stored_variant():
+    cache = AssetCache()
+    cache.store(URL, 200, {"cache-control": "max-age=60", "vary": "Accept"}, b"webp", {"accept": "image/webp"})
+    assert cache.lookup(URL, {"accept": "image/webp"}).body == b"webp"
+    assert cache.lookup(URL, {"accept": "image/png"}) is None
+
+
+def test_least_recently_used_entries_are_evicted_within_budget():
+    cache = AssetCache(max_bytes=10)
+    headers = {"cache-control": "max-age=60"}
+    cache.store("a", 200, headers, b"aaaa", {})
+    cache.store("b", 200, headers, b"bbbb", {})
+    cache.lookup("a", {})  # a is now the most recent
+    cache.store("c", 200, headers, b"cccc", {})
+
+    assert cache.lookup("b", {}) is None
+    assert cache.lookup("a", {}) and cache.lookup("c", {})
+    assert cache.bytes_used == 8 and cache.evictions == 1
+    assert not cache.store("huge", 200, headers, b"x" * 11, {})
+
+
+@pytest.mark.local_shop
+def test_second_context_loads_static_assets_from_memory(browser, shop_server):
+    """Contexts don't share the browser's HTTP cache, but they do share the asset cache."""
+    cache = AssetCache()
+    for _ in range(2):
+        context = browser.new_context()
+        context.route("**/*", cache.handle)
+        page = context.new_page()
+        page.goto(shop_server.url)
+        page.wait_for_load_state("networkidle")
+        context.close()
+
+    script = cache.by_type["script"]
+    assert script.misses == 1 and script.hits == 1
+    assert cache.by_type["image"].hits >= 1
+    assert cache.total.hit_rate >= 0.5
@@ -0,0 +1,72 @@
+# tests/async_pages_test.py
+import asyncio
+import inspect
+
+import pytest
+import pages.base_page, pages.shop_page, pages.repo_page
+import pages.sections.cart_section, pages.sections.product_list_section, pages.sections.work_abroad_section
+import pages_async.base_page, pages_async.shop_page, pages_async.repo_page
+import pages_async.sections.cart_section, pages_async.sections.product_list_section, pages_async.sections.work_abroad_section
+from fixtures.async_browser import async_test
+from pages_async.shop_page import ShoppingPage
+
+PAIRS = [
+    (pages.base_page.BasePage, pages_async.base_page.BasePage),
+    (pages.shop_page.ShoppingPage, pages_async.shop_page.ShoppingPage),
+    (pages.repo_page.GitHubRepoPage, pages_async.repo_page.GitHubRepoPage),
+    (pages.sections.cart_section.CartSection, pages_async.sections.cart_section.CartSection),
+    (pages.sections.product_list_section.ProductSection, pages_async.sections.product_list_section.ProductSection),
+    (pages.sections.work_abroad_section.WorkInNetherlandsSection,
+     pages_async.sections.work_abroad_section.WorkInNetherlandsSection),
+]
+
+
+def _public_methods(cls) -> set[str]:
+    return {name for name, _ in inspect.getmembers(cls, inspect.isfunction) if not name.startswith("_")}
+
+
+@pytest.mark.parametrize("sync_cls, async_cls", PAIRS, ids=[sync.__name__ for sync, _ in PAIRS])
+def test_async_page_objects_mirror_sync_ones(sync_cls, async_cls):
+    assert _public_methods(sync_cls) <= _public_methods(async_cls)
+    # anything that talks to the browser is a coroutine
+    for name in ("goto", "verify_section_visible", "get_snapshot", "validate_all_sizes", "download_zip"):
+        if hasattr(async_cls, name):
+            assert inspect.iscoroutinefunction(getattr(async_cls, name)), f"{async_cls.__name__}.{name}"
+
+
+@pytest.mark.local_shop
+@async_test
+async def test_concurrent_shoppers_on_one_event_loop(async_page_factory, shop_server):
+    """Ten isolated shoppers each fill their own cart at the same time."""
+    titles = [p.title for p in shop_server.catalog.products[:10]]
+
+    async def shop(title: str):
+        shopping_page = ShoppingPage(await async_page_factory())
+        await shopping_page.goto(shop_server.url)
+        await shopping_page.verify_page_loaded()
+        await shopping_page.product_list_section.click_add_to_cart_by_title(title)
+        await shopping_page.cart_section.open_cart()
+        return await shopping_page.cart_section.get_snapshot()
+
+    snapshots = await asyncio.gather(*(shop(title) for title in titles))
+    for title, snapshot in zip(titles, snapshots):
+        assert [item.title for item in snapshot.items] == [title]
+        assert snapshot.cart_count == 1
+
+
+@pytest.mark.local_shop
+@pytest.mark.parametrize("batch_size", [1, 3])
+@async_test
+async def test_concurrent_size_validation_matches_sequential(async_page, shop_server, batch_size):
+    shopping_page = ShoppingPage(async_page)
+    await shopping_page.goto(shop_server.url)
+    section = shopping_page.product_list_section
+
+    sequential = await section.validate_all_sizes()
+    concurrent = await section.validate_all_sizes(concurrent=True, batch_size=batch_size)
+
+    assert concurrent == sequential
+    assert list(concurrent) == shop_server.catalog.sizes
+    # OR filter with a single size selected: products offering that size
+    for size, count in concurrent.items():
+        assert count == sum(size in p.available_sizes for p in shop_server.catalog.products)
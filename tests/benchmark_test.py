@@ -0,0 +1,41 @@
+# tests/benchmark_test.py
+import pytest
+from pages.shop_page import ShoppingPage
+from tools.benchmark import compare
+from utils.protocol import count_round_trips
+
+
+def _report(**results):
+    return {"meta": {}, "results": results}
+
+
+def test_compare_flags_only_regressions_beyond_tolerance():
+    baseline = _report(
+        fast={"median_ms": 10.0, "peak_alloc_kb": 100.0, "round_trips": 4},
+        slow={"median_ms": 10.0, "peak_alloc_kb": 100.0, "round_trips": 4},
+    )
+    current = _report(
+        fast={"median_ms": 11.5, "peak_alloc_kb": 90.0, "round_trips": 4},  # within 20%
+        slow={"median_ms": 13.0, "peak_alloc_kb": 100.0, "round_trips": 6},
+        new={"median_ms": 1.0, "peak_alloc_kb": 1.0, "round_trips": 1},  # not in the baseline
+    )
+    regressions = compare(baseline, current, tolerance=0.2)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("slow: median_ms 10.0 -> 13.0")
+    assert regressions[1].startswith("slow: round_trips 4 -> 6")
+    assert compare(baseline, current, tolerance=0.5, round_trip_tolerance=0.5) == []
+
+
+@pytest.mark.local_shop
+def test_bulk_product_read_needs_fewer_round_trips(page, shop_server):
+    shopping_page = ShoppingPage(page)
+    shopping_page.goto(shop_server.url)
+    section = shopping_page.product_list_section
+
+    with count_round_trips() as per_card:
+        products = section.get_all_products()
+    with count_round_trips() as bulk:
+        assert section.get_all_products_bulk() == products
+
+    assert bulk.calls < per_card.calls
+    assert per_card.by_method.most_common(1)[0][1] >= len(products)
@@ -0,0 +1,104 @@
+# tests/cart_model_test.py
+import random
+
+import pytest
+from pages.sections.cart_section import _cart_snapshot_from_raw
+from pages.shop_page import ShoppingPage
+from utils.cart_model import (
+    CartModel, CartOp, ShopCartDriver, check_sequence, generate_sequence, run_random_sequences,
+)
+
+PRICES = {"Cat Tee": 10.9, "Dog Hoodie": 29.45, "Wolf Polo": 14.0}
+
+
+class _ModelDriver:
+    """Stands in for the UI; `bug` lets a test break it on purpose."""
+
+    def __init__(self, bug=None):
+        self.bug = bug
+        self.model = CartModel(PRICES)
+
+    def reset(self):
+        self.model = CartModel(PRICES)
+
+    def apply(self, op):
+        alert = self.model.apply(op)
+        if self.bug:
+            self.bug(self.model, op)
+        return alert
+
+    def snapshot(self):
+        return self.model.snapshot()
+
+
+def test_model_follows_app_semantics():
+    cart = CartModel(PRICES)
+    assert cart.checkout_alert() == "Add some product in the cart!"
+    cart.add("Cat Tee")
+    cart.add("Dog Hoodie")
+    cart.add("Cat Tee")
+    cart.increase("Dog Hoodie", 2)
+    cart.decrease("Cat Tee", 5)
+    assert cart.lines == {"Cat Tee": 1, "Dog Hoodie": 3}
+    assert cart.checkout_alert() == f"Checkout - Subtotal: $ {10.9 + 3 * 29.45:.2f}"
+
+    cart.remove("Cat Tee")
+    snapshot = cart.snapshot()
+    assert [item.title for item in snapshot.items] == ["Dog Hoodie"]
+    assert snapshot.cart_count == snapshot.total_quantity == 3
+
+
+def test_ui_and_model_subtotals_use_the_same_rounding():
+    raw = {"items": [{"title": "Cat Tee", "quantity": "Quantity: 9", "price": "$ 10.90"}], "total": "98.10", "count": "9"}
+    [parsed] = _cart_snapshot_from_raw(raw).items
+    cart = CartModel(PRICES)
+    cart.add("Cat Tee")
+    cart.increase("Cat Tee", 8)
+    [modelled] = cart.snapshot().items
+    assert parsed.subtotal == modelled.subtotal == 98.1  # 10.9 * 9 is 98.10000000000001
+
+
+def test_thousands_of_sequences_agree_with_a_correct_cart():
+    run = run_random_sequences(_ModelDriver(), PRICES, sequences=2000, length=20, seed=7)
+    assert run.failure is None
+    assert run.ops == 40_000
+
+
+def test_failing_sequence_is_shrunk_to_a_minimal_reproduction():
+    def decrease_drops_to_zero(model, op):
+        # broken '-' button: decreasing at quantity 1 removes the item instead of doing nothing
+        if op.name == "decrease" and model.lines.get(op.title) == 1:
+            del model.lines[op.title]
+
+    run = run_random_sequences(_ModelDriver(decrease_drops_to_zero), PRICES, sequences=500, length=25, seed=1)
+    assert run.failure is not None, "the bug was never hit"
+    ops = run.failure.ops
+    assert [op.name for op in ops] == ["add", "decrease"]
+    assert ops[0].title == ops[1].title
+    # the shrunk sequence still reproduces on its own
+    assert check_sequence(_ModelDriver(decrease_drops_to_zero), PRICES, ops) is not None
+
+
+def test_generated_sequences_only_touch_items_in_the_cart():
+    ops = generate_sequence(random.Random(3), PRICES, 200)
+    cart = CartModel(PRICES)
+    for op in ops:
+        assert cart.is_valid(op), f"{op} is not valid for {cart.lines}"
+        cart.apply(op)
+    assert any(op == CartOp("checkout") for op in ops)
+
+
+@pytest.mark.local_shop
+@pytest.mark.cart
+def test_random_cart_sequences_match_model(page, shop_server, request):
+    shopping_page = ShoppingPage(page)
+    prices = {p.title: p.price for p in shop_server.catalog.products[:6]}
+    run = run_random_sequences(
+        ShopCartDriver(shopping_page, shop_server.url),
+        prices,
+        sequences=request.config.getoption("cart_sequences"),
+        length=12,
+        checkpoint_every=request.config.getoption("cart_checkpoint_every"),
+        seed=request.config.getoption("cart_seed"),
+    )
+    assert run.failure is None, f"Cart disagreed with the model (minimal reproduction):\n{run.failure}"
@@ -3,7 +3,6 @@ import math
 import pytest
 from playwright.sync_api import expect
 from pages.shop_page import ShoppingPage
-from pages.sections.cart_section import CartProduct
 
 @pytest.mark.usefixtures("network_logger")
 @pytest.mark.cart
@@ -53,30 +52,32 @@ def test_cart_dynamic_flow(page, network_logger):
     for cart_item in cart_products:
         shopping_page.cart_section.increase_quantity(cart_item.title, 2)
 
-    # Re-fetch cart and verify total quantity
-    cart_products = shopping_page.cart_section.get_all_cart_products()
-    total_quantity = sum(item.quantity for item in cart_products)
-    expect(shopping_page.cart_quantity).to_have_text(str(total_quantity))
+    # Wait for the header to settle, then verify one consistent snapshot of the cart
+    expect(shopping_page.cart_quantity).to_have_text(str(3 * len(products)))
+    snapshot = shopping_page.cart_section.get_snapshot()
+    assert all(item.quantity == 3 for item in snapshot.items), f"Unexpected quantities: {snapshot.items}"
+    assert snapshot.cart_count == snapshot.total_quantity
 
     # Dynamically remove 1 quantity from first product (if exists)
-    if cart_products:
-        shopping_page.cart_section.decrease_quantity(cart_products[0].title, 1)
+    if snapshot.items:
+        shopping_page.cart_section.decrease_quantity(snapshot.items[0].title, 1)
+        expect(shopping_page.cart_quantity).to_have_text(str(snapshot.total_quantity - 1))
 
-    cart_products = shopping_page.cart_section.get_all_cart_products()
-    total_quantity = sum(item.quantity for item in cart_products)
-    expect(shopping_page.cart_quantity).to_have_text(str(total_quantity))
+    snapshot = shopping_page.cart_section.get_snapshot()
+    assert snapshot.cart_count == snapshot.total_quantity
 
     # Dynamically remove all quantities of the second product (if exists)
-    if len(cart_products) > 1:
-        shopping_page.cart_section.remove_item(cart_products[1].title)
+    if len(snapshot.items) > 1:
+        removed = snapshot.items[1]
+        shopping_page.cart_section.remove_item(removed.title)
+        expect(shopping_page.cart_quantity).to_have_text(str(snapshot.total_quantity - removed.quantity))
 
-    cart_products = shopping_page.cart_section.get_all_cart_products()
-    total_quantity = sum(item.quantity for item in cart_products)
-    expect(shopping_page.cart_quantity).to_have_text(str(total_quantity))
+    snapshot = shopping_page.cart_section.get_snapshot()
+    assert snapshot.cart_count == snapshot.total_quantity
 
     # Verify subtotal dynamically
-    expected_total = sum(item.subtotal for item in cart_products)
-    actual_total = shopping_page.cart_section.get_total_price()
+    expected_total = sum(item.subtotal for item in snapshot.items)
+    actual_total = snapshot.total_price
     assert math.isclose(actual_total, expected_total, rel_tol=1e-9), f"Expected total {expected_total}, got {actual_total}"
 
     # Checkout button visible
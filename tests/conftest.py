@@ -1,12 +1,24 @@
 # conftest.py
 import json
 import logging
-import logging.config
 from pathlib import Path
 import os
 import pytest
 from pytest_html import extras
+from utils.timing_db import TimingStore
+from utils.logger import configure_logging, PerTestLogBuffer
+from utils import perf, tracing
+from utils.artifact_writer import ArtifactWriter, IMAGE_FORMATS, capture_format
+from utils.instrumentation import PageObjectProfiler
 from fixtures.network import network_logger
+from fixtures.browser import context_pool, page, trace_path, video_path
+from fixtures.har import har_archive, har_routing, fail_on_unmatched
+from fixtures.shop_server import shop_catalog, shop_server
+from fixtures.filter_oracle import shop_filter_oracle, live_filter_oracle
+from fixtures.download_cache import download_cache
+from fixtures.file_server import file_server
+from fixtures.asset_cache import ASSET_CACHE_KEY, asset_cache, asset_cache_routing
+from fixtures.async_browser import async_playwright_instance, async_browser, async_page_factory, async_page
 
 # -----------------------------
 # Determine repo root and config paths
@@ -15,36 +27,326 @@ REPO_ROOT = Path(__file__).resolve().parent.parent  # tests/ -> repo root
 LOGGING_CONFIG_PATH = REPO_ROOT / "config" / "logging.ini"
 
 # -----------------------------
-# Artifact directories
+# Artifact directories (per worker when run through tools/parallel_runner.py)
 # -----------------------------
-ARTIFACTS_DIR = REPO_ROOT / "artifacts"
-SCREENSHOT_DIR = ARTIFACTS_DIR / "screenshots"
-VIDEO_DIR = ARTIFACTS_DIR / "videos"
-NETWORK_LOGGER_DIR = ARTIFACTS_DIR / "network_logs"
-DOWNLOADS_DIR = ARTIFACTS_DIR / "downloads"
-
+from utils.artifacts import (
+    ARTIFACTS_ROOT,
+    ARTIFACTS_DIR,
+    SCREENSHOT_DIR,
+    VIDEO_DIR,
+    DOWNLOADS_DIR,
+    SPANS_DIR,
+    LOG_FILE,
+    ensure_artifact_dirs,
+    safe_node_name,
+)
 
 # Create directories if they do not exist
-ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
-SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
-VIDEO_DIR.mkdir(parents=True, exist_ok=True)
-NETWORK_LOGGER_DIR.mkdir(parents=True, exist_ok=True)
-DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)    
+ensure_artifact_dirs()
 
-# Load centralized logging.ini
-logging.config.fileConfig(LOGGING_CONFIG_PATH, disable_existing_loggers=False)
+# Load centralized logging.ini (once per process; file output goes through a background queue)
+configure_logging(LOG_FILE, LOGGING_CONFIG_PATH)
 
 # Module-level logger for hooks and fixtures
 logger = logging.getLogger("pytest_playwright")
 
 
-# --- Helper to read last N lines from log ---
-def _read_log_file_tail(lines: int = 50) -> str:
-    log_file = ARTIFACTS_DIR / "test.log"
-    if not log_file.exists():
-        return ""
-    with log_file.open("r", encoding="utf-8") as f:
-        return "".join(f.readlines()[-lines:])
+# --- Command line options ---
+def pytest_addoption(parser):
+    group = parser.getgroup("nuclera", "shop app test framework")
+    group.addoption(
+        "--har",
+        choices=["off", "record", "replay"],
+        default="off",
+        help="record the shop app traffic to a HAR archive, or replay it from memory instead of the network",
+    )
+    group.addoption(
+        "--har-path",
+        default=str(ARTIFACTS_ROOT / "har" / "shop_app.har"),
+        help="HAR archive written by --har=record and read by --har=replay",
+    )
+    group.addoption(
+        "--har-strict",
+        action="store_true",
+        default=False,
+        help="with --har=replay, fail the test on any request missing from the archive instead of using the network",
+    )
+    group.addoption(
+        "--context-pool-size",
+        type=int,
+        default=1,
+        help="number of warm browser contexts reused across tests (0 creates a fresh context per test); "
+        "tests marked fresh_context always get a new one",
+    )
+    group.addoption(
+        "--durations-file",
+        default=None,
+        help="write {node id: seconds} for every test run to this JSON file (used by tools/parallel_runner.py)",
+    )
+    group.addoption(
+        "--test-log-lines",
+        type=int,
+        default=200,
+        help="number of log lines kept per test and attached to the HTML report",
+    )
+    group.addoption(
+        "--artifact-mode",
+        choices=["trace", "video", "off"],
+        default="trace",
+        help="trace: keep a Playwright trace for failing tests only, video via @pytest.mark.video; "
+        "video: record every test (fresh context each); off: neither",
+    )
+    group.addoption(
+        "--screenshot-format",
+        choices=IMAGE_FORMATS,
+        default="png",
+        help="failure screenshot format; jpeg/webp are lossy and much smaller (webp needs Pillow)",
+    )
+    group.addoption(
+        "--screenshot-quality",
+        type=int,
+        default=80,
+        help="quality (0-100) for jpeg/webp failure screenshots",
+    )
+    group.addoption(
+        "--artifact-writer-threads",
+        type=int,
+        default=2,
+        help="background threads encoding and writing failure artifacts",
+    )
+    group.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=False,
+        help="collect page-load metrics on every BasePage.goto, not just in tests marked perf_budget",
+    )
+    group.addoption(
+        "--timing-db",
+        default=str(ARTIFACTS_ROOT / "timings.sqlite3"),
+        help="SQLite file collecting setup/call/teardown durations of every test (see tools/timing_report.py)",
+    )
+    group.addoption(
+        "--no-timing-db",
+        action="store_true",
+        default=False,
+        help="don't record test durations to the timing database",
+    )
+    group.addoption(
+        "--shop-catalog-size",
+        type=int,
+        default=16,
+        help="number of products served by the local shop_server fixture",
+    )
+    group.addoption("--shop-seed", type=int, default=0, help="seed for the local shop catalog generator")
+    group.addoption(
+        "--shop-size-weights",
+        default=None,
+        help="relative size frequencies for the local catalog, e.g. 'XS=1,S=3,M=3,L=2' (default uniform)",
+    )
+    group.addoption(
+        "--shop-price-range",
+        default="10:100",
+        help="min:max product price for the local catalog",
+    )
+    group.addoption(
+        "--cart-sequences",
+        type=int,
+        default=25,
+        help="random add/increase/decrease/remove/checkout sequences checked against the cart model",
+    )
+    group.addoption(
+        "--cart-checkpoint-every",
+        type=int,
+        default=5,
+        help="compare the whole cart with the model every N operations (0 = only at the end of a sequence)",
+    )
+    group.addoption("--cart-seed", type=int, default=0, help="seed for the random cart sequences")
+    group.addoption(
+        "--instrument-pages",
+        action="store_true",
+        default=False,
+        help="attribute Playwright round trips and time to page-object methods (report table + hot list)",
+    )
+    group.addoption(
+        "--trace-spans",
+        action="store_true",
+        default=False,
+        help="record nested spans for page-object actions and write each test's timeline to artifacts/spans/ "
+        "(Chrome trace-event and OTLP JSON)",
+    )
+    group.addoption(
+        "--download-cache-mb",
+        type=int,
+        default=500,
+        help="size cap of the repo archive cache in artifacts/download_cache/ (least recently used evicted first)",
+    )
+    group.addoption(
+        "--refresh-downloads",
+        action="store_true",
+        default=False,
+        help="download cached archives again instead of revalidating them",
+    )
+    group.addoption(
+        "--asset-cache",
+        action="store_true",
+        default=False,
+        help="serve static assets (scripts, styles, fonts, images) from a session-wide in-memory cache "
+        "shared by every test's context",
+    )
+    group.addoption(
+        "--asset-cache-mb",
+        type=int,
+        default=64,
+        help="memory budget of --asset-cache (least recently used entries evicted first)",
+    )
+
+
+# --- Per-test log capture (attached to the HTML report) ---
+_test_logs: PerTestLogBuffer | None = None
+# Background writer for failure screenshots and other attachments
+_artifact_writer: ArtifactWriter | None = None
+# Page-object profiler, only with --instrument-pages
+_profiler: PageObjectProfiler | None = None
+# Span timelines per test, only with --trace-spans
+_spans_enabled = False
+
+
+def pytest_configure(config):
+    global _test_logs, _artifact_writer, _profiler, _spans_enabled
+    _test_logs = PerTestLogBuffer(config.getoption("test_log_lines"))
+    logging.getLogger().addHandler(_test_logs)
+    _artifact_writer = ArtifactWriter(max_workers=config.getoption("artifact_writer_threads"))
+    _spans_enabled = config.getoption("trace_spans")
+    if config.getoption("instrument_pages"):
+        _profiler = PageObjectProfiler()
+        _profiler.install()
+
+
+def pytest_unconfigure(config):
+    if _test_logs is not None:
+        logging.getLogger().removeHandler(_test_logs)
+    if _profiler is not None:
+        _profiler.uninstall()
+
+
+def pytest_runtest_logstart(nodeid, location):
+    _test_logs.start(nodeid)
+    if _profiler is not None:
+        _profiler.start_test()
+    if _spans_enabled:
+        tracing.start_tracing()
+
+
+def pytest_terminal_summary(terminalreporter):
+    asset_cache = terminalreporter.config.stash.get(ASSET_CACHE_KEY, None)
+    if asset_cache is not None and asset_cache.total.requests:
+        terminalreporter.section("static asset cache")
+        for line in asset_cache.report_lines():
+            terminalreporter.write_line(line)
+
+    if _profiler is None or not _profiler.run_totals:
+        return
+    terminalreporter.section("page-object hot list")
+    terminalreporter.write_line(f"{'method':<48}{'calls':>7}{'total ms':>11}{'round trips':>13}{'incl. nested':>14}")
+    for name, s in _profiler.hot_list():
+        terminalreporter.write_line(
+            f"{name:<48}{s.calls:>7}{s.seconds * 1000:>11.1f}{s.round_trips:>13}{s.total_round_trips:>14}"
+        )
+
+# --- Per-test durations for the parallel scheduler ---
+_test_durations: dict[str, float] = {}
+
+
+def pytest_runtest_logreport(report):
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + report.duration
+
+
+# --- Persistent timing history ---
+_timing_store: TimingStore | None = None
+_timing_run_id: str | None = None
+_phase_reports_key = pytest.StashKey[dict]()
+
+
+def pytest_sessionstart(session):
+    global _timing_store, _timing_run_id
+    if not session.config.getoption("no_timing_db") and not session.config.option.collectonly:
+        _timing_store = TimingStore(session.config.getoption("timing_db"))
+        _timing_run_id = _timing_store.start_run(
+            worker=os.environ.get("PYTEST_WORKER_ID"), artifact_mode=session.config.getoption("artifact_mode")
+        )
+
+
+def _record_timing(item, report) -> None:
+    phases = item.stash.setdefault(_phase_reports_key, {})
+    phases[report.when] = report
+    if report.when != "teardown" or _timing_store is None:
+        return
+
+    # a failed setup means the test never ran, so its outcome is the setup's
+    outcome = phases["call"].outcome if "call" in phases else phases["setup"].outcome
+    if any(r.failed for r in phases.values()) and outcome == "passed":
+        outcome = "error"
+    _timing_store.record(
+        _timing_run_id,
+        item.nodeid,
+        outcome,
+        setup=phases["setup"].duration if "setup" in phases else 0.0,
+        call=phases["call"].duration if "call" in phases else 0.0,
+        teardown=report.duration,
+        markers=sorted({m.name for m in item.iter_markers() if m.name not in ("parametrize", "usefixtures")}),
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    # every attachment must be on disk before pytest-html writes the report
+    if _artifact_writer is not None:
+        errors = _artifact_writer.close()
+        if _artifact_writer.written or errors:
+            logger.info(
+                "Artifact writer: %d files (%.1f KB), %d duplicate screenshots skipped, %d errors",
+                _artifact_writer.written, _artifact_writer.bytes_written / 1024, _artifact_writer.deduplicated, len(errors),
+            )
+
+    if _timing_store is not None:
+        _timing_store.close()
+
+    durations_file = session.config.getoption("durations_file")
+    if durations_file and _test_durations:
+        Path(durations_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(durations_file, "w", encoding="utf-8") as f:
+            json.dump(_test_durations, f)
+
+
+# --- Checks that fail the test itself: page-load performance budgets, --har-strict ---
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    budget_marker = item.get_closest_marker("perf_budget")
+    if budget_marker is None and not item.config.getoption("perf_metrics"):
+        try:
+            return (yield)
+        finally:
+            # raised here, unmatched requests are a failure of the test, not an error in its teardown
+            fail_on_unmatched(item)
+
+    perf.start_capture()
+    try:
+        result = yield
+    finally:
+        captured = perf.stop_capture()
+        if _timing_store is not None:
+            for metrics in captured:
+                _timing_store.record_page_metrics(_timing_run_id, item.nodeid, metrics.url, metrics.to_dict())
+        fail_on_unmatched(item)
+
+    if budget_marker is not None:
+        if not captured:
+            pytest.fail("perf_budget set but no page load was captured (navigate through BasePage.goto)")
+        violations = perf.check_budget(captured, budget_marker.kwargs)
+        if violations:
+            pytest.fail("Performance budget exceeded:\n  " + "\n  ".join(violations))
+    return result
+
 
 # --- Pytest hook to attach logs/screenshots/videos/network ---
 @pytest.hookimpl(hookwrapper=True)
@@ -53,45 +355,58 @@ def pytest_runtest_makereport(item, call):
     report = outcome.get_result()
     extra = getattr(report, "extra", [])
 
-    if report.when == "call":
-        # Attach log tail
-        log_text = _read_log_file_tail()
-        if log_text:
-            extra.append(extras.text(log_text, name="Test Logs"))
+    # Persist phase durations to the timing database
+    _record_timing(item, report)
 
-        # Screenshot
+    # Failure trace / video are written by the page fixture's teardown (fixtures/browser.py)
+    setattr(item, f"rep_{report.when}", report)
+
+    # Attach this test's own log lines (setup, call and teardown)
+    if report.when == "teardown":
+        log_lines = _test_logs.pop(item.nodeid)
+        if log_lines:
+            extra.append(extras.text("\n".join(log_lines), name="Test Logs"))
+
+        if _profiler is not None and _profiler.test_calls:
+            extra.append(extras.html(_profiler.test_report_html()))
+
+        tracer = tracing.stop_tracing()
+        if tracer is not None and tracer.spans:
+            name = safe_node_name(item.nodeid)
+            chrome = _artifact_writer.save_json(tracing.to_chrome_trace(tracer.spans), SPANS_DIR / f"{name}.trace.json")
+            otlp = _artifact_writer.save_json(tracing.to_otlp(tracer.spans), SPANS_DIR / f"{name}.otlp.json")
+            extra.append(extras.url(chrome.as_uri(), name="Span Timeline (Chrome trace)"))
+            extra.append(extras.url(otlp.as_uri(), name="Spans (OTLP JSON)"))
+
+        # Network summary, written by the network_logger fixture once the test's last request
+        # was recorded; inlined so it survives moving a --self-contained-html report
+        recorder = (item.funcargs or {}).get("network_logger")
+        if recorder is not None and recorder.summary_path.exists():
+            extra.append(extras.json(recorder.summary(), name="Network Summary"))
+
+        if "page" in item.fixturenames:
+            trace = trace_path(item.nodeid)
+            if trace.exists():
+                logger.info("Trace saved, open with: playwright show-trace %s", trace)
+                extra.append(extras.url(trace.as_uri(), name="Failure Trace"))
+            video = video_path(item.nodeid)
+            if video.exists():
+                extra.append(extras.video(str(video), name="Failure Video"))
+
+    if report.when == "call":
+        # Screenshot: only the capture runs here, encoding and the disk write happen on the artifact writer
         if report.failed and "page" in item.funcargs:
             page = item.funcargs["page"]
-            screenshot_path = SCREENSHOT_DIR / f"{item.nodeid.replace('/', '_').replace(':', '_')}.png"
+            fmt = item.config.getoption("screenshot_format")
+            quality = item.config.getoption("screenshot_quality")
             try:
-                page.screenshot(path=str(screenshot_path), full_page=True)
+                capture = capture_format(fmt)
+                data = page.screenshot(
+                    full_page=True, type=capture, quality=quality if capture == "jpeg" else None
+                )
+                screenshot_path = _artifact_writer.save_screenshot(data, SCREENSHOT_DIR, item.nodeid, fmt, quality)
                 extra.append(extras.image(str(screenshot_path), name="Failure Screenshot"))
             except Exception as e:
                 logger.warning(f"Could not capture screenshot: {e}")
 
-        # Video
-        if report.failed and "context" in item.funcargs:
-            context = item.funcargs["context"]
-            try:
-                for p in context.pages:
-                    if p.video:
-                        video_path = Path(p.video.path())
-                        if video_path.exists():
-                            new_path = VIDEO_DIR / f"{item.nodeid.replace('/', '_').replace(':', '_')}.webm"
-                            video_path.rename(new_path)
-                            extra.append(extras.video(str(new_path), name="Failure Video"))
-                            break
-            except Exception as e:
-                logger.warning(f"Could not attach video: {e}")
-
-        # Network logs
-        if "network_logger" in item.funcargs:
-            requests = item.funcargs["network_logger"]
-            if requests:
-                try:
-                    network_dump = json.dumps(requests, indent=2)
-                    extra.append(extras.text(network_dump, name="Network Logs"))
-                except Exception as e:
-                    logger.warning(f"Could not attach network logs: {e}")
-
     report.extra = extra
@@ -0,0 +1,99 @@
+# tests/download_cache_test.py
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from utils.download_cache import DownloadCache
+
+
+@pytest.fixture
+def archive_server(file_server):
+    file_server.files["/repo.zip"] = b"zip v1" * 1000
+    return file_server
+
+
+def test_unchanged_archive_is_revalidated_not_downloaded(archive_server, tmp_path):
+    server = archive_server
+    cache = DownloadCache(tmp_path)
+
+    first = cache.fetch(f"{server.url}/repo.zip")
+    second = cache.fetch(f"{server.url}/repo.zip")
+
+    assert not first.from_cache and second.from_cache
+    assert second.path == first.path and second.path.read_bytes() == server.files["/repo.zip"]
+    assert server.bodies_sent == 1
+    assert (cache.hits, cache.misses, cache.bytes_downloaded) == (1, 1, first.size)
+
+    # a new cache on the same directory (i.e. the next run) revalidates too
+    assert DownloadCache(tmp_path).fetch(f"{server.url}/repo.zip").from_cache
+    assert server.bodies_sent == 1
+
+
+def test_changed_archive_replaces_the_old_blob(archive_server, tmp_path):
+    server = archive_server
+    cache = DownloadCache(tmp_path)
+    old = cache.fetch(f"{server.url}/repo.zip")
+
+    server.files["/repo.zip"] = b"zip v2" * 1000
+    new = cache.fetch(f"{server.url}/repo.zip")
+
+    assert not new.from_cache and new.sha256 != old.sha256
+    assert new.path.read_bytes() == b"zip v2" * 1000
+    assert not old.path.exists()
+
+
+def test_refresh_forces_a_transfer(archive_server, tmp_path):
+    server = archive_server
+    DownloadCache(tmp_path).fetch(f"{server.url}/repo.zip")
+    refreshed = DownloadCache(tmp_path, refresh=True).fetch(f"{server.url}/repo.zip")
+    assert not refreshed.from_cache and server.bodies_sent == 2
+
+
+def test_identical_content_is_stored_once(archive_server, tmp_path):
+    server = archive_server
+    server.files["/mirror.zip"] = server.files["/repo.zip"]
+    cache = DownloadCache(tmp_path)
+
+    a = cache.fetch(f"{server.url}/repo.zip")
+    b = cache.fetch(f"{server.url}/mirror.zip")
+
+    assert a.path == b.path
+    assert len(list(cache.objects.iterdir())) == 1
+
+
+def test_least_recently_used_archives_are_evicted(archive_server, tmp_path):
+    server = archive_server
+    for name in ("a", "b", "c"):
+        server.files[f"/{name}.zip"] = name.encode() * 4000
+    cache = DownloadCache(tmp_path, max_bytes=10_000)
+
+    a = cache.fetch(f"{server.url}/a.zip")
+    b = cache.fetch(f"{server.url}/b.zip")
+    cache.fetch(f"{server.url}/a.zip")  # a is now more recent than b
+    c = cache.fetch(f"{server.url}/c.zip")
+
+    assert a.path.exists() and c.path.exists() and not b.path.exists()
+    assert sum(p.stat().st_size for p in cache.objects.iterdir()) <= 10_000
+    # b was forgotten, so it's a full download again
+    assert not cache.fetch(f"{server.url}/b.zip").from_cache
+
+
+def _fetch_in_worker(root, url):
+    return DownloadCache(root).fetch(url).sha256
+
+
+def test_parallel_workers_keep_a_consistent_index(archive_server, tmp_path):
+    """Separate processes (like parallel_runner workers) don't lose each other's index entries."""
+    server = archive_server
+    urls = []
+    for i in range(8):
+        server.files[f"/repo{i}.zip"] = f"archive {i}".encode() * 2000
+        urls.append(f"{server.url}/repo{i}.zip")
+
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        hashes = list(pool.map(_fetch_in_worker, [tmp_path] * len(urls), urls))
+
+    cache = DownloadCache(tmp_path)
+    index = cache._load_index()
+    assert sorted(index) == sorted(urls)
+    # every blob on disk is accounted for in the index, so the size cap sees it
+    assert sorted(p.name for p in cache.objects.iterdir()) == sorted(hashes)
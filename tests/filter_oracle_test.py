@@ -0,0 +1,101 @@
+# tests/filter_oracle_test.py
+from collections import Counter
+
+import pytest
+from fixtures.catalog import generate_catalog
+from fixtures.filter_oracle import LIVE_SHOP_URL
+from pages.shop_page import ShoppingPage
+from utils.filter_oracle import FilterOracle, SizeFilterExplorer, gray_code_walk, plan_walk
+
+
+def test_oracle_uses_or_semantics_and_caches():
+    oracle = FilterOracle({"Cat Tee": ["S", "M"], "Dog Hoodie": ["L"], "Wolf Polo": ["M", "XL"]}, ["S", "M", "L", "XL"])
+    assert oracle.expected([]) == Counter(["Cat Tee", "Dog Hoodie", "Wolf Polo"])
+    assert oracle.expected(["M"]) == Counter(["Cat Tee", "Wolf Polo"])
+    assert oracle.expected(["S", "L"]) == Counter(["Cat Tee", "Dog Hoodie"])
+    assert oracle.expected_count(["XL", "L"]) == 2
+    assert oracle.expected(["M", "S"]) is oracle.expected({"S", "M"})
+
+
+def test_oracle_from_catalog_matches_products():
+    catalog = generate_catalog(size=50, seed=3)
+    oracle = FilterOracle.from_catalog(catalog)
+    assert oracle.sizes == catalog.sizes
+    assert oracle.expected_count(["XS", "XXL"]) == sum(
+        bool({"XS", "XXL"} & set(p.available_sizes)) for p in catalog.products
+    )
+
+
+def test_gray_code_walk_toggles_one_checkbox_per_step():
+    sizes = ["XS", "S", "M", "L", "XL"]
+    start = frozenset({"M", "XL"})
+    walk = gray_code_walk(sizes, start)
+    assert walk[0] == start
+    assert len(set(walk)) == 2 ** len(sizes)
+    assert all(len(a ^ b) == 1 for a, b in zip(walk, walk[1:]))
+
+
+def test_limited_walk_covers_small_combinations_cheaply():
+    sizes = ["XS", "S", "M", "L", "XL", "XXL"]
+    walk = plan_walk(sizes, max_selected=2)
+    assert set(walk) == {s for s in gray_code_walk(sizes) if len(s) <= 2}
+    toggles = sum(len(a ^ b) for a, b in zip([frozenset()] + walk, walk))
+    # a greedy walk stays well below resetting the filters between every combination
+    assert toggles < sum(2 * len(s) for s in walk)
+
+
+class _FakeSection:
+    """Stands in for ProductSection; `and_semantics` mimics a broken multi-size filter."""
+
+    def __init__(self, catalog, and_semantics=False):
+        self.catalog, self.and_semantics, self.selected = catalog, and_semantics, set()
+        self.settles = []  # (description, grid changed, no_change_ms)
+
+    def get_selected_sizes(self): return sorted(self.selected)
+    def select_size(self, size): self.selected.add(size)
+    def deselect_size(self, size): self.selected.discard(size)
+    def settle_after(self, action, description, no_change_ms=None):
+        before = self.get_product_titles()
+        action()
+        self.settles.append((description, before != self.get_product_titles(), no_change_ms))
+    def get_displayed_product_count(self): return len(self.get_product_titles())
+
+    def get_product_titles(self):
+        match = (lambda s: self.selected <= s) if self.and_semantics else (lambda s: self.selected & s)
+        return [p.title for p in self.catalog.products if not self.selected or match(set(p.available_sizes))]
+
+
+def test_explorer_walks_every_combination_and_catches_wrong_semantics():
+    catalog = generate_catalog(size=30, seed=1)
+    oracle = FilterOracle.from_catalog(catalog)
+
+    section = _FakeSection(catalog)
+    report = SizeFilterExplorer(section, oracle).explore()
+    assert (report.checked, report.toggles, report.mismatches) == (2 ** len(catalog.sizes), 2 ** len(catalog.sizes) - 1, [])
+    # a toggle may only pass without a re-render when the products really stay the same
+    assert all((no_change_ms is None) == changed for _, changed, no_change_ms in section.settles)
+
+    report = SizeFilterExplorer(_FakeSection(catalog, and_semantics=True), oracle).explore(max_selected=2)
+    assert report.mismatches and all(len(m.selected) == 2 for m in report.mismatches)
+
+
+@pytest.mark.local_shop
+def test_size_filter_combinations_against_catalog(page, shop_server, shop_filter_oracle):
+    shopping_page = ShoppingPage(page)
+    shopping_page.goto(shop_server.url)
+    section = shopping_page.product_list_section
+
+    report = SizeFilterExplorer(section, shop_filter_oracle).explore(max_selected=3)
+    assert report.mismatches == []
+    assert report.checked >= len(plan_walk(shop_filter_oracle.sizes, max_selected=3))
+
+
+@pytest.mark.product_list
+def test_size_filter_combinations_on_live_demo(page, live_filter_oracle):
+    """The oracle is learned from single sizes, so this checks how the live filter combines them."""
+    shopping_page = ShoppingPage(page)
+    shopping_page.goto(LIVE_SHOP_URL)
+    section = shopping_page.product_list_section
+
+    report = SizeFilterExplorer(section, live_filter_oracle).explore(max_selected=2)
+    assert report.mismatches == []
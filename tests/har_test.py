@@ -0,0 +1,48 @@
+# tests/har_test.py
+import pytest
+from fixtures.har import HarArchive, HarResponse, fail_on_unmatched
+
+
+def test_har_archive_round_trip(tmp_path):
+    """Recorded responses survive a save/load cycle and are matched by method + url."""
+    archive = HarArchive()
+    archive.add(
+        "GET",
+        "https://automated-test-evaluation.web.app/",
+        HarResponse(
+            status=200,
+            status_text="OK",
+            headers={"content-type": "text/html", "content-encoding": "gzip", "content-length": "99"},
+            body=b"<html>shop</html>",
+            mime_type="text/html",
+        ),
+    )
+    archive.add(
+        "GET",
+        "https://automated-test-evaluation.web.app/",
+        HarResponse(status=500, status_text="Error", headers={}, body=b"later"),
+    )
+    har_path = tmp_path / "shop_app.har"
+    archive.save(har_path)
+
+    replayed = HarArchive.load(har_path)
+    assert len(replayed) == 1
+
+    response = replayed.match("get", "https://automated-test-evaluation.web.app/")
+    assert response.status == 200
+    assert response.body == b"<html>shop</html>"
+    # wire encoding headers are dropped because bodies are stored decoded
+    assert response.headers == {"content-type": "text/html"}
+
+    assert replayed.match("POST", "https://automated-test-evaluation.web.app/") is None
+
+
+def test_strict_replay_reports_unmatched_requests_once():
+    class Node:
+        har_unmatched = ["GET https://shop/missing.js"]
+
+    node = Node()
+    with pytest.raises(pytest.fail.Exception, match="1 request"):
+        fail_on_unmatched(node)
+    fail_on_unmatched(node)  # already reported, so teardown doesn't fail the test a second time
+    fail_on_unmatched(object())  # tests without HAR routing
@@ -0,0 +1,47 @@
+# tests/instrumentation_test.py
+from utils.instrumentation import OUTSIDE, PageObjectProfiler, page_object_classes
+
+
+class _Section:
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def is_checked(self):
+        self.profiler.on_round_trip("Frame.isChecked", 0.01)
+
+    def deselect_all(self):
+        for _ in range(3):
+            self.is_checked()
+        self.profiler.on_round_trip("Frame.click", 0.02)
+
+
+def test_round_trips_are_charged_to_the_innermost_method():
+    profiler = PageObjectProfiler()
+    profiler.install([_Section])
+    try:
+        section = _Section(profiler)
+        profiler.start_test()
+        section.deselect_all()
+        profiler.on_round_trip("Page.goto", 0.1)  # straight from the test
+    finally:
+        profiler.uninstall()
+
+    calls = profiler.test_calls
+    outer, inner = ("_Section.deselect_all",), ("_Section.deselect_all", "_Section.is_checked")
+    assert calls[outer].round_trips == 1 and calls[outer].total_round_trips == 4
+    assert calls[inner].calls == 3 and calls[inner].round_trips == 3
+    assert calls[(OUTSIDE,)].round_trips == 1
+    assert [path for path, _ in profiler.test_rows()] == [outer, inner, (OUTSIDE,)]
+    assert "&nbsp;&nbsp;&nbsp;&nbsp;_Section.is_checked" in profiler.test_report_html()
+
+    hot = dict(profiler.hot_list())
+    assert set(hot) == {"_Section.deselect_all", "_Section.is_checked"}
+    assert hot["_Section.deselect_all"].total_round_trips == 4
+    assert hot["_Section.deselect_all"].seconds >= hot["_Section.is_checked"].seconds
+    # uninstall puts the original methods back
+    assert not hasattr(_Section.deselect_all, "__wrapped__")
+
+
+def test_page_object_classes_cover_pages_package():
+    names = {cls.__name__ for cls in page_object_classes()}
+    assert {"BasePage", "ShoppingPage", "ProductSection", "CartSection", "GitHubRepoPage"} <= names
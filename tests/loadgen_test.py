@@ -0,0 +1,66 @@
+# tests/loadgen_test.py
+import json
+import random
+
+import pytest
+from fixtures.async_browser import async_test
+from tools.loadgen import Arrival, LoadReport, StepResult, arrival_times, run_load
+
+
+def test_arrivals_ramp_up_then_hold_the_rate():
+    flat = arrival_times(5, rate=2.0)
+    assert flat == pytest.approx([0.0, 0.5, 1.0, 1.5, 2.0])
+
+    ramped = arrival_times(30, rate=4.0, ramp_up=5.0)
+    gaps = [b - a for a, b in zip(ramped, ramped[1:])]
+    # 10 users arrive during the ramp, gaps shrink towards 1/rate and stay there
+    assert ramped[10] == pytest.approx(5.0)
+    assert all(a >= b - 1e-9 for a, b in zip(gaps[:10], gaps[1:11]))
+    assert gaps[-1] == pytest.approx(0.25)
+
+
+def test_poisson_arrivals_are_seeded_and_keep_the_average_rate():
+    a = arrival_times(2000, rate=10.0, rng=random.Random(1))
+    assert a == arrival_times(2000, rate=10.0, rng=random.Random(1))
+    assert a[-1] == pytest.approx(200.0, rel=0.1)
+
+
+def test_report_percentiles_and_error_rate():
+    results = [StepResult(user, "load", seconds) for user, seconds in enumerate([0.1, 0.2, 0.3, 0.4])]
+    results += [StepResult(0, "filter", 0.05), StepResult(1, "filter", 1.0, error="TimeoutError: boom")]
+    report = LoadReport(users=4, elapsed=2.0, results=results).to_dict()
+    assert report["failed_users"] == 1
+    assert report["error_rate"] == pytest.approx(1 / 6, abs=1e-4)
+    assert report["users_per_s"] == 1.5
+    assert report["steps"]["load"]["p50_ms"] == 250.0
+    assert report["steps"]["filter"] == {
+        "count": 2, "errors": 1, "p50_ms": 50.0, "p90_ms": 50.0, "p95_ms": 50.0, "p99_ms": 50.0, "max_ms": 50.0,
+    }
+    assert report["errors"] == ["filter: TimeoutError: boom"]
+
+
+def test_report_is_valid_json_when_every_run_of_a_step_failed():
+    results = [StepResult(0, "load", 0.1), StepResult(0, "filter", 5.0, error="TimeoutError: boom")]
+    report = LoadReport(users=1, elapsed=1.0, results=results).to_dict()
+    assert report["steps"]["filter"]["p50_ms"] is None and report["steps"]["filter"]["max_ms"] is None
+    assert json.loads(json.dumps(report, allow_nan=False)) == report
+
+
+def test_queue_wait_and_achieved_rate_expose_a_saturated_concurrency_cap():
+    # scheduled every 0.5s (2/s), but a full cap let them start only every second
+    arrivals = [Arrival(user, scheduled=user * 0.5, started=user * 1.0) for user in range(5)]
+    report = LoadReport(users=5, elapsed=6.0, arrivals=arrivals, target_rate=2.0).to_dict()
+    assert report["arrival_rate"] == {"target": 2.0, "scheduled": 2.0, "achieved": 1.0}
+    assert report["queue_wait"]["p50_ms"] == 1000.0 and report["queue_wait"]["max_ms"] == 2000.0
+
+
+@pytest.mark.local_shop
+@async_test
+async def test_load_against_local_shop(async_browser, shop_server):
+    report = await run_load(async_browser, shop_server.url, users=6, rate=20.0, ramp_up=0.2, concurrency=3)
+    stats = report.step_stats()
+    assert report.error_rate == 0, report.to_dict()["errors"]
+    assert [stats[step]["count"] for step in stats] == [6] * 5
+    # concurrency 3 for 6 users: half of them queue, and the load step is timed from the scheduled arrival
+    assert len(report.arrivals) == 6
+    assert stats["load"]["max_ms"] >= max(a.queue_wait for a in report.arrivals) * 1000
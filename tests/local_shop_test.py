@@ -0,0 +1,69 @@
+# tests/local_shop_test.py
+import json
+import urllib.request
+
+import pytest
+from playwright.sync_api import expect
+from fixtures.catalog import generate_catalog
+from pages.shop_page import ShoppingPage
+
+
+def test_catalog_generator_is_seeded():
+    """Same seed -> same catalog; the size weights and price range are honoured."""
+    catalog = generate_catalog(size=200, seed=7, size_weights={"S": 1, "M": 3, "L": 0}, price_range=(5, 20))
+    assert catalog.to_dict() == generate_catalog(
+        size=200, seed=7, size_weights={"S": 1, "M": 3, "L": 0}, price_range=(5, 20)
+    ).to_dict()
+    assert catalog.to_dict() != generate_catalog(size=200, seed=8).to_dict()
+
+    assert catalog.sizes == ["S", "M"]
+    assert all(5 <= p.price <= 20 for p in catalog.products)
+    assert all(set(p.available_sizes) <= {"S", "M"} for p in catalog.products)
+
+    # page objects match titles with has-text, so no title may contain another
+    titles = [p.title for p in catalog.products]
+    assert not any(a != b and a in b for a in titles for b in titles)
+
+
+def test_shop_server_serves_catalog(shop_server):
+    with urllib.request.urlopen(shop_server.url + "api/products.json") as response:
+        served = json.load(response)
+    assert served == shop_server.catalog.to_dict()
+
+    with urllib.request.urlopen(shop_server.url) as response:
+        html = response.read().decode("utf-8")
+    assert "<title>Typescript React Shopping cart</title>" in html
+
+
+@pytest.mark.local_shop
+def test_page_objects_against_local_shop(page, shop_server):
+    """ShoppingPage, ProductSection and CartSection work unchanged against the stand-in."""
+    catalog = shop_server.catalog
+    shopping_page = ShoppingPage(page)
+    shopping_page.goto(shop_server.url)
+    shopping_page.verify_page_loaded()
+
+    section = shopping_page.product_list_section
+    section.verify_section_visible()
+    assert section.count_products() == len(catalog)
+    assert section.get_available_sizes() == catalog.sizes
+
+    size = catalog.sizes[0]
+    section.select_size(size)
+    expected = [p for p in catalog.products if size in p.available_sizes]
+    expect(section.product_cards).to_have_count(len(expected))
+    assert section.get_displayed_product_count() == len(expected)
+    assert [p.title for p in section.get_all_products_bulk()] == [p.title for p in expected]
+
+    section.click_add_to_cart(0)
+    expect(shopping_page.cart_quantity).to_have_text("1")
+    shopping_page.cart_section.open_cart()
+    shopping_page.cart_section.increase_quantity(expected[0].title, 2)
+    expect(shopping_page.cart_quantity).to_have_text("3")
+
+    snapshot = shopping_page.cart_section.get_snapshot()
+    assert [item.title for item in snapshot.items] == [expected[0].title]
+    assert snapshot.total_price == round(expected[0].price * 3, 2)
+
+    alert_message = shopping_page.cart_section.click_checkout(capture_alert=True)
+    assert alert_message == f"Checkout - Subtotal: $ {expected[0].price * 3:.2f}"
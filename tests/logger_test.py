@@ -0,0 +1,70 @@
+# tests/logger_test.py
+import logging
+import logging.handlers
+import threading
+from utils.artifacts import LOG_FILE
+from utils import logger as log_utils
+from utils.logger import get_logger, flush_logging
+
+
+class _GatedHandler(logging.Handler):
+    """Blocks the listener thread until `gate` is set, recording what it was given."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.gate.wait(timeout=5)
+        self.messages.append(record.getMessage())
+
+
+def test_get_logger_is_cached_and_file_writes_are_queued():
+    logger = get_logger("LoggerTest")
+    assert get_logger("LoggerTest") is logger
+    assert any(isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers)
+
+    logger.info("queued message %s", "abc123")
+    flush_logging()
+    assert "LoggerTest: queued message abc123" in LOG_FILE.read_text(encoding="utf-8")
+
+
+def test_file_handlers_run_on_the_listener_thread(monkeypatch):
+    logger = get_logger("LoggerTest")
+    root = logging.getLogger()
+    queue_handlers = [h for h in root.handlers if isinstance(h, logging.handlers.QueueHandler)]
+    log_utils.configure_logging()  # a second call must not stack another queue handler
+    assert len(queue_handlers) == 1
+    assert [h for h in root.handlers if isinstance(h, logging.handlers.QueueHandler)] == queue_handlers
+
+    gated = _GatedHandler()
+    listener = log_utils._listener
+    monkeypatch.setattr(listener, "handlers", (*listener.handlers, gated))
+    logger.info("behind the gate")
+    assert gated.messages == []  # the caller returned while the listener is still blocked
+
+    gated.gate.set()
+    flush_logging()
+    assert "behind the gate" in gated.messages
+
+
+def test_log_capture_keeps_a_bounded_buffer_per_test():
+    capture = log_utils.PerTestLogBuffer(capacity=3)
+    logger = logging.getLogger("LoggerTest.capture")
+    logger.addHandler(capture)
+    try:
+        logger.info("before any test")
+        capture.start("tests/a_test.py::test_a")
+        for i in range(5):
+            logger.info("line %d", i)
+        capture.start("tests/b_test.py::test_b")
+        logger.warning("only in b")
+        a_lines = capture.pop("tests/a_test.py::test_a")
+        b_lines = capture.pop("tests/b_test.py::test_b")
+    finally:
+        logger.removeHandler(capture)
+
+    assert [line.split(": ", 1)[1] for line in a_lines] == ["line 2", "line 3", "line 4"]
+    assert len(b_lines) == 1 and "[WARNING] LoggerTest.capture: only in b" in b_lines[0]
+    assert capture.pop("tests/a_test.py::test_a") == []
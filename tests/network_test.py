@@ -0,0 +1,41 @@
+# tests/network_test.py
+import json
+from fixtures.network import NetworkRecorder, timing_breakdown
+
+
+def _entry(url, total, resource_type="script", body=100, failure=None):
+    headers = 0 if failure else 100
+    return {
+        "url": url, "method": "GET", "resource_type": resource_type, "status": None if failure else 200,
+        "failure": failure, "request_body_bytes": 0, "request_headers_bytes": headers,
+        "response_body_bytes": body, "response_headers_bytes": headers,
+        "timing": {"dns": None, "connect": None, "tls": None, "ttfb": None, "download": None, "total": total},
+    }
+
+
+def test_timing_breakdown_skips_phases_that_did_not_happen():
+    timing = {
+        "startTime": 1000.0, "domainLookupStart": -1, "domainLookupEnd": -1, "connectStart": 1.0,
+        "secureConnectionStart": 3.0, "connectEnd": 9.0, "requestStart": 9.5, "responseStart": 40.0, "responseEnd": 55.25,
+    }
+    assert timing_breakdown(timing) == {
+        "dns": None, "connect": 8.0, "tls": 6.0, "ttfb": 30.5, "download": 15.25, "total": 55.25,
+    }
+
+
+def test_recorder_streams_jsonl_and_summarises(tmp_path):
+    recorder = NetworkRecorder(tmp_path / "test_x.jsonl", keep_slowest=2)
+    recorder.add(_entry("https://shop/app.js", 10.0))
+    recorder.add(_entry("https://shop/api", 80.0, resource_type="fetch", body=1000))
+    # lines are on disk before the test finishes
+    assert len((tmp_path / "test_x.jsonl").read_text().splitlines()) == 2
+    recorder.add(_entry("https://shop/big.png", 40.0, resource_type="image"))
+    recorder.add(_entry("https://shop/missing.css", None, resource_type="stylesheet", body=0, failure="net::ERR_FAILED"))
+    recorder.close()
+
+    summary = json.loads(recorder.summary_path.read_text())
+    assert recorder.summary_path == tmp_path / "test_x.summary.json"
+    assert len(recorder) == 4 and summary["requests"] == 4 and summary["failed"] == 1
+    assert summary["bytes_by_resource_type"] == {"fetch": 1200, "image": 300, "script": 300, "stylesheet": 0}
+    assert summary["total_bytes"] == 1800
+    assert [s["url"] for s in summary["slowest"]] == ["https://shop/api", "https://shop/big.png"]
@@ -0,0 +1,34 @@
+# tests/parallel_runner_test.py
+from tools.parallel_runner import schedule, merge_history, value_options, worker_args
+
+
+def test_lpt_schedule_balances_by_history():
+    durations = {"a": 10.0, "b": 7.0, "c": 6.0, "d": 5.0, "e": 4.0}
+    plans = schedule(list(durations), durations, workers=2)
+
+    assert sorted(n for p in plans for n in p.nodeids) == sorted(durations)
+    # LPT: a|b, c->b(13), d->a(15), e->b(17)
+    assert [p.nodeids for p in plans] == [["a", "d"], ["b", "c", "e"]]
+    assert [p.predicted for p in plans] == [15.0, 17.0]
+
+
+def test_unknown_tests_cost_the_mean_of_known_ones():
+    plans = schedule(["slow", "new"], {"slow": 4.0, "other": 2.0}, workers=1)
+    assert plans[0].nodeids == ["slow", "new"]
+    assert plans[0].predicted == 7.0
+
+
+def test_history_is_smoothed():
+    merged = merge_history({"a": 10.0, "b": 2.0}, {"a": 20.0, "c": 1.0})
+    assert merged == {"a": 15.0, "b": 2.0, "c": 1.0}
+
+
+def test_worker_args_keep_option_values_and_drop_test_paths():
+    args = ["tests/har_test.py", "--har-path", "artifacts", "-m", "smoke", "tests/cart_test.py::test_cart",
+            "--headed", "-kcart", "--shop-seed=3", "-x", "tests"]
+    takes_value = value_options(args)
+    assert {"--har-path", "-m", "--shop-seed"} <= takes_value and "--headed" not in takes_value
+
+    assert worker_args(args, takes_value) == [
+        "--har-path", "artifacts", "-m", "smoke", "--headed", "-kcart", "--shop-seed=3", "-x",
+    ]
@@ -0,0 +1,75 @@
+# tests/perf_test.py
+import pytest
+from pages.shop_page import ShoppingPage
+from utils import perf
+from utils.perf import PageMetrics, check_budget
+from utils.timing_db import TimingStore
+
+
+def test_check_budget_reports_each_exceeded_metric():
+    fast = PageMetrics(url="http://shop/", lcp_ms=800.0, transfer_kb=120.0)
+    slow = PageMetrics(url="http://shop/slow", lcp_ms=3100.0, transfer_kb=900.0, fcp_ms=None)
+
+    assert check_budget([fast], {"lcp_ms": 2500, "transfer_kb": 500}) == []
+    assert check_budget([fast, slow], {"lcp_ms": 2500, "transfer_kb": 500, "fcp_ms": 1000}) == [
+        "http://shop/slow: lcp_ms=3100.00 exceeds budget 2500",
+        "http://shop/slow: transfer_kb=900.00 exceeds budget 500",
+    ]
+    with pytest.raises(ValueError, match="lcp"):
+        check_budget([fast], {"lcp": 2500})
+
+
+def test_transfer_budget_fails_when_responses_were_fulfilled_by_a_route():
+    replayed = PageMetrics(url="http://shop/", transfer_kb=None, unmeasured_resources=4)
+    assert check_budget([replayed], {"lcp_ms": 2500}) == []
+    assert check_budget([replayed], {"transfer_kb": 500}) == [
+        "http://shop/: transfer_kb not measured, 4 response(s) were fulfilled by a route handler "
+        "(HAR replay, asset cache, ...)",
+    ]
+    assert "unmeasured_resources" not in perf.BUDGET_METRICS
+
+
+class _Context:
+    pass
+
+
+class _Page:
+    def __init__(self):
+        self.context = _Context()
+
+
+def test_routed_pages_are_registered_by_the_route_fixtures():
+    page = _Page()
+    assert not perf.is_routed(page)
+
+    perf.mark_routed(page)  # HAR routing on the page
+    perf.mark_routed(page.context)  # asset cache on its context
+    assert perf.is_routed(page)
+    perf.unmark_routed(page)
+    assert perf.is_routed(page)
+    perf.unmark_routed(page.context)
+    assert not perf.is_routed(page)
+
+
+def test_page_metrics_history_per_url(tmp_path):
+    store = TimingStore(tmp_path / "timings.sqlite3")
+    try:
+        for lcp in (100.0, 200.0, 300.0):
+            run_id = store.start_run(git_rev="abc")
+            store.record_page_metrics(run_id, "tests/x_test.py::test_x", "http://shop/",
+                                      PageMetrics(url="http://shop/", lcp_ms=lcp).to_dict())
+        [stats] = store.page_metric_stats("lcp_ms")
+        assert (stats.nodeid, stats.runs, stats.p50, stats.last) == ("http://shop/", 3, 200.0, 300.0)
+        # metrics that weren't measured (None) aren't stored
+        assert store.page_metric_stats("js_heap_mb") == []
+    finally:
+        store.close()
+
+
+@pytest.mark.local_shop
+@pytest.mark.perf_budget(lcp_ms=5000, transfer_kb=2048, cls=0.1)
+def test_local_shop_page_load_budget(page, shop_server):
+    shopping_page = ShoppingPage(page)
+    shopping_page.goto(shop_server.url)
+    shopping_page.verify_page_loaded()
+    assert perf.capturing()
@@ -27,3 +27,21 @@ def test_dynamic_product_filters(page, network_logger):
     # Log results for each size filter
     for size, count in results.items():
         shopping_page.logger.info(f"Size '{size}': {count} products displayed")
+
+
+@pytest.mark.product_list
+def test_bulk_product_snapshot_matches_get_all_products(page):
+    """
+    The single round-trip snapshot must return exactly what get_all_products returns,
+    both unfiltered and with a size filter applied.
+    """
+    shopping_page = ShoppingPage(page)
+    shopping_page.goto("https://automated-test-evaluation.web.app/")
+    shopping_page.verify_page_loaded()
+
+    section = shopping_page.product_list_section
+    section.verify_section_visible()
+    assert section.get_all_products_bulk() == section.get_all_products()
+
+    section.select_size("M")
+    assert section.get_all_products_bulk() == section.get_all_products()
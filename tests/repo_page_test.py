@@ -1,9 +1,7 @@
 # tests/test_login.py
-import os
 import pytest
 from pages.shop_page import ShoppingPage
 from pages.repo_page import GitHubRepoPage
-from tests.conftest import DOWNLOADS_DIR
 from playwright.sync_api import Page, Locator, expect, Download,sync_playwright, TimeoutError
 
 
@@ -35,7 +33,7 @@ def test_repo_page_accessibility(page):
 
 @pytest.mark.usefixtures("network_logger")
 @pytest.mark.download
-def test_repo_page_download(page):
+def test_repo_page_download(page, download_cache):
     """
     Verify that the GitHub repo page allows downloading
     a ZIP file and that it contains a README.md file.
@@ -56,10 +54,37 @@ def test_repo_page_download(page):
 
     repo_page.logger.info("Downloading repo ZIP and verifying its contents...")
 
-    # Download ZIP
-    downloaded_file_path = os.path.join(DOWNLOADS_DIR, "downloaded_repo.zip")
-    download = repo_page.download_zip(downloaded_file_path)
-    assert os.path.exists(downloaded_file_path), "ZIP file was not saved"
+    # Fetched through the download cache: a repeat run only revalidates the archive
+    # (--refresh-downloads forces a new transfer)
+    cached = repo_page.download_zip_cached(download_cache)
+    assert cached.path.exists(), "ZIP file was not saved"
 
     # Verify README.md is inside the ZIP
-    repo_page.verify_zip_contains_file(downloaded_file_path, "README.md")
+    repo_page.verify_zip_contains_file(cached.path, "README.md")
+
+
+@pytest.mark.usefixtures("network_logger")
+@pytest.mark.download
+def test_repo_page_browser_download(page, tmp_path):
+    """The Download ZIP link itself hands the browser the archive (saved per test, not kept between runs)."""
+    repo_page = GitHubRepoPage(page)
+    repo_page.go_to("https://github.com/jeffersonRibeiro/react-shopping-cart")
+    expect(repo_page.code_button).to_be_visible(timeout=5000)
+    repo_page.open_code_menu()
+
+    zip_path = tmp_path / "repo.zip"
+    repo_page.download_zip(str(zip_path))
+    repo_page.verify_zip_contains_file(zip_path, "README.md")
+
+
+@pytest.mark.usefixtures("network_logger")
+@pytest.mark.download
+def test_repo_zip_contents_without_download(page):
+    """Check the archive behind Download ZIP through its central directory only, nothing saved to disk."""
+    repo_page = GitHubRepoPage(page)
+    repo_page.go_to("https://github.com/jeffersonRibeiro/react-shopping-cart")
+    expect(repo_page.code_button).to_be_visible(timeout=5000)
+
+    repo_page.verify_remote_zip_contains_file("README.md")
+    # every further check is a lookup in the cached manifest
+    assert "package.json" in repo_page.get_remote_zip_manifest(repo_page.zip_download_url())
@@ -0,0 +1,73 @@
+# tests/timing_db_test.py
+import pytest
+from utils.timing_db import TimingStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TimingStore(tmp_path / "timings.sqlite3")
+    yield store
+    store.close()
+
+
+def test_percentiles_and_slowest(store):
+    for rev, totals in (("aaa111", [1.0, 2.0, 3.0]), ("bbb222", [10.0])):
+        for total in totals:
+            run_id = store.start_run(git_rev=rev)
+            store.record(run_id, "tests/a_test.py::test_a", "passed", setup=0.5, call=total - 0.5, markers=["ui"])
+            store.record(run_id, "tests/b_test.py::test_b", "passed", call=0.1)
+    store.record(store.start_run(git_rev="bbb222"), "tests/b_test.py::test_b", "failed", call=99.0)
+
+    stats = {s.nodeid: s for s in store.duration_stats()}
+    assert stats["tests/a_test.py::test_a"].runs == 4
+    assert stats["tests/a_test.py::test_a"].p50 == pytest.approx(2.5)
+    assert stats["tests/a_test.py::test_a"].p95 == pytest.approx(8.95)
+    # failed runs don't count toward the timing history
+    assert stats["tests/b_test.py::test_b"].runs == 4
+
+    per_rev = [(s.git_rev, s.p50) for s in store.duration_stats("tests/a_test.py::test_a", by_rev=True)]
+    assert per_rev == [("aaa111", pytest.approx(2.0)), ("bbb222", pytest.approx(10.0))]
+
+    assert [s.nodeid for s in store.slowest(1)] == ["tests/a_test.py::test_a"]
+
+
+def test_regressions_compare_latest_run_with_history(store):
+    for total in (1.0, 1.1, 0.9, 1.0, 1.5):
+        store.record(store.start_run(git_rev="abc"), "tests/slow_test.py::test_slow", "passed", call=total)
+    for total in (2.0, 2.0, 2.1, 2.0):
+        store.record(store.start_run(git_rev="abc"), "tests/flat_test.py::test_flat", "passed", call=total)
+
+    found = store.regressions(threshold=0.2)
+    assert [r.nodeid for r in found] == ["tests/slow_test.py::test_slow"]
+    assert found[0].baseline == pytest.approx(1.0)
+    assert found[0].change == pytest.approx(0.5)
+
+    assert store.regressions(threshold=0.6) == []
+    assert store.regressions(threshold=0.2, min_runs=5) == []
+
+
+def test_mode_comparison(store):
+    for mode, totals in (("video", [3.0, 3.4]), ("trace", [2.0, 2.2]), ("off", [1.0])):
+        for total in totals:
+            run_id = store.start_run(git_rev="abc", artifact_mode=mode)
+            store.record(run_id, "tests/a_test.py::test_a", "passed", call=total)
+            store.record(run_id, f"tests/{mode}_test.py::test_only_{mode}", "passed", call=total)
+
+    [comparison] = store.mode_comparison("video", "trace")
+    assert comparison.nodeid == "tests/a_test.py::test_a"
+    assert comparison.saved == pytest.approx(3.2 - 2.1)
+
+
+def test_history_is_not_mixed_across_artifact_modes(store):
+    for mode, total in (("trace", 1.0), ("trace", 1.1), ("trace", 0.9), ("video", 3.0), ("trace", 1.0)):
+        store.record(store.start_run(git_rev="abc", artifact_mode=mode), "tests/a_test.py::test_a", "passed", call=total)
+
+    # neither the video run nor the trace run after it is a change in the test itself
+    assert store.regressions(threshold=0.2) == []
+    [trace] = store.duration_stats(artifact_mode="trace")
+    assert (trace.runs, trace.last) == (4, 1.0)
+    assert store.slowest(artifact_mode="video")[0].p50 == 3.0
+
+    store.record(store.start_run(git_rev="abc", artifact_mode="trace"), "tests/a_test.py::test_a", "passed", call=2.0)
+    [found] = store.regressions(threshold=0.2, artifact_mode="trace")
+    assert (found.artifact_mode, found.baseline) == ("trace", pytest.approx(1.0))
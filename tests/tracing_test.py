@@ -0,0 +1,67 @@
+# tests/tracing_test.py
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from utils import tracing
+from utils.tracing import traced
+
+
+class _Section:
+    @traced(attributes=("size", "timeout"))
+    def select(self, size, timeout=5000):
+        return self.settle()
+
+    @traced(record_result=True)
+    def settle(self):
+        with tracing.span("poll", attempt=1) as s:
+            s.set("mutations", 3)
+        return 42
+
+    @traced()
+    def fail(self):
+        raise PlaywrightTimeoutError("Timeout 5000ms exceeded.\ncall log: ...")
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.start_tracing()
+    yield tracer
+    tracing.stop_tracing()
+
+
+def test_disabled_tracing_records_nothing():
+    assert tracing.stop_tracing() is None
+    assert tracing.span("anything", x=1) is tracing._NOOP
+    assert _Section().select("M") == 42
+
+
+def test_spans_nest_and_carry_attributes(tracer):
+    _Section().select("M")
+    with pytest.raises(PlaywrightTimeoutError):
+        _Section().fail()
+
+    spans = {s.name: s for s in tracer.spans}
+    select, settle, poll = spans["_Section.select"], spans["_Section.settle"], spans["poll"]
+    assert select.parent_id is None and settle.parent_id == select.span_id and poll.parent_id == settle.span_id
+    assert select.attributes == {"size": "M", "timeout": 5000, "outcome": "ok"}
+    assert settle.attributes["result"] == 42 and poll.attributes["mutations"] == 3
+    assert select.start_ns <= settle.start_ns <= poll.start_ns <= poll.end_ns <= settle.end_ns <= select.end_ns
+
+    failed = spans["_Section.fail"]
+    assert failed.attributes["outcome"] == "timeout"
+    assert failed.attributes["exception.message"] == "Timeout 5000ms exceeded."
+
+
+def test_exporters(tracer):
+    _Section().select("XL")
+    spans = tracer.spans
+
+    chrome = tracing.to_chrome_trace(spans)["traceEvents"]
+    assert [e["name"] for e in chrome] == ["_Section.select", "_Section.settle", "poll"]
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in chrome)
+    assert chrome[0]["args"]["size"] == "XL"
+
+    otlp = tracing.to_otlp(spans)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert {s["traceId"] for s in otlp} == {tracer.trace_id}
+    assert "parentSpanId" not in otlp[0] and otlp[1]["parentSpanId"] == otlp[0]["spanId"]
+    assert {"key": "timeout", "value": {"intValue": "5000"}} in otlp[0]["attributes"]
+    assert otlp[0]["status"] == {"code": 1}
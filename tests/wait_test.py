@@ -0,0 +1,34 @@
+# tests/wait_test.py
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from utils import wait
+
+# the grid re-renders `delay` ms after the click, like a filter under a loaded CI machine
+_LATE_RENDER_HTML = """
+<div id="grid"><p>16 Product(s) found</p></div>
+<button onclick="setTimeout(() => {
+    document.querySelector('#grid').innerHTML = '<p>5 Product(s) found</p>';
+}, Number(this.dataset.delay))" data-delay="300">filter</button>
+<button id="noop">no-op</button>
+"""
+
+
+def test_settle_after_waits_for_a_late_rerender(page):
+    page.set_content(_LATE_RENDER_HTML)
+    grid = page.locator("#grid")
+
+    result = wait.settle_after(grid, lambda: page.click("text=filter"))
+
+    assert grid.inner_text() == "5 Product(s) found"
+    assert result.mutations >= 1 and result.elapsed_ms >= 300
+
+
+def test_settle_after_an_action_that_changes_nothing(page):
+    page.set_content(_LATE_RENDER_HTML)
+    grid = page.locator("#grid")
+
+    with pytest.raises(PlaywrightTimeoutError, match="did not change"):
+        wait.settle_after(grid, lambda: page.click("#noop"), timeout=500)
+
+    result = wait.settle_after(grid, lambda: page.click("#noop"), no_change_ms=100)
+    assert result.mutations == 0
@@ -0,0 +1,97 @@
+# tests/zip_manifest_test.py
+import io
+import os
+import zipfile
+
+import pytest
+from pages.repo_page import GitHubRepoPage
+from utils.zip_manifest import manifest_from_bytes, manifest_from_file, manifest_from_url
+
+
+def _make_zip(files: int = 300, blob_kb: int = 256) -> bytes:
+    """A GitHub-style archive: everything under one top folder, a few big incompressible blobs."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("react-shopping-cart-main/", "")
+        zf.writestr("react-shopping-cart-main/README.md", "# shop\n")
+        zf.writestr("react-shopping-cart-main/src/ünïcode.ts", "export {}\n")
+        for i in range(files):
+            zf.writestr(f"react-shopping-cart-main/src/components/Item{i}/index.tsx", f"// {i}\n")
+        for i in range(8):
+            zf.writestr(f"react-shopping-cart-main/public/img{i}.bin", os.urandom(blob_kb * 1024))
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def archive() -> bytes:
+    return _make_zip()
+
+
+@pytest.fixture
+def zip_server(file_server, archive):
+    """Serves the archive at /repo.zip; /no-range.zip ignores Range headers."""
+    file_server.files.update({"/repo.zip": archive, "/no-range.zip": archive})
+    file_server.no_range.add("/no-range.zip")
+    return file_server
+
+
+def test_manifest_matches_zipfile_namelist(archive, tmp_path):
+    expected = zipfile.ZipFile(io.BytesIO(archive)).namelist()
+    path = tmp_path / "repo.zip"
+    path.write_bytes(archive)
+
+    for manifest in (manifest_from_bytes(archive), manifest_from_file(path)):
+        assert manifest.names == expected
+        assert "README.md" in manifest and "react-shopping-cart-main/README.md" in manifest
+        assert "ünïcode.ts" in manifest
+        assert "react-shopping-cart-main" not in manifest  # directories aren't files
+        assert "LICENSE" not in manifest
+        assert manifest.find("index.tsx")[:2] == [
+            "react-shopping-cart-main/src/components/Item0/index.tsx",
+            "react-shopping-cart-main/src/components/Item1/index.tsx",
+        ]
+
+
+class _NoPage:
+    """Enough of a Page for GitHubRepoPage to build its locators."""
+
+    def get_by_role(self, *args, **kwargs): return None
+    def locator(self, *args, **kwargs): return None
+
+
+def test_repo_page_rereads_a_replaced_zip(tmp_path):
+    path = tmp_path / "repo.zip"
+    path.write_bytes(_make_zip(files=3, blob_kb=1))
+    repo_page = GitHubRepoPage(_NoPage())
+    assert len(repo_page.get_zip_manifest(path)) < 20
+
+    path.write_bytes(_make_zip(files=30, blob_kb=1))  # a new download to the same path
+    assert len(repo_page.get_zip_manifest(path)) > 30
+    repo_page.verify_zip_contains_file(path, "README.md")
+
+
+def test_range_requests_fetch_only_the_central_directory(zip_server, archive):
+    server = zip_server
+    manifest, reader = manifest_from_url(f"{server.url}/repo.zip")
+    assert "README.md" in manifest and len(manifest) == len(zipfile.ZipFile(io.BytesIO(archive)).namelist())
+    assert reader.size == len(archive)
+    assert server.bytes_sent == reader.bytes_fetched < len(archive) / 10
+
+
+def test_servers_without_range_support_are_read_into_memory(zip_server, archive):
+    server = zip_server
+    manifest, reader = manifest_from_url(f"{server.url}/no-range.zip")
+    assert "README.md" in manifest
+    assert reader.requests == 1 and reader.bytes_fetched == len(archive)
+
+
+def test_zip64_end_records(monkeypatch):
+    # more entries than the (patched) limit makes zipfile write the zip64 end records
+    monkeypatch.setattr(zipfile, "ZIP_FILECOUNT_LIMIT", 5)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for i in range(10):
+            zf.writestr(f"repo/file{i}.txt", "x")
+    data = buffer.getvalue()
+    assert b"PK\x06\x06" in data
+    assert manifest_from_bytes(data).names == [f"repo/file{i}.txt" for i in range(10)]
@@ -0,0 +1,194 @@
+"""
+Page-object micro-benchmarks.
+
+Runs each page-object method repeatedly against the local shop stand-in and
+reports wall time, Playwright protocol round trips and Python allocations
+(tracemalloc, measured in one extra run so it doesn't skew the timings).
+
+    python -m tools.benchmark run                      # print results
+    python -m tools.benchmark run --save-baseline      # ...and store them as the baseline
+    python -m tools.benchmark compare --tolerance 0.2  # exit code 1 when a method regressed
+    python -m tools.benchmark run -k cart              # only benchmarks whose name contains 'cart'
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Callable
+
+from playwright.sync_api import sync_playwright
+
+from fixtures.catalog import generate_catalog
+from fixtures.shop_server import ShopServer
+from pages.shop_page import ShoppingPage
+from utils.artifacts import ARTIFACTS_ROOT
+from utils.protocol import count_round_trips
+from utils.timing_db import current_git_rev
+
+BENCH_DIR = ARTIFACTS_ROOT / "benchmarks"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+LATEST = BENCH_DIR / "latest.json"
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # prepares the page (not measured); whatever it returns is passed to `run`
+    setup: Callable[[ShoppingPage, str], Any]
+    run: Callable[[ShoppingPage, Any], Any]
+
+
+def _load(shop: ShoppingPage, url: str) -> None:
+    shop.goto(url)
+    shop.product_list_section.verify_section_visible()
+
+
+def _cart_with(count: int) -> Callable[[ShoppingPage, str], list[str]]:
+    def setup(shop: ShoppingPage, url: str) -> list[str]:
+        _load(shop, url)
+        titles = shop.product_list_section.get_product_titles()[:count]
+        for title in titles:
+            shop.product_list_section.click_add_to_cart_by_title(title)
+        shop.cart_section.open_cart()
+        return titles
+    return setup
+
+
+BENCHMARKS = [
+    Benchmark("ProductSection.get_all_products", _load, lambda shop, _: shop.product_list_section.get_all_products()),
+    Benchmark("ProductSection.validate_all_sizes", _load, lambda shop, _: shop.product_list_section.validate_all_sizes()),
+    Benchmark("ProductSection.verify_section_visible", _load, lambda shop, _: shop.product_list_section.verify_section_visible()),
+    Benchmark("CartSection.get_all_cart_products", _cart_with(5), lambda shop, _: shop.cart_section.get_all_cart_products()),
+    Benchmark("CartSection.set_quantity", _cart_with(1), lambda shop, titles: shop.cart_section.set_quantity(titles[0], 5)),
+    Benchmark("CartSection.verify_section_visible", _cart_with(1), lambda shop, _: shop.cart_section.verify_section_visible()),
+]
+
+
+def measure(bench: Benchmark, shop: ShoppingPage, url: str, iterations: int) -> dict:
+    timings, trips = [], []
+    for _ in range(iterations):
+        state = bench.setup(shop, url)
+        with count_round_trips() as counter:
+            started = time.perf_counter()
+            bench.run(shop, state)
+            timings.append((time.perf_counter() - started) * 1000)
+        trips.append(counter.calls)
+
+    state = bench.setup(shop, url)
+    tracemalloc.start()
+    try:
+        bench.run(shop, state)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2),
+        "mean_ms": round(statistics.fmean(timings), 2),
+        "round_trips": statistics.median(trips),
+        "peak_alloc_kb": round(peak / 1024, 1),
+        "retained_alloc_kb": round(retained / 1024, 1),
+    }
+
+
+def run_benchmarks(benchmarks: list[Benchmark], iterations: int, catalog_size: int, browser_name: str = "chromium") -> dict:
+    results = {}
+    with ShopServer(generate_catalog(size=catalog_size, seed=0)) as server, sync_playwright() as p:
+        browser = getattr(p, browser_name).launch()
+        try:
+            page = browser.new_context().new_page()
+            shop = ShoppingPage(page)
+            for bench in benchmarks:
+                results[bench.name] = measure(bench, shop, server.url, iterations)
+                print(f"  {bench.name}: {results[bench.name]['median_ms']} ms", file=sys.stderr)
+        finally:
+            browser.close()
+    return {
+        "meta": {
+            "git_rev": current_git_rev(),
+            "python": platform.python_version(),
+            "playwright": version("playwright"),
+            "browser": browser_name,
+            "iterations": iterations,
+            "catalog_size": catalog_size,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.2, round_trip_tolerance: float = 0.0) -> list[str]:
+    """
+    Regressions of `current` against `baseline`: median time or peak allocations more
+    than `tolerance` (fraction) worse, or more round trips than the baseline allows.
+    Benchmarks missing from either side are skipped.
+    """
+    limits = {"median_ms": tolerance, "peak_alloc_kb": tolerance, "round_trips": round_trip_tolerance}
+    regressions = []
+    for name, now in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        for metric, allowed in limits.items():
+            if now[metric] > before[metric] * (1 + allowed):
+                change = (now[metric] / before[metric] - 1) if before[metric] else float("inf")
+                regressions.append(f"{name}: {metric} {before[metric]} -> {now[metric]} (+{change:.0%}, allowed +{allowed:.0%})")
+    return regressions
+
+
+def print_results(report: dict, baseline: dict | None = None) -> None:
+    print(f"{'benchmark':<42}{'median ms':>11}{'min ms':>9}{'trips':>7}{'peak KB':>10}{'vs base':>9}")
+    for name, r in report["results"].items():
+        before = (baseline or {}).get("results", {}).get(name)
+        delta = f"{r['median_ms'] / before['median_ms'] - 1:+.0%}" if before and before["median_ms"] else ""
+        print(f"{name:<42}{r['median_ms']:>11}{r['min_ms']:>9}{r['round_trips']:>7}{r['peak_alloc_kb']:>10}{delta:>9}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in ("run", "compare"):
+        p = sub.add_parser(name)
+        p.add_argument("--iterations", type=int, default=10)
+        p.add_argument("--catalog-size", type=int, default=24, help="products served by the local shop")
+        p.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+        p.add_argument("-k", dest="keyword", default=None, help="only benchmarks whose name contains this")
+        p.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    sub.choices["run"].add_argument("--save-baseline", action="store_true", help="store the results as the baseline")
+    sub.choices["compare"].add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown / extra allocations")
+    sub.choices["compare"].add_argument("--round-trip-tolerance", type=float, default=0.0, help="allowed extra round trips")
+    args = parser.parse_args(argv)
+
+    benchmarks = [b for b in BENCHMARKS if not args.keyword or args.keyword.lower() in b.name.lower()]
+    if not benchmarks:
+        parser.error(f"no benchmark matches '{args.keyword}'")
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else None
+    if args.command == "compare" and baseline is None:
+        parser.error(f"no baseline at {args.baseline}; create one with 'run --save-baseline'")
+
+    report = run_benchmarks(benchmarks, args.iterations, args.catalog_size, args.browser)
+    BENCH_DIR.mkdir(parents=True, exist_ok=True)
+    LATEST.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print_results(report, baseline)
+
+    if args.command == "run":
+        if args.save_baseline:
+            args.baseline.parent.mkdir(parents=True, exist_ok=True)
+            args.baseline.write_text(json.dumps(report, indent=2), encoding="utf-8")
+            print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(baseline, report, args.tolerance, args.round_trip_tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
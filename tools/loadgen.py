@@ -0,0 +1,281 @@
+"""
+Concurrent shopper load generator.
+
+Replays the ShoppingPage flows (load, filter, add to cart, adjust quantity,
+checkout) with the pages_async page objects, one browser context per virtual
+user, all on one event loop. Users arrive at --rate per second, ramping up
+linearly over --ramp-up seconds; at most --concurrency are active at once.
+An arrival that has to wait for a free slot is still on the clock: the load step
+is timed from the scheduled arrival, and the queue wait is reported on its own.
+
+    python -m tools.loadgen --local --users 50 --rate 5 --ramp-up 10
+    python -m tools.loadgen --url https://automated-test-evaluation.web.app/ --users 20 --rate 1
+
+Exits 1 when the step error rate is above --max-error-rate.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from playwright.async_api import Browser, async_playwright
+
+from fixtures.catalog import generate_catalog
+from fixtures.shop_server import ShopServer
+from pages_async.shop_page import ShoppingPage
+from utils.artifacts import ARTIFACTS_ROOT
+from utils.stats import percentile
+from utils.wait import NO_CHANGE_MS
+
+DEFAULT_REPORT = ARTIFACTS_ROOT / "loadgen" / "report.json"
+STEPS = ("load", "filter", "add_to_cart", "adjust_quantity", "checkout")
+
+
+def arrival_times(users: int, rate: float, ramp_up: float = 0.0, rng: random.Random | None = None) -> list[float]:
+    """
+    Start offsets (seconds) for `users` arrivals. The arrival rate grows linearly from
+    0 to `rate` over `ramp_up` seconds and stays there; with `rng` the arrivals are a
+    Poisson process with that rate instead of evenly spaced.
+    """
+    # cumulative expected arrivals: rate*t^2/(2*ramp_up) during the ramp, linear after it
+    ramp_arrivals = rate * ramp_up / 2
+
+    def invert(arrivals: float) -> float:
+        if arrivals <= ramp_arrivals:
+            return math.sqrt(2 * ramp_up * arrivals / rate)
+        return ramp_up + (arrivals - ramp_arrivals) / rate
+
+    offsets, arrivals = [], 0.0
+    for _ in range(users):
+        offsets.append(invert(arrivals))
+        arrivals += rng.expovariate(1.0) if rng else 1.0
+    return offsets
+
+
+# --- Results ---
+def _latency_stats(ms: list[float]) -> dict[str, float | None]:
+    """Percentiles and max in ms; None (JSON null) when nothing succeeded, never NaN."""
+    if not ms:
+        return {**{f"p{q}_ms": None for q in (50, 90, 95, 99)}, "max_ms": None}
+    return {**{f"p{q}_ms": round(percentile(ms, q), 1) for q in (50, 90, 95, 99)}, "max_ms": round(max(ms), 1)}
+
+
+@dataclass
+class StepResult:
+    user: int
+    step: str
+    seconds: float
+    error: str | None = None
+
+
+@dataclass
+class Arrival:
+    user: int
+    scheduled: float  # seconds from the start of the run
+    started: float  # when the user got a slot and began, same clock
+
+    @property
+    def queue_wait(self) -> float:
+        return max(0.0, self.started - self.scheduled)
+
+
+def _rate(offsets: list[float]) -> float | None:
+    """Arrivals per second between the first and the last one."""
+    span = max(offsets) - min(offsets) if len(offsets) > 1 else 0.0
+    return round((len(offsets) - 1) / span, 2) if span > 0 else None
+
+
+@dataclass
+class LoadReport:
+    users: int
+    elapsed: float
+    results: list[StepResult] = field(default_factory=list)
+    arrivals: list[Arrival] = field(default_factory=list)
+    target_rate: float | None = None  # --rate
+
+    @property
+    def failed_users(self) -> int:
+        return len({r.user for r in self.results if r.error})
+
+    @property
+    def error_rate(self) -> float:
+        return sum(r.error is not None for r in self.results) / len(self.results) if self.results else 0.0
+
+    def step_stats(self) -> dict[str, dict]:
+        stats = {}
+        for step in STEPS:
+            results = [r for r in self.results if r.step == step]
+            if not results:
+                continue
+            ok = [r.seconds * 1000 for r in results if r.error is None]
+            stats[step] = {"count": len(results), "errors": len(results) - len(ok), **_latency_stats(ok)}
+        return stats
+
+    def to_dict(self) -> dict:
+        return {
+            "users": self.users,
+            "failed_users": self.failed_users,
+            "elapsed_s": round(self.elapsed, 2),
+            "users_per_s": round((self.users - self.failed_users) / self.elapsed, 2) if self.elapsed else 0.0,
+            "steps_per_s": round(len(self.results) / self.elapsed, 2) if self.elapsed else 0.0,
+            "error_rate": round(self.error_rate, 4),
+            "arrival_rate": {
+                "target": self.target_rate,
+                "scheduled": _rate([a.scheduled for a in self.arrivals]),  # lower than target during ramp-up
+                "achieved": _rate([a.started for a in self.arrivals]),
+            },
+            "queue_wait": _latency_stats([a.queue_wait * 1000 for a in self.arrivals]),
+            "steps": self.step_stats(),
+            "errors": sorted({f"{r.step}: {r.error}" for r in self.results if r.error})[:20],
+        }
+
+
+# --- One virtual user ---
+async def _shop(
+    shopping_page: ShoppingPage, url: str, rng: random.Random, user: int, results: list[StepResult],
+    scheduled_at: float | None = None,
+) -> None:
+    products, cart = shopping_page.product_list_section, shopping_page.cart_section
+    state: dict = {}
+
+    async def load():
+        await shopping_page.goto(url)
+        await shopping_page.verify_page_loaded()
+
+    async def filter_():
+        size = rng.choice(await products.get_available_sizes())
+        await products.settle_after(lambda: products.select_size(size), "filter", no_change_ms=NO_CHANGE_MS)
+        state["titles"] = await products.get_product_titles()
+
+    async def add_to_cart():
+        # the filter may leave nothing to buy; that's a valid (cheap) outcome
+        for title in rng.sample(state["titles"], min(2, len(state["titles"]))):
+            await products.click_add_to_cart_by_title(title)
+
+    async def adjust_quantity():
+        await cart.open_cart()
+        items = await cart.get_all_cart_products()
+        if items:
+            await cart.increase_quantity(rng.choice(items).title)
+
+    async def checkout():
+        alert = await cart.click_checkout(capture_alert=True)
+        if not alert:
+            raise AssertionError("checkout showed no alert")
+
+    for name, step in zip(STEPS, (load, filter_, add_to_cart, adjust_quantity, checkout)):
+        # the load step's clock starts at the scheduled arrival, so waiting for a slot (and
+        # for the context) shows up in its percentiles instead of being silently omitted
+        started = scheduled_at if name == "load" and scheduled_at is not None else time.perf_counter()
+        try:
+            await step()
+        except Exception as e:  # a failed step ends this user's session
+            first_line = str(e).splitlines()[0] if str(e) else ""
+            results.append(StepResult(user, name, time.perf_counter() - started, f"{type(e).__name__}: {first_line}"))
+            return
+        results.append(StepResult(user, name, time.perf_counter() - started))
+
+
+async def run_load(
+    browser: Browser,
+    url: str,
+    users: int,
+    rate: float,
+    ramp_up: float = 0.0,
+    concurrency: int = 10,
+    poisson: bool = False,
+    seed: int = 0,
+) -> LoadReport:
+    """Run `users` shopper sessions against `url`, each in a fresh context of `browser`."""
+    rng = random.Random(seed)
+    offsets = arrival_times(users, rate, ramp_up, rng if poisson else None)
+    slots = asyncio.Semaphore(concurrency)
+    results: list[StepResult] = []
+    arrivals: list[Arrival] = []
+    started = time.perf_counter()
+
+    async def user(index: int, offset: float):
+        scheduled_at = started + offset
+        await asyncio.sleep(max(0.0, scheduled_at - time.perf_counter()))
+        async with slots:
+            arrivals.append(Arrival(index, offset, time.perf_counter() - started))
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+                await _shop(ShoppingPage(page), url, random.Random(f"{seed}-{index}"), index, results, scheduled_at)
+            finally:
+                await context.close()
+
+    await asyncio.gather(*(user(i, offset) for i, offset in enumerate(offsets)))
+    return LoadReport(
+        users=users, elapsed=time.perf_counter() - started, results=results, arrivals=arrivals, target_rate=rate
+    )
+
+
+def print_report(report: dict) -> None:
+    print(f"{report['users']} users ({report['failed_users']} failed) in {report['elapsed_s']}s: "
+          f"{report['users_per_s']} users/s, {report['steps_per_s']} steps/s, error rate {report['error_rate']:.2%}")
+    rate, wait = report["arrival_rate"], report["queue_wait"]
+    print(f"arrivals/s: target {rate['target']}, scheduled {rate['scheduled']}, achieved {rate['achieved']}; "
+          f"queue wait p50 {wait['p50_ms']} ms, p99 {wait['p99_ms']} ms, max {wait['max_ms']} ms")
+    print(f"{'step':<16}{'count':>7}{'errors':>8}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    for step, s in report["steps"].items():
+        latencies = "".join(f"{'-' if s[k] is None else s[k]:>9}" for k in ("p50_ms", "p90_ms", "p95_ms", "p99_ms", "max_ms"))
+        print(f"{step:<16}{s['count']:>7}{s['errors']:>8}{latencies}")
+    for error in report["errors"]:
+        print(f"  ! {error}")
+
+
+async def _main(args) -> dict:
+    server = None
+    if args.local:
+        server = ShopServer(generate_catalog(size=args.catalog_size, seed=args.seed)).start()
+    try:
+        async with async_playwright() as p:
+            browser = await getattr(p, args.browser).launch(headless=not args.headed)
+            try:
+                report = await run_load(
+                    browser, server.url if server else args.url, args.users, args.rate,
+                    ramp_up=args.ramp_up, concurrency=args.concurrency, poisson=args.poisson, seed=args.seed,
+                )
+            finally:
+                await browser.close()
+    finally:
+        if server:
+            server.stop()
+    return report.to_dict()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="shop to load")
+    target.add_argument("--local", action="store_true", help="start the local shop stand-in and load that")
+    parser.add_argument("--catalog-size", type=int, default=16, help="products in the local shop (with --local)")
+    parser.add_argument("--users", type=int, default=20, help="virtual users (shopper sessions) in total")
+    parser.add_argument("--rate", type=float, default=2.0, help="arrivals per second after ramp-up")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds to ramp the arrival rate up from 0")
+    parser.add_argument("--concurrency", type=int, default=10, help="max browser contexts open at once")
+    parser.add_argument("--poisson", action="store_true", help="random (Poisson) arrivals instead of evenly spaced")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--json", type=Path, default=DEFAULT_REPORT, help=f"report file (default {DEFAULT_REPORT})")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="fail when more steps than this fail")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_main(args))
+    print_report(report)
+    args.json.parent.mkdir(parents=True, exist_ok=True)
+    args.json.write_text(json.dumps(report, indent=2, allow_nan=False), encoding="utf-8")
+    print(f"Report written to {args.json}")
+    return 1 if report["error_rate"] > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Duration-aware parallel test runner.
+
+Spreads the collected tests over N pytest worker processes (each launches its own
+browser through pytest-playwright's `browser` fixture) using longest-processing-time-first
+scheduling on historical durations. Every worker writes to artifacts/workers/worker-<i>/.
+
+    python -m tools.parallel_runner -n 4
+    python -m tools.parallel_runner -n 4 -- -m smoke --headed
+"""
+import argparse
+import heapq
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from utils.artifacts import ARTIFACTS_ROOT, REPO_ROOT
+
+DEFAULT_HISTORY = ARTIFACTS_ROOT / "test_durations.json"
+WORKERS_DIR = ARTIFACTS_ROOT / "workers"
+
+
+@dataclass
+class WorkerPlan:
+    index: int
+    nodeids: list[str] = field(default_factory=list)
+    predicted: float = 0.0  # seconds
+
+
+def schedule(nodeids: list[str], durations: dict[str, float], workers: int, default: float | None = None) -> list[WorkerPlan]:
+    """
+    Longest-processing-time-first: hand the longest remaining test to the least
+    loaded worker. Tests with no history are costed at `default` (mean of the
+    known durations when not given).
+    """
+    if default is None:
+        default = sum(durations.values()) / len(durations) if durations else 1.0
+
+    plans = [WorkerPlan(i) for i in range(workers)]
+    heap = [(0.0, i) for i in range(workers)]
+    # ties broken by node id so the plan is stable between runs
+    for nodeid in sorted(nodeids, key=lambda n: (-durations.get(n, default), n)):
+        load, i = heapq.heappop(heap)
+        cost = durations.get(nodeid, default)
+        plans[i].nodeids.append(nodeid)
+        plans[i].predicted = load + cost
+        heapq.heappush(heap, (load + cost, i))
+    return plans
+
+
+def merge_history(history: dict[str, float], measured: dict[str, float], weight: float = 0.5) -> dict[str, float]:
+    """Exponentially smooth new measurements into the history so one slow run doesn't dominate."""
+    merged = dict(history)
+    for nodeid, seconds in measured.items():
+        merged[nodeid] = seconds if nodeid not in history else weight * seconds + (1 - weight) * history[nodeid]
+    return merged
+
+
+def load_history(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def collect(pytest_args: list[str]) -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *pytest_args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    nodeids = [line.strip() for line in result.stdout.splitlines() if "::" in line and not line.startswith(" ")]
+    if result.returncode not in (0, 5) and not nodeids:
+        sys.stderr.write(result.stdout + result.stderr)
+        raise SystemExit(result.returncode)
+    return nodeids
+
+
+def value_options(pytest_args: list[str]) -> set[str]:
+    """Option strings that take a value, from pytest's own parser (plugin and conftest options included)."""
+    from _pytest.config import _prepareconfig
+
+    config = _prepareconfig(list(pytest_args))
+    try:
+        return {s for action in config._parser.optparser._actions if action.nargs != 0 for s in action.option_strings}
+    finally:
+        config._ensure_unconfigure()
+
+
+def worker_args(pytest_args: list[str], takes_value: set[str] | None = None) -> list[str]:
+    """
+    Drop the positional arguments (test paths / node ids): workers get their share of
+    tests through the args file. The value of an option like `--har-path x.har` is kept.
+    """
+    if takes_value is None:
+        takes_value = value_options(pytest_args)
+    kept = []
+    args = iter(pytest_args)
+    for arg in args:
+        if not arg.startswith("-") or arg == "-":
+            continue
+        kept.append(arg)
+        if "=" not in arg and arg in takes_value:
+            value = next(args, None)
+            if value is not None:
+                kept.append(value)
+    return kept
+
+
+def run_workers(plans: list[WorkerPlan], pytest_args: list[str]) -> tuple[dict[str, float], list[int]]:
+    pytest_args = worker_args(pytest_args)
+    processes = []
+    for plan in plans:
+        if not plan.nodeids:
+            continue
+        worker_dir = WORKERS_DIR / f"worker-{plan.index}"
+        worker_dir.mkdir(parents=True, exist_ok=True)
+        # node ids go through a pytest @argsfile to stay clear of command line length limits
+        args_file = worker_dir / "tests.txt"
+        args_file.write_text("\n".join(plan.nodeids), encoding="utf-8")
+
+        env = dict(os.environ, ARTIFACTS_DIR=str(worker_dir), PYTEST_WORKER_ID=f"worker-{plan.index}")
+        command = [
+            sys.executable, "-m", "pytest", f"@{args_file}", *pytest_args,
+            f"--durations-file={worker_dir / 'durations.json'}",
+            f"--html={worker_dir / 'report.html'}", "--self-contained-html",
+        ]
+        output = (worker_dir / "pytest_output.txt").open("w", encoding="utf-8")
+        processes.append((plan, worker_dir, output, subprocess.Popen(
+            command, cwd=REPO_ROOT, env=env, stdout=output, stderr=subprocess.STDOUT
+        )))
+
+    measured: dict[str, float] = {}
+    codes = []
+    for plan, worker_dir, output, process in processes:
+        codes.append(process.wait())
+        output.close()
+        durations_file = worker_dir / "durations.json"
+        if durations_file.exists():
+            with durations_file.open("r", encoding="utf-8") as f:
+                measured.update(json.load(f))
+    return measured, codes
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 2, help="number of worker processes")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="JSON file of historical durations")
+    parser.add_argument("--default-duration", type=float, default=None,
+                        help="seconds assumed for tests without history (default: mean of known tests)")
+    parser.add_argument("pytest_args", nargs="*", help="extra arguments passed to every pytest worker (after --)")
+    args = parser.parse_args(argv)
+
+    nodeids = collect(args.pytest_args)
+    if not nodeids:
+        print("No tests collected")
+        return 5
+
+    history = load_history(args.history)
+    plans = schedule(nodeids, history, max(1, args.workers), args.default_duration)
+    for plan in plans:
+        if plan.nodeids:
+            print(f"worker-{plan.index}: {len(plan.nodeids)} tests, predicted {plan.predicted:.1f}s")
+
+    started = time.perf_counter()
+    measured, codes = run_workers(plans, args.pytest_args)
+    wall = time.perf_counter() - started
+
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    with args.history.open("w", encoding="utf-8") as f:
+        json.dump(merge_history(history, measured), f, indent=2, sort_keys=True)
+
+    serial = sum(measured.values())
+    print(f"Finished in {wall:.1f}s wall time ({serial:.1f}s of test time, {len(codes)} workers)")
+    for plan, code in zip([p for p in plans if p.nodeids], codes):
+        status = "passed" if code == 0 else f"exit code {code}"
+        print(f"  worker-{plan.index}: {status} -> {WORKERS_DIR / f'worker-{plan.index}'}")
+
+    return max(codes, default=0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Reports over the per-test timing database written by tests/conftest.py.
+
+    python -m tools.timing_report slowest --limit 20 [--mode trace]
+    python -m tools.timing_report percentiles [--by-rev] [--test NODEID] [--mode trace]
+    python -m tools.timing_report regressions --threshold 0.25 --window 10 [--mode trace]
+    python -m tools.timing_report pages --metric lcp_ms --by-rev
+    python -m tools.timing_report modes --baseline video --candidate trace
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from utils.artifacts import ARTIFACTS_ROOT
+from utils.perf import BUDGET_METRICS
+from utils.timing_db import TimingStore, DurationStats
+
+
+def _print_stats(stats: list[DurationStats], by_rev: bool = False, unit: str = "s", subject: str = "test") -> None:
+    rev_header = f"{'git rev':<10} " if by_rev else ""
+    print(f"{rev_header}{'runs':>5} {'p50 ' + unit:>10} {'p95 ' + unit:>10} {'last ' + unit:>10}  {subject}")
+    for s in stats:
+        rev = f"{s.git_rev:<10} " if by_rev else ""
+        print(f"{rev}{s.runs:>5} {s.p50:>10.2f} {s.p95:>10.2f} {s.last:>10.2f}  {s.nodeid}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", type=Path, default=ARTIFACTS_ROOT / "timings.sqlite3", help="timing database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    slowest = commands.add_parser("slowest", help="tests with the highest median duration")
+    slowest.add_argument("--limit", type=int, default=10)
+
+    percentiles = commands.add_parser("percentiles", help="p50/p95 per test over its history")
+    percentiles.add_argument("--by-rev", action="store_true", help="split the history per git revision")
+    percentiles.add_argument("--test", default=None, help="only this node id")
+
+    regressions = commands.add_parser("regressions", help="tests slower than their own history")
+    regressions.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = +20%%")
+    regressions.add_argument("--window", type=int, default=10, help="number of earlier runs used as baseline")
+    regressions.add_argument("--min-runs", type=int, default=3, help="earlier runs required before judging")
+
+    pages = commands.add_parser("pages", help="page-load metrics recorded by perf captures, per URL")
+    pages.add_argument("--metric", default="lcp_ms", choices=BUDGET_METRICS)
+    pages.add_argument("--url", default=None, help="only this URL")
+    pages.add_argument("--by-rev", action="store_true", help="split the history per git revision")
+
+    for command in (slowest, percentiles, regressions):
+        command.add_argument("--mode", default=None, help="only runs with this --artifact-mode (default: all)")
+
+    modes = commands.add_parser("modes", help="per-test time saved by one --artifact-mode over another")
+    modes.add_argument("--baseline", default="video")
+    modes.add_argument("--candidate", default="trace")
+
+    args = parser.parse_args(argv)
+    if not args.db.exists():
+        print(f"No timing database at {args.db}; run the suite first")
+        return 1
+
+    store = TimingStore(args.db)
+    try:
+        if args.command == "slowest":
+            _print_stats(store.slowest(args.limit, args.mode))
+        elif args.command == "pages":
+            _print_stats(store.page_metric_stats(args.metric, args.url, args.by_rev), by_rev=args.by_rev,
+                         unit="", subject=f"url ({args.metric})")
+        elif args.command == "modes":
+            compared = store.mode_comparison(args.baseline, args.candidate)
+            if not compared:
+                print(f"No test has passed under both --artifact-mode={args.baseline} and {args.candidate} yet")
+                return 0
+            print(f"{args.baseline + ' s':>10} {args.candidate + ' s':>10} {'saved s':>8}  test")
+            for c in compared:
+                print(f"{c.baseline:>10.2f} {c.candidate:>10.2f} {c.saved:>8.2f}  {c.nodeid}")
+            total_saved = sum(c.saved for c in compared)
+            total_baseline = sum(c.baseline for c in compared)
+            share = f" ({total_saved / total_baseline:.0%} of the {args.baseline} time)" if total_baseline else ""
+            print(f"Total: {total_saved:.2f}s saved over {len(compared)} tests{share}")
+        elif args.command == "percentiles":
+            _print_stats(store.duration_stats(args.test, by_rev=args.by_rev, artifact_mode=args.mode), by_rev=args.by_rev)
+        else:
+            found = store.regressions(args.threshold, args.window, args.min_runs, args.mode)
+            if not found:
+                print(f"No test slowed down by more than {args.threshold:.0%}")
+                return 0
+            print(f"{'baseline s':>10} {'latest s':>9} {'change':>8}  test")
+            for r in found:
+                mode = f" [{r.artifact_mode}]" if r.artifact_mode else ""
+                print(f"{r.baseline:>10.2f} {r.latest:>9.2f} {r.change:>+8.0%}  {r.nodeid}{mode}")
+            return 1
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
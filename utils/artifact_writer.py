@@ -0,0 +1,133 @@
+import gzip
+import hashlib
+import io
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+try:  # optional: only needed to re-encode PNG captures as lossy JPEG/WebP off the test thread
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger("pytest_playwright")
+
+IMAGE_FORMATS = ("png", "jpeg", "webp")
+
+
+def capture_format(fmt: str) -> str:
+    """
+    Format to ask the browser for. With Pillow we capture PNG and re-encode in the
+    background; without it the browser encodes JPEG itself (WebP falls back to JPEG).
+    """
+    if fmt == "png" or Image is not None:
+        return "png"
+    return "jpeg"
+
+
+class ArtifactWriter:
+    """
+    Writes report attachments from a background thread pool so the test thread only
+    pays for capturing bytes. Screenshots are content addressed: identical captures
+    (same bytes, format and quality) are written once and shared.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact-writer")
+        self._lock = threading.Lock()
+        self._pending: list[Future] = []
+        self._by_hash: dict[str, Path] = {}
+        self._index: dict[Path, dict[str, str]] = {}  # screenshot dir -> {name: file}
+        self.written = 0
+        self.deduplicated = 0
+        self.bytes_written = 0
+
+    # --- Screenshots ---
+    def save_screenshot(self, data: bytes, directory: Path, name: str, fmt: str = "png", quality: int | None = None) -> Path:
+        """
+        Queue `data` (as captured with capture_format(fmt)) for writing under
+        `directory`; returns the final path right away. `name` (e.g. the node id) is
+        recorded in directory/index.json.
+        """
+        if fmt not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported screenshot format '{fmt}', expected one of {IMAGE_FORMATS}")
+        if Image is None and fmt == "webp":
+            fmt = "jpeg"
+        ext = "jpg" if fmt == "jpeg" else fmt
+
+        digest = hashlib.sha256(data + f"|{fmt}|{quality}".encode()).hexdigest()
+        path = Path(directory) / f"{digest[:16]}.{ext}"
+        with self._lock:
+            self._index.setdefault(Path(directory), {})[name] = path.name
+            if digest in self._by_hash:
+                self.deduplicated += 1
+                return path
+            self._by_hash[digest] = path
+        self._submit(self._write_image, data, path, fmt, quality)
+        return path
+
+    def _write_image(self, data: bytes, path: Path, fmt: str, quality: int | None) -> None:
+        if Image is not None and fmt != "png":
+            image = Image.open(io.BytesIO(data))
+            buffer = io.BytesIO()
+            image.convert("RGB").save(buffer, format=fmt.upper(), quality=quality or 80)
+            data = buffer.getvalue()
+        self._write_bytes(data, path)
+
+    # --- Text / JSON ---
+    def save_text(self, text: str, path: Path, compress: bool = False) -> Path:
+        path = Path(path).with_name(Path(path).name + ".gz") if compress else Path(path)
+        self._submit(self._write_text, text, path, compress)
+        return path
+
+    def save_json(self, obj, path: Path, compress: bool = False) -> Path:
+        """obj is serialised on the writer thread, so it must not be mutated afterwards."""
+        path = Path(path).with_name(Path(path).name + ".gz") if compress else Path(path)
+        self._submit(self._write_json, obj, path, compress)
+        return path
+
+    def _write_json(self, obj, path: Path, compress: bool) -> None:
+        self._write_text(json.dumps(obj, indent=2), path, compress)
+
+    def _write_text(self, text: str, path: Path, compress: bool) -> None:
+        data = text.encode("utf-8")
+        self._write_bytes(gzip.compress(data) if compress else data, path)
+
+    # --- Plumbing ---
+    def _write_bytes(self, data: bytes, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write then rename so a report never links a half-written file
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        with self._lock:
+            self.written += 1
+            self.bytes_written += len(data)
+
+    def _submit(self, fn, *args) -> None:
+        future = self._pool.submit(fn, *args)
+        with self._lock:
+            self._pending.append(future)
+
+    def flush(self) -> list[BaseException]:
+        """Wait for everything queued so far; returns the errors raised while writing."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        wait(pending)
+        errors = [f.exception() for f in pending if f.exception() is not None]
+        for error in errors:
+            logger.warning("Could not write artifact: %s", error)
+
+        with self._lock:
+            index = {directory: dict(names) for directory, names in self._index.items()}
+        for directory, names in index.items():
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / "index.json").write_text(json.dumps(names, indent=2, sort_keys=True), encoding="utf-8")
+        return errors
+
+    def close(self) -> list[BaseException]:
+        errors = self.flush()
+        self._pool.shutdown(wait=True)
+        return errors
@@ -0,0 +1,28 @@
+import os
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Shared inputs (recorded HAR archives, duration history) always live here
+ARTIFACTS_ROOT = REPO_ROOT / "artifacts"
+
+# Per-run outputs. tools/parallel_runner.py points each worker at its own directory
+# through ARTIFACTS_DIR so workers never overwrite each other's logs and screenshots.
+ARTIFACTS_DIR = Path(os.environ.get("ARTIFACTS_DIR", ARTIFACTS_ROOT)).resolve()
+SCREENSHOT_DIR = ARTIFACTS_DIR / "screenshots"
+VIDEO_DIR = ARTIFACTS_DIR / "videos"
+TRACE_DIR = ARTIFACTS_DIR / "traces"
+SPANS_DIR = ARTIFACTS_DIR / "spans"  # --trace-spans timelines
+NETWORK_LOGGER_DIR = ARTIFACTS_DIR / "network_logs"
+DOWNLOADS_DIR = ARTIFACTS_DIR / "downloads"
+LOG_FILE = ARTIFACTS_DIR / "test.log"
+
+
+def ensure_artifact_dirs() -> None:
+    for directory in (ARTIFACTS_DIR, SCREENSHOT_DIR, VIDEO_DIR, TRACE_DIR, NETWORK_LOGGER_DIR, DOWNLOADS_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+def safe_node_name(nodeid: str) -> str:
+    """Turn a pytest node id into something usable as a file name."""
+    return nodeid.replace("/", "_").replace(":", "_")
@@ -0,0 +1,40 @@
+from typing import Awaitable, Callable
+
+from playwright.async_api import Page, Locator, expect
+
+from utils.wait import (
+    NO_CHANGE_MS, SettleResult, _ARM_SETTLE_JS, _AWAIT_SETTLE_JS, _DISARM_SETTLE_JS, _settle_args, _settle_result,
+)
+
+# asyncio counterparts of utils/wait.py for the pages_async page objects
+
+async def wait_for_element_visible(locator: Locator, timeout: float = 5000):
+    await locator.wait_for(state="visible", timeout=timeout)
+
+async def wait_for_element_hidden(locator: Locator, timeout: float = 5000):
+    await locator.wait_for(state="hidden", timeout=timeout)
+
+async def wait_for_text(locator: Locator, text: str, timeout: float = 5000):
+    await locator.wait_for(state="visible", timeout=timeout)
+    await expect(locator).to_contain_text(text, timeout=timeout)
+
+async def wait_for_url(page: Page, fragment: str, timeout: float = 5000):
+    await page.wait_for_url(f"**{fragment}**", timeout=timeout)
+
+
+async def settle_after(
+    locator: Locator, action: Callable[[], Awaitable], quiet_ms: float = 50, timeout: float = 5000,
+    no_change_ms: float | None = None,
+) -> SettleResult:
+    """Await `action` with a MutationObserver already on the subtree, then wait for it to settle."""
+    await locator.evaluate(_ARM_SETTLE_JS)
+    try:
+        await action()
+    except Exception:
+        try:
+            await locator.evaluate(_DISARM_SETTLE_JS)
+        except Exception:
+            pass  # the page may be gone; the action's error is the one that matters
+        raise
+    result = await locator.evaluate(_AWAIT_SETTLE_JS, _settle_args(quiet_ms, timeout, no_change_ms), timeout=timeout)
+    return _settle_result(locator, result, timeout)
@@ -0,0 +1,243 @@
+## In-memory model of the shop cart, and a driver that replays random operation sequences against the UI
+
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Protocol
+
+from pages.sections.cart_section import CartProduct, CartSnapshot, line_subtotal
+
+if TYPE_CHECKING:
+    from pages.shop_page import ShoppingPage
+
+OPERATIONS = ("add", "increase", "decrease", "remove", "checkout")
+
+
+@dataclass(frozen=True)
+class CartOp:
+    name: str  # one of OPERATIONS
+    title: str | None = None  # product the op targets (None for checkout)
+
+    def __str__(self) -> str:
+        return f"{self.name}({self.title!r})" if self.title else f"{self.name}()"
+
+
+class CartModel:
+    """Mirrors CartSection operations and computes what the cart should show, in memory."""
+
+    def __init__(self, prices: dict[str, float]):
+        self.prices = dict(prices)
+        self.lines: dict[str, int] = {}  # title -> quantity, in the order items were added
+
+    # --- Operations (same semantics as the app) ---
+    def add(self, title: str) -> None:
+        # adding a product that is already in the cart bumps its quantity
+        self.lines[title] = self.lines.get(title, 0) + 1
+
+    def increase(self, title: str, times: int = 1) -> None:
+        self.lines[title] += times
+
+    def decrease(self, title: str, times: int = 1) -> None:
+        # the '-' button is disabled at quantity 1
+        self.lines[title] = max(1, self.lines[title] - times)
+
+    def remove(self, title: str) -> None:
+        del self.lines[title]
+
+    def checkout_alert(self) -> str:
+        if not self.lines:
+            return "Add some product in the cart!"
+        return f"Checkout - Subtotal: $ {self.subtotal:.2f}"
+
+    def is_valid(self, op: CartOp) -> bool:
+        """Ops that need the product in the cart become no-ops once shrinking drops the add."""
+        if op.name in ("increase", "decrease", "remove"):
+            return op.title in self.lines
+        return op.name == "checkout" or op.title in self.prices
+
+    def apply(self, op: CartOp) -> str | None:
+        """Apply op; returns the expected alert text for checkout."""
+        if op.name == "checkout":
+            return self.checkout_alert()
+        getattr(self, op.name)(op.title)
+        return None
+
+    # --- Expected values ---
+    @property
+    def total_quantity(self) -> int:
+        return sum(self.lines.values())
+
+    @property
+    def subtotal(self) -> float:
+        # summed in cents so the model never disagrees with the UI over float noise
+        return sum(round(self.prices[title] * 100) * qty for title, qty in self.lines.items()) / 100
+
+    def snapshot(self) -> CartSnapshot:
+        items = tuple(
+            CartProduct(title, qty, self.prices[title], line_subtotal(self.prices[title], qty))
+            for title, qty in self.lines.items()
+        )
+        return CartSnapshot(items=items, total_price=round(self.subtotal, 2), cart_count=self.total_quantity)
+
+
+def generate_sequence(rng: random.Random, prices: dict[str, float], length: int) -> list[CartOp]:
+    """Random valid op sequence, generated against a model so every op makes sense when it runs."""
+    model = CartModel(prices)
+    titles = sorted(prices)
+    ops = []
+    for _ in range(length):
+        in_cart = list(model.lines)
+        choices = ["add", "checkout"] + (["increase", "decrease", "remove"] if in_cart else [])
+        weights = {"add": 4, "increase": 3, "decrease": 2, "remove": 1, "checkout": 1}
+        name = rng.choices(choices, weights=[weights[c] for c in choices])[0]
+        if name == "checkout":
+            op = CartOp("checkout")
+        elif name == "add":
+            op = CartOp("add", rng.choice(titles))
+        else:
+            op = CartOp(name, rng.choice(in_cart))
+        model.apply(op)
+        ops.append(op)
+    return ops
+
+
+# --- Checking a sequence against the UI ---
+class CartDriver(Protocol):
+    def reset(self) -> None: ...
+    def apply(self, op: CartOp) -> str | None: ...
+    def snapshot(self) -> CartSnapshot: ...
+
+
+def _diff(expected: CartSnapshot, actual: CartSnapshot) -> str | None:
+    exp = [(i.title, i.quantity, round(i.price, 2)) for i in expected.items]
+    act = [(i.title, i.quantity, round(i.price, 2)) for i in actual.items]
+    if exp != act:
+        return f"items {act} != expected {exp}"
+    if round(actual.total_price, 2) != round(expected.total_price, 2):
+        return f"subtotal {actual.total_price:.2f} != expected {expected.total_price:.2f}"
+    if actual.cart_count != expected.cart_count:
+        return f"cart count {actual.cart_count} != expected {expected.cart_count}"
+    return None
+
+
+@dataclass
+class SequenceFailure:
+    ops: list[CartOp]
+    step: int  # index of the op after which the UI disagreed
+    message: str
+
+    def __str__(self) -> str:
+        steps = "\n".join(f"  {i:>3}. {op}" for i, op in enumerate(self.ops))
+        return f"After step {self.step}: {self.message}\n{steps}"
+
+
+def check_sequence(driver: CartDriver, prices: dict[str, float], ops: list[CartOp], checkpoint_every: int = 5) -> SequenceFailure | None:
+    """
+    Replay ops on a fresh cart. Checkout alerts are always compared; the full cart
+    snapshot only every `checkpoint_every` ops and after the last one.
+    """
+    driver.reset()
+    model = CartModel(prices)
+    replayed: list[CartOp] = []
+    for op in ops:
+        if not model.is_valid(op):
+            continue
+        expected_alert = model.apply(op)
+        alert = driver.apply(op)
+        replayed.append(op)
+        step = len(replayed) - 1
+        if op.name == "checkout" and alert != expected_alert:
+            return SequenceFailure(replayed, step, f"alert {alert!r} != expected {expected_alert!r}")
+        if checkpoint_every and len(replayed) % checkpoint_every == 0:
+            message = _diff(model.snapshot(), driver.snapshot())
+            if message:
+                return SequenceFailure(replayed, step, message)
+
+    message = _diff(model.snapshot(), driver.snapshot())
+    if message:
+        return SequenceFailure(replayed, len(replayed) - 1, message)
+    return None
+
+
+def shrink(ops: list[CartOp], fails: Callable[[list[CartOp]], SequenceFailure | None]) -> SequenceFailure:
+    """
+    Delta debugging (ddmin): drop ever smaller chunks of ops while the sequence keeps
+    failing. Ops made invalid by a dropped add are skipped by check_sequence.
+    """
+    failure = fails(ops)
+    assert failure is not None, "shrink() needs a failing sequence"
+    ops = failure.ops  # everything after the failing step is irrelevant
+    chunks = 2
+    while len(ops) >= 2:
+        size = max(1, len(ops) // chunks)
+        for start in range(0, len(ops), size):
+            candidate = ops[:start] + ops[start + size:]
+            result = fails(candidate) if candidate else None
+            if result is not None:
+                ops, failure = result.ops, result
+                chunks = max(chunks - 1, 2)
+                break
+        else:
+            if size == 1:
+                break
+            chunks = min(chunks * 2, len(ops))
+    return failure
+
+
+@dataclass
+class RandomCartRun:
+    sequences: int
+    ops: int
+    failure: SequenceFailure | None = None  # already shrunk
+
+
+def run_random_sequences(
+    driver: CartDriver,
+    prices: dict[str, float],
+    sequences: int = 25,
+    length: int = 15,
+    checkpoint_every: int = 5,
+    seed: int = 0,
+) -> RandomCartRun:
+    """Check `sequences` random sequences; stops at the first failure and shrinks it."""
+    rng = random.Random(seed)
+    run = RandomCartRun(sequences=0, ops=0)
+    for _ in range(sequences):
+        ops = generate_sequence(rng, prices, length)
+        run.sequences += 1
+        run.ops += len(ops)
+        if check_sequence(driver, prices, ops, checkpoint_every):
+            run.failure = shrink(ops, lambda candidate: check_sequence(driver, prices, candidate, checkpoint_every))
+            break
+    return run
+
+
+class ShopCartDriver:
+    """CartDriver on top of the ShoppingPage / CartSection page objects."""
+
+    def __init__(self, shopping_page: "ShoppingPage", url: str):
+        self.shopping_page = shopping_page
+        self.url = url
+
+    def reset(self) -> None:
+        page = self.shopping_page.page
+        if page.url.startswith("http"):
+            page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        self.shopping_page.goto(self.url)
+
+    def apply(self, op: CartOp) -> str | None:
+        cart = self.shopping_page.cart_section
+        if op.name == "add":
+            # the open cart panel covers part of the product grid
+            if cart.section_root.is_visible():
+                cart.close_cart()
+            self.shopping_page.product_list_section.click_add_to_cart_by_title(op.title)
+            return None
+        cart.open_cart()
+        if op.name == "checkout":
+            return cart.click_checkout(capture_alert=True)
+        {"increase": cart.increase_quantity, "decrease": cart.decrease_quantity, "remove": cart.remove_item}[op.name](op.title)
+        return None
+
+    def snapshot(self) -> CartSnapshot:
+        self.shopping_page.cart_section.open_cart()
+        return self.shopping_page.cart_section.get_snapshot()
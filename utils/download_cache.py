@@ -0,0 +1,181 @@
+## Content-addressed cache for downloaded archives, revalidated with conditional requests
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from utils.artifacts import ARTIFACTS_ROOT
+
+logger = logging.getLogger("pytest_playwright")
+
+DOWNLOAD_CACHE_DIR = ARTIFACTS_ROOT / "download_cache"
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """Exclusive lock held across processes (and threads) while the block runs."""
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            while True:
+                try:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after ~10s; keep waiting
+                    time.sleep(0.1)
+        else:
+            import fcntl
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@dataclass
+class CachedDownload:
+    url: str
+    path: Path  # the cached blob; treat as read-only, copy it if you need to modify it
+    sha256: str
+    size: int
+    from_cache: bool  # True when the server answered 304 Not Modified
+
+
+class DownloadCache:
+    """
+    Stores each download once under objects/<sha256> and remembers, per URL, the
+    ETag / Last-Modified validators of the blob it returned. A cached URL is
+    revalidated with If-None-Match / If-Modified-Since; a 304 skips the transfer.
+    Blobs are evicted least recently used first once they exceed `max_bytes`.
+    """
+
+    def __init__(
+        self, root: Path = DOWNLOAD_CACHE_DIR, max_bytes: int = 500 * 1024 * 1024, refresh: bool = False, timeout: float = 60
+    ):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.refresh = refresh  # always transfer again (--refresh-downloads)
+        self.timeout = timeout
+        self._index_path = self.root / "index.json"
+        self._lock_path = self.root / "index.lock"
+        self.hits = 0
+        self.misses = 0
+        self.bytes_downloaded = 0
+
+    # --- Index (url -> validators, blob hash, size, last use) ---
+    # Parallel runner workers are separate processes sharing this directory, so every
+    # read-modify-write of the index and the blobs happens under a file lock.
+    def _load_index(self) -> dict[str, dict]:
+        try:
+            return json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self, index: dict[str, dict]) -> None:
+        tmp = self._index_path.with_name(f"index.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(self._index_path)
+
+    def _blob(self, sha256: str) -> Path:
+        return self.objects / sha256
+
+    # --- Fetching ---
+    def fetch(self, url: str, headers: dict[str, str] | None = None, refresh: bool | None = None) -> CachedDownload:
+        """Cached copy of `url`, downloading it only when it is new, changed or a refresh is asked for."""
+        refresh = self.refresh if refresh is None else refresh
+        with _file_lock(self._lock_path):
+            entry = self._load_index().get(url)
+            if entry and not self._blob(entry["sha256"]).exists():
+                entry = None  # blob deleted behind our back
+        request_headers = dict(headers or {})
+        if entry and not refresh:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        # the transfer itself runs unlocked, other workers keep using the cache meanwhile
+        try:
+            response = urllib.request.urlopen(urllib.request.Request(url, headers=request_headers), timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or not entry:
+                raise
+            e.close()
+            return self._revalidated(url, headers, entry)
+
+        with response:
+            tmp, sha256, size = self._download(response)
+            validators = {"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")}
+        with _file_lock(self._lock_path):
+            blob = self._blob(sha256)
+            if blob.exists():  # same content under another URL or validator
+                os.unlink(tmp)
+            else:
+                os.replace(tmp, blob)
+            index = self._load_index()  # re-read: another worker may have changed it meanwhile
+            previous = index.get(url)
+            index[url] = {**validators, "sha256": sha256, "size": size, "last_used": time.time()}
+            if previous and all(e["sha256"] != previous["sha256"] for e in index.values()):
+                self._blob(previous["sha256"]).unlink(missing_ok=True)  # content changed, old blob unused
+            self._evict(index, keep=sha256)
+            self._save_index(index)
+        self.misses += 1
+        self.bytes_downloaded += size
+        logger.info("Downloaded %s (%d bytes) into the download cache as %s", url, size, sha256[:12])
+        return CachedDownload(url, self._blob(sha256), sha256, size, False)
+
+    def _revalidated(self, url: str, headers: dict[str, str] | None, entry: dict) -> CachedDownload:
+        """304 Not Modified: touch the entry, unless another worker evicted it while we asked."""
+        with _file_lock(self._lock_path):
+            index = self._load_index()
+            current = index.get(url)
+            if current and current["sha256"] == entry["sha256"] and self._blob(entry["sha256"]).exists():
+                current["last_used"] = time.time()
+                self._save_index(index)
+                self.hits += 1
+                logger.info("Download cache hit (304) for %s -> %s", url, entry["sha256"][:12])
+                return CachedDownload(url, self._blob(entry["sha256"]), entry["sha256"], entry["size"], True)
+        return self.fetch(url, headers, refresh=True)
+
+    def _download(self, response) -> tuple[str, str, int]:
+        """Stream the body to a temp file while hashing it: (temp path, sha256, size)."""
+        digest, size = hashlib.sha256(), 0
+        with tempfile.NamedTemporaryFile(dir=self.root, prefix="download-", delete=False) as tmp:
+            while chunk := response.read(1024 * 1024):
+                digest.update(chunk)
+                tmp.write(chunk)
+                size += len(chunk)
+        return tmp.name, digest.hexdigest(), size
+
+    def _evict(self, index: dict[str, dict], keep: str) -> None:
+        # a blob is as recent as the most recent URL using it
+        blobs: dict[str, tuple[float, int]] = {}
+        for entry in index.values():
+            last_used, size = blobs.get(entry["sha256"], (0.0, entry["size"]))
+            blobs[entry["sha256"]] = (max(last_used, entry["last_used"]), size)
+        total = sum(size for _, size in blobs.values())
+        for sha256, (_, size) in sorted(blobs.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            if sha256 == keep:
+                continue
+            self._blob(sha256).unlink(missing_ok=True)
+            for url in [u for u, e in index.items() if e["sha256"] == sha256]:
+                del index[url]
+            total -= size
+            logger.info("Evicted %s (%d bytes) from the download cache", sha256[:12], size)
@@ -0,0 +1,160 @@
+## Independent expected values for the size filter, plus an explorer that checks size combinations in the UI
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from utils.wait import NO_CHANGE_MS
+
+if TYPE_CHECKING:
+    from fixtures.catalog import Catalog
+    from pages.sections.product_list_section import ProductSection
+
+SizeSet = frozenset[str]
+
+
+class FilterOracle:
+    """
+    Knows which sizes every product is offered in and computes the products the size
+    filter should show for any selection (OR semantics; nothing selected shows everything).
+    Products are identified by title; results are cached per selected size set.
+    """
+
+    def __init__(self, product_sizes: dict[str, Iterable[str]], sizes: list[str]):
+        self.sizes = list(sizes)
+        self.product_sizes = {title: frozenset(s) for title, s in product_sizes.items()}
+        self._cache: dict[SizeSet, Counter] = {}
+
+    @classmethod
+    def from_catalog(cls, catalog: "Catalog") -> "FilterOracle":
+        return cls({p.title: p.available_sizes for p in catalog.products}, catalog.sizes)
+
+    @classmethod
+    def from_ui(cls, section: "ProductSection") -> "FilterOracle":
+        """
+        Learn sizes per product from the page itself, one single-size scan per size.
+        Only use this where no catalog is available (the live demo).
+        """
+        sizes = section.get_available_sizes()
+        # nothing is known yet, so any step may legitimately leave the grid as it was
+        section.settle_after(section.deselect_all_sizes, "clear filters", no_change_ms=NO_CHANGE_MS)
+        product_sizes: dict[str, set[str]] = {title: set() for title in section.get_product_titles()}
+        for size in sizes:
+            section.settle_after(lambda: section.select_size(size), f"select '{size}'", no_change_ms=NO_CHANGE_MS)
+            for title in section.get_product_titles():
+                product_sizes.setdefault(title, set()).add(size)
+            section.settle_after(lambda: section.deselect_size(size), f"deselect '{size}'", no_change_ms=NO_CHANGE_MS)
+        return cls(product_sizes, sizes)
+
+    def expected(self, selected: Iterable[str]) -> Counter:
+        """Titles (as a multiset) the grid should show with `selected` checked."""
+        key = frozenset(selected)
+        if key not in self._cache:
+            self._cache[key] = Counter(
+                title for title, sizes in self.product_sizes.items() if not key or sizes & key
+            )
+        return self._cache[key]
+
+    def expected_count(self, selected: Iterable[str]) -> int:
+        return sum(self.expected(selected).values())
+
+
+# --- Walk planning ---
+def gray_code_walk(sizes: list[str], start: SizeSet = frozenset()) -> list[SizeSet]:
+    """
+    Every subset of `sizes`, starting at `start`, each step toggling exactly one
+    checkbox (reflected binary Gray code, xor-ed with the start state).
+    """
+    bits = {size: 1 << i for i, size in enumerate(sizes)}
+    start_mask = sum(bits[s] for s in start if s in bits)
+    walk = []
+    for i in range(1 << len(sizes)):
+        mask = (i ^ (i >> 1)) ^ start_mask
+        walk.append(frozenset(s for s, bit in bits.items() if mask & bit))
+    return walk
+
+
+def nearest_neighbour_walk(targets: Iterable[SizeSet], start: SizeSet = frozenset()) -> list[SizeSet]:
+    """Order `targets` greedily so each next selection is the fewest toggles away."""
+    remaining = set(targets)
+    walk, current = [], start
+    while remaining:
+        # ties broken on the sorted sizes so the plan is stable between runs
+        current = min(remaining, key=lambda t: (len(t ^ current), sorted(t)))
+        remaining.remove(current)
+        walk.append(current)
+    return walk
+
+
+def plan_walk(sizes: list[str], start: SizeSet = frozenset(), max_selected: int | None = None) -> list[SizeSet]:
+    if max_selected is None or max_selected >= len(sizes):
+        return gray_code_walk(sizes, start)
+    targets = [s for s in gray_code_walk(sizes) if len(s) <= max_selected]
+    return nearest_neighbour_walk(targets, start)
+
+
+# --- Explorer ---
+@dataclass
+class Mismatch:
+    selected: tuple[str, ...]
+    missing: list[str]  # expected but not shown
+    unexpected: list[str]  # shown but not expected
+    label_count: int
+    expected_count: int
+
+
+@dataclass
+class ExplorationReport:
+    checked: int = 0
+    toggles: int = 0
+    mismatches: list[Mismatch] = field(default_factory=list)
+
+
+class SizeFilterExplorer:
+    """Walks size combinations in the UI, one checkbox at a time, and checks each against the oracle."""
+
+    def __init__(self, section: "ProductSection", oracle: FilterOracle):
+        self.section = section
+        self.oracle = oracle
+        # observed grid per selected size set; states already checked are not re-read
+        self.results: dict[SizeSet, Counter] = {}
+
+    def explore(self, max_selected: int | None = None) -> ExplorationReport:
+        report = ExplorationReport()
+        current = frozenset(self.section.get_selected_sizes())
+        self._check(current, report)
+
+        for target in plan_walk(self.oracle.sizes, current, max_selected):
+            # toggle one checkbox at a time, unchecking first so intermediate states never
+            # select more sizes than the target; every intermediate state is a free extra check
+            for size in sorted(target ^ current, key=lambda s: (s not in current, self.oracle.sizes.index(s))):
+                if size in current:
+                    action, after = (lambda size=size: self.section.deselect_size(size)), current - {size}
+                else:
+                    action, after = (lambda size=size: self.section.select_size(size)), current | {size}
+                # the grid must re-render when the oracle says the products change; only
+                # a toggle that keeps the same products may pass without any mutation
+                same = self.oracle.expected(after) == self.oracle.expected(current)
+                self.section.settle_after(action, f"toggle '{size}'", no_change_ms=NO_CHANGE_MS if same else None)
+                current = after
+                report.toggles += 1
+                self._check(current, report)
+        return report
+
+    def _check(self, selected: SizeSet, report: ExplorationReport) -> None:
+        if selected in self.results:
+            return
+        shown = Counter(self.section.get_product_titles())
+        self.results[selected] = shown
+        report.checked += 1
+
+        expected = self.oracle.expected(selected)
+        label_count = self.section.get_displayed_product_count()
+        if shown != expected or label_count != self.oracle.expected_count(selected):
+            report.mismatches.append(Mismatch(
+                selected=tuple(sorted(selected, key=self.oracle.sizes.index)),
+                missing=sorted((expected - shown).elements()),
+                unexpected=sorted((shown - expected).elements()),
+                label_count=label_count,
+                expected_count=self.oracle.expected_count(selected),
+            ))
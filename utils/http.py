@@ -0,0 +1,5 @@
+## HTTP helpers shared by route handlers that fulfill requests themselves (HAR replay, asset cache)
+
+# Headers that describe the wire encoding of a body. route.fetch() hands us the
+# decoded body, so fulfilling with them would make the browser decode it twice.
+DROPPED_RESPONSE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
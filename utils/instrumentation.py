@@ -0,0 +1,141 @@
+## Attributes Playwright round trips and time to the page-object methods (pages/) that caused them
+
+import functools
+import html
+import importlib
+import inspect
+import pkgutil
+import threading
+import time
+from dataclasses import dataclass
+
+from utils import protocol
+
+OUTSIDE = "(outside page objects)"
+
+
+@dataclass
+class CallStats:
+    calls: int = 0
+    seconds: float = 0.0  # wall time, nested calls included
+    round_trips: int = 0  # made directly by this method
+    round_trip_seconds: float = 0.0
+    total_round_trips: int = 0  # including those made by nested page-object calls
+
+
+def page_object_classes(package: str = "pages") -> list[type]:
+    """Every class defined in `package` and its subpackages (BasePage, ShoppingPage, CartSection, ...)."""
+    root = importlib.import_module(package)
+    modules = [root] + [importlib.import_module(m.name) for m in pkgutil.walk_packages(root.__path__, f"{package}.")]
+    return [
+        cls for module in modules for cls in vars(module).values()
+        if inspect.isclass(cls) and cls.__module__ == module.__name__
+    ]
+
+
+class PageObjectProfiler:
+    """
+    Wraps page-object methods and listens to protocol round trips (utils.protocol).
+    Each round trip is charged to the innermost page-object method on the call stack;
+    calls are kept per call path (e.g. CartSection.set_quantity > BasePage.wait_for_visible)
+    for the current test, and per method for the whole run.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._originals: list[tuple[type, str, object]] = []
+        self.test_calls: dict[tuple[str, ...], CallStats] = {}
+        self.run_totals: dict[str, CallStats] = {}
+
+    # --- Installing ---
+    def install(self, classes: list[type] | None = None) -> None:
+        for cls in page_object_classes() if classes is None else classes:
+            for name, attr in list(vars(cls).items()):
+                if inspect.isfunction(attr) and not name.startswith("__"):
+                    self._originals.append((cls, name, attr))
+                    setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", attr))
+        protocol.add_listener(self.on_round_trip)
+
+    def uninstall(self) -> None:
+        protocol.remove_listener(self.on_round_trip)
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+
+    def _stack(self) -> list[tuple[str, ...]]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _wrap(self, qualname: str, fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            stack = self._stack()
+            path = (stack[-1] if stack else ()) + (qualname,)
+            stats = self.test_calls.setdefault(path, CallStats())
+            stack.append(path)
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                stack.pop()
+                stats.calls += 1
+                stats.seconds += elapsed
+                total = self.run_totals.setdefault(qualname, CallStats())
+                total.calls += 1
+                # a method calling itself (directly or not) is timed by its outermost call only
+                if qualname not in path[:-1]:
+                    total.seconds += elapsed
+        return wrapper
+
+    # --- Recording ---
+    def start_test(self) -> None:
+        self.test_calls = {}
+
+    def on_round_trip(self, method: str, seconds: float) -> None:
+        stack = self._stack()
+        path = stack[-1] if stack else (OUTSIDE,)
+        stats = self.test_calls.setdefault(path, CallStats())
+        stats.round_trips += 1
+        stats.round_trip_seconds += seconds
+        for depth in range(1, len(path) + 1):
+            self.test_calls.setdefault(path[:depth], CallStats()).total_round_trips += 1
+
+        counted = set()
+        for name in path:
+            if name not in counted:
+                counted.add(name)
+                total = self.run_totals.setdefault(name, CallStats())
+                total.total_round_trips += 1
+                if name == path[-1]:
+                    total.round_trips += 1
+                    total.round_trip_seconds += seconds
+
+    # --- Reporting ---
+    def test_rows(self) -> list[tuple[tuple[str, ...], CallStats]]:
+        """Current test's calls in call-tree order (parents before their children)."""
+        order = {path: i for i, path in enumerate(self.test_calls)}
+        return sorted(
+            self.test_calls.items(),
+            key=lambda item: [order.get(item[0][:d], 0) for d in range(1, len(item[0]) + 1)],
+        )
+
+    def test_report_html(self) -> str:
+        rows = []
+        for path, s in self.test_rows():
+            indent = "&nbsp;" * 4 * (len(path) - 1)
+            rows.append(
+                f"<tr><td>{indent}{html.escape(path[-1])}</td><td>{s.calls}</td><td>{s.seconds * 1000:.1f}</td>"
+                f"<td>{s.round_trips}</td><td>{s.total_round_trips}</td><td>{s.round_trip_seconds * 1000:.1f}</td></tr>"
+            )
+        return (
+            "<table><thead><tr><th>Page-object method</th><th>Calls</th><th>Time (ms)</th>"
+            "<th>Round trips</th><th>incl. nested</th><th>Round-trip time (ms)</th></tr></thead>"
+            f"<tbody>{''.join(rows)}</tbody></table>"
+        )
+
+    def hot_list(self, limit: int = 15) -> list[tuple[str, CallStats]]:
+        """Methods over the whole run, by total time."""
+        methods = [(name, s) for name, s in self.run_totals.items() if name != OUTSIDE]
+        return sorted(methods, key=lambda item: item[1].seconds, reverse=True)[:limit]
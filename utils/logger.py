@@ -1,9 +1,124 @@
+import atexit
+import functools
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
+import threading
+from collections import deque
+from pathlib import Path
+
+from utils.artifacts import LOG_FILE
 
 LOG_CONFIG = os.path.join(os.path.dirname(__file__), "..", "config", "logging.ini")
 
+class _Listener(logging.handlers.QueueListener):
+    """QueueListener that understands the flush markers put by flush_logging()."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        flushed = getattr(record, "flushed", None)
+        if flushed is not None:
+            for handler in self.handlers:
+                handler.flush()
+            flushed.set()
+            return
+        super().handle(record)
+
+
+_configure_lock = threading.Lock()
+_listener: _Listener | None = None
+_configured = False
+
+
+def _is_blocking(handler: logging.Handler) -> bool:
+    # console output stays synchronous so it interleaves correctly with pytest's own output
+    return type(handler) is not logging.StreamHandler
+
+
+def configure_logging(log_file: Path = LOG_FILE, config: str = LOG_CONFIG) -> None:
+    """
+    Load logging.ini once per process. File handlers are moved behind a
+    QueueHandler and served by a background QueueListener, so callers only pay
+    for a queue put instead of disk I/O.
+    """
+    global _listener, _configured
+    with _configure_lock:
+        if _configured:
+            return
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        logging.config.fileConfig(config, defaults={"log_file": Path(log_file).as_posix()}, disable_existing_loggers=False)
+
+        root = logging.getLogger()
+        file_handlers = [h for h in root.handlers if _is_blocking(h)]
+        if file_handlers:
+            for handler in file_handlers:
+                root.removeHandler(handler)
+            queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+            queue_handler.setLevel(min(h.level for h in file_handlers))
+            root.addHandler(queue_handler)
+            _listener = _Listener(queue_handler.queue, *file_handlers, respect_handler_level=True)
+            _listener.start()
+            atexit.register(shutdown_logging)
+        _configured = True
+
+
+def shutdown_logging() -> None:
+    """Drain the queue and close the file handlers; safe to call more than once."""
+    global _listener
+    with _configure_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def flush_logging() -> None:
+    """Block until every record queued so far has been written (e.g. before reading the log file)."""
+    if _listener is None:
+        return
+    flushed = threading.Event()
+    # records are handled in order, so once the marker comes through everything before it is on disk
+    _listener.queue.put_nowait(logging.makeLogRecord({"flushed": flushed}))
+    flushed.wait(timeout=5)
+
+
+class PerTestLogBuffer(logging.Handler):
+    """
+    Keeps the last `capacity` formatted lines logged while each test runs, keyed
+    by node id, so a test's report shows its own logs without touching the log file.
+    """
+
+    def __init__(self, capacity: int = 200, fmt: logging.Formatter | None = None):
+        super().__init__()
+        self.capacity = capacity
+        self.current: str | None = None
+        self._buffers: dict[str, deque[str]] = {}
+        self.setFormatter(fmt or logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s", "%H:%M:%S"))
+
+    def start(self, nodeid: str) -> None:
+        self._buffers[nodeid] = deque(maxlen=self.capacity)
+        self.current = nodeid
+
+    def pop(self, nodeid: str) -> list[str]:
+        """Stop capturing for nodeid and hand back its lines (oldest first)."""
+        if self.current == nodeid:
+            self.current = None
+        return list(self._buffers.pop(nodeid, ()))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        buffer = self._buffers.get(self.current) if self.current else None
+        if buffer is None:
+            return
+        try:
+            buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str = None) -> logging.Logger:
-    logging.config.fileConfig(LOG_CONFIG, disable_existing_loggers=False)
+    configure_logging()
     return logging.getLogger(name if name else __name__)
@@ -0,0 +1,237 @@
+import weakref
+from dataclasses import dataclass, asdict, fields
+
+from playwright.sync_api import Page, Error as PlaywrightError
+from playwright.async_api import Page as AsyncPage
+
+# Navigation Timing, paint, LCP, CLS and long tasks for the current document.
+# LCP/layout-shift/longtask entries are read through buffered PerformanceObservers
+# (they are not exposed by performance.getEntriesByType). A later, larger paint
+# replaces the LCP candidate, so the observers stay on until the document has
+# loaded and no new LCP / layout-shift entry arrived for quietMs (at most maxWaitMs).
+_PAGE_METRICS_JS = """
+({quietMs, maxWaitMs}) => new Promise(resolve => {
+    const seen = {lcp: [], shifts: [], longtasks: []};
+    const observers = [];
+    const started = performance.now();
+    let lastEntry = started;
+    const observe = (type, bucket) => {
+        try {
+            const observer = new PerformanceObserver(list => {
+                seen[bucket].push(...list.getEntries());
+                if (bucket !== 'longtasks') lastEntry = performance.now();
+            });
+            observer.observe({type, buffered: true});
+            observers.push(observer);
+        } catch (e) { /* entry type not supported by this browser */ }
+    };
+    observe('largest-contentful-paint', 'lcp');
+    observe('layout-shift', 'shifts');
+    observe('longtask', 'longtasks');
+
+    const settled = () => {
+        const now = performance.now();
+        return (document.readyState === 'complete' && now - lastEntry >= quietMs) || now - started >= maxWaitMs;
+    };
+    const finish = () => {
+        if (!settled()) {
+            setTimeout(finish, 50);
+            return;
+        }
+        observers.forEach(o => o.disconnect());
+        const nav = performance.getEntriesByType('navigation')[0];
+        const paint = name => {
+            const entry = performance.getEntriesByName(name)[0];
+            return entry ? entry.startTime : null;
+        };
+        const resources = performance.getEntriesByType('resource');
+        // no bytes on the wire but a body: answered from the HTTP cache or by a route handler
+        const unmeasured = [nav, ...resources].filter(r => r && r.transferSize === 0 && r.decodedBodySize > 0).length;
+        const lcp = seen.lcp.length ? seen.lcp[seen.lcp.length - 1].startTime : null;
+        resolve({
+            url: location.href,
+            ttfb_ms: nav ? nav.responseStart - nav.startTime : null,
+            dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+            load_ms: nav && nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : null,
+            fcp_ms: paint('first-contentful-paint'),
+            lcp_ms: lcp,
+            cls: seen.shifts.filter(s => !s.hadRecentInput).reduce((sum, s) => sum + s.value, 0),
+            long_tasks: seen.longtasks.length,
+            long_task_ms: seen.longtasks.reduce((sum, t) => sum + t.duration, 0),
+            transfer_kb: ((nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0)) / 1024,
+            resources: resources.length,
+            unmeasured_resources: unmeasured,
+            js_heap_mb: performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null,
+        });
+    };
+    setTimeout(finish, 50);
+})
+"""
+
+LCP_QUIET_MS = 500
+LCP_MAX_WAIT_MS = 5000
+
+
+@dataclass
+class PageMetrics:
+    url: str
+    ttfb_ms: float | None = None
+    dom_content_loaded_ms: float | None = None
+    load_ms: float | None = None
+    fcp_ms: float | None = None
+    lcp_ms: float | None = None
+    cls: float = 0.0
+    long_tasks: int = 0
+    long_task_ms: float = 0.0
+    transfer_kb: float | None = 0.0  # None when responses were fulfilled by a route handler
+    resources: int = 0
+    unmeasured_resources: int = 0  # responses with a body but no network transfer
+    js_heap_mb: float | None = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# Metrics a perf_budget marker may set a ceiling for
+BUDGET_METRICS = tuple(f.name for f in fields(PageMetrics) if f.name not in ("url", "unmeasured_resources"))
+
+
+# Pages / contexts whose requests a route handler currently answers with route.fulfill
+# (HAR replay, asset cache); the fixtures that install those routes register them here.
+# route.fulfill responses report no transfer size, so transfer_kb can't be trusted there.
+_routed_targets: "weakref.WeakKeyDictionary[object, int]" = weakref.WeakKeyDictionary()
+
+
+def mark_routed(target) -> None:
+    """Register a page or context that now has a fulfilling route handler."""
+    _routed_targets[target] = _routed_targets.get(target, 0) + 1
+
+
+def unmark_routed(target) -> None:
+    """Undo mark_routed once the handler is unrouted (handlers are counted, so nesting works)."""
+    remaining = _routed_targets.get(target, 0) - 1
+    if remaining > 0:
+        _routed_targets[target] = remaining
+    else:
+        _routed_targets.pop(target, None)
+
+
+def is_routed(page) -> bool:
+    return page in _routed_targets or page.context in _routed_targets
+
+
+def _finish(metrics: PageMetrics, routed: bool) -> PageMetrics:
+    if routed and metrics.unmeasured_resources:
+        metrics.transfer_kb = None
+    return metrics
+
+
+def _cdp_heap_mb(page: Page) -> float | None:
+    """JS heap used according to CDP (Chromium only), more precise than performance.memory."""
+    try:
+        session = page.context.new_cdp_session(page)
+    except PlaywrightError:
+        return None
+    try:
+        session.send("Performance.enable")
+        metrics = {m["name"]: m["value"] for m in session.send("Performance.getMetrics")["metrics"]}
+        return metrics["JSHeapUsedSize"] / 1048576 if "JSHeapUsedSize" in metrics else None
+    except PlaywrightError:
+        return None
+    finally:
+        session.detach()
+
+
+async def _cdp_heap_mb_async(page: AsyncPage) -> float | None:
+    try:
+        session = await page.context.new_cdp_session(page)
+    except PlaywrightError:
+        return None
+    try:
+        await session.send("Performance.enable")
+        metrics = {m["name"]: m["value"] for m in (await session.send("Performance.getMetrics"))["metrics"]}
+        return metrics["JSHeapUsedSize"] / 1048576 if "JSHeapUsedSize" in metrics else None
+    except PlaywrightError:
+        return None
+    finally:
+        await session.detach()
+
+
+def _metrics_args(quiet_ms: float, max_wait_ms: float) -> dict:
+    return {"quietMs": quiet_ms, "maxWaitMs": max_wait_ms}
+
+
+def collect_page_metrics(page: Page, quiet_ms: float = LCP_QUIET_MS, max_wait_ms: float = LCP_MAX_WAIT_MS) -> PageMetrics:
+    metrics = _finish(PageMetrics(**page.evaluate(_PAGE_METRICS_JS, _metrics_args(quiet_ms, max_wait_ms))), is_routed(page))
+    heap = _cdp_heap_mb(page)
+    if heap is not None:
+        metrics.js_heap_mb = heap
+    return metrics
+
+
+async def collect_page_metrics_async(
+    page: AsyncPage, quiet_ms: float = LCP_QUIET_MS, max_wait_ms: float = LCP_MAX_WAIT_MS
+) -> PageMetrics:
+    raw = await page.evaluate(_PAGE_METRICS_JS, _metrics_args(quiet_ms, max_wait_ms))
+    metrics = _finish(PageMetrics(**raw), is_routed(page))
+    heap = await _cdp_heap_mb_async(page)
+    if heap is not None:
+        metrics.js_heap_mb = heap
+    return metrics
+
+
+def check_budget(metrics: list[PageMetrics], budget: dict[str, float]) -> list[str]:
+    """Human readable violations of `budget` ({metric: ceiling}) over every captured page load."""
+    unknown = set(budget) - set(BUDGET_METRICS)
+    if unknown:
+        raise ValueError(f"Unknown perf_budget metric(s) {sorted(unknown)}; expected some of {list(BUDGET_METRICS)}")
+
+    violations = []
+    for m in metrics:
+        for name, ceiling in budget.items():
+            value = getattr(m, name)
+            if name == "transfer_kb" and value is None:
+                violations.append(
+                    f"{m.url}: transfer_kb not measured, {m.unmeasured_resources} response(s) were fulfilled "
+                    f"by a route handler (HAR replay, asset cache, ...)"
+                )
+            elif value is not None and value > ceiling:
+                violations.append(f"{m.url}: {name}={value:.2f} exceeds budget {ceiling}")
+    return violations
+
+
+# --- Capture for the running test (switched on by conftest for perf_budget / --perf-metrics) ---
+_captured: list[PageMetrics] | None = None
+
+
+def start_capture() -> None:
+    global _captured
+    _captured = []
+
+
+def stop_capture() -> list[PageMetrics]:
+    global _captured
+    captured, _captured = _captured or [], None
+    return captured
+
+
+def capturing() -> bool:
+    return _captured is not None
+
+
+def record(page: Page) -> PageMetrics | None:
+    """Collect metrics for the page's current document if a capture is running."""
+    if _captured is None:
+        return None
+    metrics = collect_page_metrics(page)
+    _captured.append(metrics)
+    return metrics
+
+
+async def record_async(page: AsyncPage) -> PageMetrics | None:
+    """record() for pages_async page objects."""
+    if _captured is None:
+        return None
+    metrics = await collect_page_metrics_async(page)
+    _captured.append(metrics)
+    return metrics
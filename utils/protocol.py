@@ -0,0 +1,72 @@
+## Counts and times Playwright protocol round trips (client <-> driver messages that wait for a reply)
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from playwright._impl import _connection
+
+# Every awaited call on a Playwright object (sync or async API) ends up in
+# Channel._inner_send, once per message to the driver. Fire-and-forget messages
+# (send_no_reply) don't wait for anything and aren't counted.
+_original_inner_send = _connection.Channel._inner_send
+_listeners: list[Callable[[str, float], None]] = []
+_lock = threading.Lock()
+
+
+async def _timed_inner_send(self, method, timeout_calculator, params, return_as_dict):
+    if not _listeners:
+        return await _original_inner_send(self, method, timeout_calculator, params, return_as_dict)
+    started = time.perf_counter()
+    try:
+        return await _original_inner_send(self, method, timeout_calculator, params, return_as_dict)
+    finally:
+        elapsed = time.perf_counter() - started
+        name = f"{type(self._object).__name__}.{method}"
+        for listener in list(_listeners):
+            listener(name, elapsed)
+
+
+def add_listener(listener: Callable[[str, float], None]) -> None:
+    """Call listener("Frame.click", seconds) after every round trip; patches the channel on first use."""
+    with _lock:
+        if _connection.Channel._inner_send is not _timed_inner_send:
+            _connection.Channel._inner_send = _timed_inner_send
+        _listeners.append(listener)
+
+
+def remove_listener(listener: Callable[[str, float], None]) -> None:
+    with _lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+
+class RoundTripCounter:
+    """Running totals of the round trips seen while it is listening."""
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.by_method: Counter[str] = Counter()
+
+    def __call__(self, method: str, seconds: float) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        self.by_method[method] += 1
+
+
+@contextmanager
+def count_round_trips() -> Iterator[RoundTripCounter]:
+    """
+    with count_round_trips() as trips:
+        section.get_all_products()
+    print(trips.calls, trips.by_method.most_common(3))
+    """
+    counter = RoundTripCounter()
+    add_listener(counter)
+    try:
+        yield counter
+    finally:
+        remove_listener(counter)
@@ -0,0 +1,246 @@
+import sqlite3
+import subprocess
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from utils.artifacts import REPO_ROOT
+from utils.stats import median, percentile
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    started_at  TEXT NOT NULL,
+    git_rev     TEXT NOT NULL,
+    worker      TEXT,
+    artifact_mode TEXT
+);
+CREATE TABLE IF NOT EXISTS test_timings (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id      TEXT NOT NULL REFERENCES runs(run_id),
+    nodeid      TEXT NOT NULL,
+    outcome     TEXT NOT NULL,
+    setup       REAL NOT NULL DEFAULT 0,
+    call        REAL NOT NULL DEFAULT 0,
+    teardown    REAL NOT NULL DEFAULT 0,
+    total       REAL NOT NULL,
+    markers     TEXT NOT NULL DEFAULT '',
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_test_timings_nodeid ON test_timings(nodeid, recorded_at);
+CREATE TABLE IF NOT EXISTS page_metrics (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id      TEXT NOT NULL REFERENCES runs(run_id),
+    nodeid      TEXT NOT NULL,
+    url         TEXT NOT NULL,
+    metric      TEXT NOT NULL,
+    value       REAL NOT NULL,
+    recorded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_page_metrics_url ON page_metrics(url, metric);
+"""
+
+
+def current_git_rev() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    return result.stdout.strip() or "unknown"
+
+
+@dataclass
+class DurationStats:
+    nodeid: str
+    runs: int
+    mean: float
+    p50: float
+    p95: float
+    last: float
+    git_rev: str = ""
+
+
+@dataclass
+class Regression:
+    nodeid: str
+    baseline: float  # median of the earlier runs under the same artifact mode
+    latest: float
+    runs: int
+    artifact_mode: str | None = None
+
+    @property
+    def change(self) -> float:
+        return self.latest / self.baseline - 1 if self.baseline else float("inf")
+
+
+@dataclass
+class ModeComparison:
+    nodeid: str
+    baseline: float  # median seconds under the baseline artifact mode
+    candidate: float
+
+    @property
+    def saved(self) -> float:
+        return self.baseline - self.candidate
+
+
+class TimingStore:
+    """Local SQLite history of per-test setup/call/teardown durations."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # parallel workers share one file, so wait on the lock rather than fail
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.executescript(_SCHEMA)
+
+    def start_run(self, git_rev: str | None = None, worker: str | None = None, artifact_mode: str | None = None) -> str:
+        run_id = uuid.uuid4().hex
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO runs (run_id, started_at, git_rev, worker, artifact_mode) VALUES (?, ?, ?, ?, ?)",
+                (run_id, _now(), git_rev or current_git_rev(), worker, artifact_mode),
+            )
+        return run_id
+
+    def record(
+        self,
+        run_id: str,
+        nodeid: str,
+        outcome: str,
+        setup: float = 0.0,
+        call: float = 0.0,
+        teardown: float = 0.0,
+        markers: list[str] | None = None,
+    ) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO test_timings (run_id, nodeid, outcome, setup, call, teardown, total, markers, recorded_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, nodeid, outcome, setup, call, teardown, setup + call + teardown,
+                 ",".join(sorted(markers or [])), _now()),
+            )
+
+    def record_page_metrics(self, run_id: str, nodeid: str, url: str, metrics: dict[str, float | None]) -> None:
+        """One row per metric so new metrics don't need a schema change."""
+        now = _now()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO page_metrics (run_id, nodeid, url, metric, value, recorded_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, nodeid, url, name, value, now) for name, value in metrics.items() if value is not None],
+            )
+
+    def page_metric_stats(self, metric: str, url: str | None = None, by_rev: bool = False) -> list[DurationStats]:
+        """p50/p95 of one page metric per URL (reusing DurationStats, with the URL as nodeid)."""
+        query = (
+            "SELECT p.url, r.git_rev, p.value FROM page_metrics p JOIN runs r USING (run_id)"
+            " WHERE p.metric = ?"
+        )
+        params: tuple = (metric,)
+        if url:
+            query += " AND p.url = ?"
+            params += (url,)
+        grouped: dict[tuple[str, str], list[float]] = defaultdict(list)
+        for page_url, rev, value in self._conn.execute(query + " ORDER BY p.recorded_at, p.id", params):
+            grouped[(page_url, rev if by_rev else "")].append(value)
+        return sorted(
+            (DurationStats(page_url, len(values), sum(values) / len(values), percentile(values, 50),
+                           percentile(values, 95), values[-1], rev)
+             for (page_url, rev), values in grouped.items()),
+            key=lambda s: (s.nodeid, s.git_rev),
+        )
+
+    def _totals(self, nodeid: str | None = None, artifact_mode: str | None = None) -> dict[tuple[str, str], list[float]]:
+        """{(nodeid, git_rev): [totals oldest first]} for passed tests, optionally of one --artifact-mode."""
+        query = (
+            "SELECT t.nodeid, r.git_rev, t.total FROM test_timings t JOIN runs r USING (run_id)"
+            " WHERE t.outcome = 'passed'"
+        )
+        params: tuple = ()
+        if nodeid:
+            query += " AND t.nodeid = ?"
+            params += (nodeid,)
+        if artifact_mode:
+            query += " AND r.artifact_mode = ?"
+            params += (artifact_mode,)
+        grouped: dict[tuple[str, str], list[float]] = defaultdict(list)
+        for node, rev, total in self._conn.execute(query + " ORDER BY t.recorded_at, t.id", params):
+            grouped[(node, rev)].append(total)
+        return grouped
+
+    def duration_stats(
+        self, nodeid: str | None = None, by_rev: bool = False, artifact_mode: str | None = None
+    ) -> list[DurationStats]:
+        """p50/p95 per test, over the whole history or split per git revision (all artifact modes unless given)."""
+        grouped: dict[tuple[str, str], list[float]] = defaultdict(list)
+        for (node, rev), totals in self._totals(nodeid, artifact_mode).items():
+            grouped[(node, rev if by_rev else "")].extend(totals)
+
+        stats = [
+            DurationStats(node, len(totals), sum(totals) / len(totals), percentile(totals, 50),
+                          percentile(totals, 95), totals[-1], rev)
+            for (node, rev), totals in grouped.items()
+        ]
+        return sorted(stats, key=lambda s: (s.nodeid, s.git_rev))
+
+    def slowest(self, limit: int = 10, artifact_mode: str | None = None) -> list[DurationStats]:
+        return sorted(self.duration_stats(artifact_mode=artifact_mode), key=lambda s: s.p50, reverse=True)[:limit]
+
+    def regressions(
+        self, threshold: float = 0.2, window: int = 10, min_runs: int = 3, artifact_mode: str | None = None
+    ) -> list[Regression]:
+        """
+        Tests whose latest duration exceeds the median of their previous `window` runs by > threshold.
+        Each test is judged against runs of the same --artifact-mode only, since video and tracing
+        change durations by themselves.
+        """
+        history: dict[tuple[str, str | None], list[float]] = defaultdict(list)
+        query = (
+            "SELECT t.nodeid, r.artifact_mode, t.total FROM test_timings t JOIN runs r USING (run_id)"
+            " WHERE t.outcome = 'passed'"
+        )
+        params: tuple = ()
+        if artifact_mode:
+            query += " AND r.artifact_mode = ?"
+            params = (artifact_mode,)
+        for node, mode, total in self._conn.execute(query + " ORDER BY t.recorded_at, t.id", params):
+            history[(node, mode)].append(total)
+
+        found = []
+        for (node, mode), totals in history.items():
+            previous = totals[:-1][-window:]
+            if len(previous) < min_runs:
+                continue
+            baseline = median(previous)
+            if totals[-1] > baseline * (1 + threshold):
+                found.append(Regression(node, baseline, totals[-1], len(totals), mode))
+        return sorted(found, key=lambda r: r.change, reverse=True)
+
+    def mode_comparison(self, baseline: str = "video", candidate: str = "trace") -> list[ModeComparison]:
+        """Median duration per test under two artifact modes, for tests that have passed under both."""
+        medians: dict[str, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+        rows = self._conn.execute(
+            "SELECT t.nodeid, r.artifact_mode, t.total FROM test_timings t JOIN runs r USING (run_id)"
+            " WHERE t.outcome = 'passed' AND r.artifact_mode IN (?, ?)",
+            (baseline, candidate),
+        )
+        for node, mode, total in rows:
+            medians[node][mode].append(total)
+
+        compared = [
+            ModeComparison(node, median(by_mode[baseline]), median(by_mode[candidate]))
+            for node, by_mode in medians.items()
+            if by_mode[baseline] and by_mode[candidate]
+        ]
+        return sorted(compared, key=lambda c: c.saved, reverse=True)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
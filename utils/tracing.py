@@ -0,0 +1,205 @@
+## Nested timing spans for page-object actions, exported as Chrome trace events and OTLP JSON
+
+import contextvars
+import functools
+import inspect
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int  # unix epoch
+    end_ns: int = 0
+    attributes: dict = field(default_factory=dict)
+    thread_id: int = 0
+
+    def set(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+
+class _NoopSpan:
+    def set(self, key: str, value) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopSpan()
+_current: contextvars.ContextVar[Span | None] = contextvars.ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Collects finished spans; one trace id per tracer (i.e. per test)."""
+
+    def __init__(self):
+        self.trace_id = secrets.token_hex(16)
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def start(self, name: str, attributes: dict) -> tuple[Span, contextvars.Token]:
+        parent = _current.get()
+        span = Span(
+            name, self.trace_id, secrets.token_hex(8), parent.span_id if parent else None,
+            time.time_ns(), attributes=attributes, thread_id=threading.get_ident(),
+        )
+        return span, _current.set(span)
+
+    def finish(self, span: Span, token: contextvars.Token, error: BaseException | None = None) -> None:
+        span.end_ns = time.time_ns()
+        _current.reset(token)
+        if error is None:
+            span.attributes.setdefault("outcome", "ok")
+        else:
+            span.attributes["outcome"] = "timeout" if isinstance(error, PlaywrightTimeoutError) else "error"
+            span.attributes["exception.type"] = type(error).__name__
+            span.attributes["exception.message"] = (str(error).splitlines() or [""])[0]
+        with self._lock:
+            self.spans.append(span)
+
+
+# --- Switching tracing on/off (conftest does this per test with --trace-spans) ---
+_tracer: Tracer | None = None
+
+
+def start_tracing() -> Tracer:
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Tracer | None:
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+class _SpanContext:
+    __slots__ = ("tracer", "name", "attributes", "span", "token")
+
+    def __init__(self, tracer: Tracer, name: str, attributes: dict):
+        self.tracer, self.name, self.attributes = tracer, name, attributes
+
+    def __enter__(self) -> Span:
+        self.span, self.token = self.tracer.start(self.name, self.attributes)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.finish(self.span, self.token, exc)
+        return False
+
+
+def span(name: str, **attributes):
+    """
+    with tracing.span("checkout", items=3) as s:
+        ...
+        s.set("alert", message)
+
+    Returns a shared no-op when tracing is off.
+    """
+    if _tracer is None:
+        return _NOOP
+    return _SpanContext(_tracer, name, attributes)
+
+
+def _attribute(value):
+    return value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+
+
+def traced(name: str | None = None, attributes: tuple[str, ...] = (), record_result: bool = False):
+    """
+    Decorator: run the method in a span named `name` (default Class.method) with the
+    named arguments as attributes (e.g. locator, timeout). Costs one global lookup when
+    tracing is off; arguments are only bound and stringified when it's on.
+    """
+    def decorate(fn):
+        signature = inspect.signature(fn)
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return fn(*args, **kwargs)
+            attrs = {}
+            if attributes:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                attrs = {key: _attribute(bound.arguments[key]) for key in attributes if key in bound.arguments}
+            with _SpanContext(tracer, span_name, attrs) as s:
+                result = fn(*args, **kwargs)
+                if record_result:
+                    s.set("result", _attribute(result))
+                return result
+        return wrapper
+    return decorate
+
+
+# --- Exporters ---
+def to_chrome_trace(spans: list[Span]) -> dict:
+    """Trace Event Format ("X" complete events); open in chrome://tracing or ui.perfetto.dev."""
+    pid = os.getpid()
+    events = [
+        {
+            "name": s.name,
+            "cat": s.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": s.start_ns / 1000,
+            "dur": (s.end_ns - s.start_ns) / 1000,
+            "pid": pid,
+            "tid": s.thread_id,
+            "args": s.attributes,
+        }
+        for s in sorted(spans, key=lambda s: s.start_ns)
+    ]
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}  # int64 is a string in OTLP/JSON
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": "" if value is None else str(value)}
+
+
+def to_otlp(spans: list[Span], service_name: str = "nuclera-tests") -> dict:
+    """OTLP/JSON ExportTraceServiceRequest, e.g. for `curl -X POST .../v1/traces` or Jaeger's importer."""
+    otlp_spans = []
+    for s in sorted(spans, key=lambda s: s.start_ns):
+        error = s.attributes.get("outcome") in ("error", "timeout")
+        otlp_span = {
+            "traceId": s.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()],
+            "status": {"code": 2, "message": s.attributes.get("exception.message", "")} if error else {"code": 1},
+        }
+        if s.parent_id:
+            otlp_span["parentSpanId"] = s.parent_id
+        otlp_spans.append(otlp_span)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{"scope": {"name": "pages"}, "spans": otlp_spans}],
+        }]
+    }
+
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import Callable
+
 from playwright.sync_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
 
 def wait_for_element_visible(locator: Locator, timeout: float = 5000):
@@ -17,3 +20,121 @@ def wait_for_text(locator: Locator, text: str, timeout: float = 5000):
 
 def wait_for_url(page: Page, fragment: str, timeout: float = 5000):
     page.wait_for_url(f"**{fragment}**", timeout=timeout)
+
+
+@dataclass
+class SettleResult:
+    elapsed_ms: float  # action start until the last observed mutation, i.e. the real UI latency
+    total_ms: float  # elapsed_ms plus the quiet period we waited out
+    mutations: int  # mutation records seen since the observer was armed
+
+
+# An action that may legitimately leave the DOM untouched (a filter toggle that keeps the
+# same products on screen) is given this long to cause a first mutation before we accept
+# that nothing changed. Actions that must change something don't pass it and time out instead.
+NO_CHANGE_MS = 1000
+
+# Armed before the action, so a re-render that starts during or right after it is never missed.
+_ARM_SETTLE_JS = """
+el => {
+    const registry = window.__settleObservers || (window.__settleObservers = new WeakMap());
+    const previous = registry.get(el);
+    if (previous) previous.observer.disconnect();
+    const state = {start: performance.now(), last: null, mutations: 0, onMutation: null};
+    state.observer = new MutationObserver(records => {
+        state.mutations += records.length;
+        state.last = performance.now();
+        if (state.onMutation) state.onMutation();
+    });
+    state.observer.observe(el, {childList: true, subtree: true, attributes: true, characterData: true});
+    registry.set(el, state);
+}
+"""
+
+# Resolves quietMs after the last mutation. The quiet timer only starts once something has
+# changed; with no mutation at all it resolves after noChangeMs, or times out when that's null.
+_AWAIT_SETTLE_JS = """
+(el, {quietMs, timeoutMs, noChangeMs}) => new Promise(resolve => {
+    const registry = window.__settleObservers;
+    const state = registry && registry.get(el);
+    if (!state) {
+        resolve({armed: false});
+        return;
+    }
+    let quietTimer = null;
+    let noChangeTimer = null;
+    let deadline = null;
+    const finish = timedOut => {
+        state.observer.disconnect();
+        registry.delete(el);
+        clearTimeout(quietTimer);
+        clearTimeout(noChangeTimer);
+        clearTimeout(deadline);
+        resolve({
+            armed: true,
+            timedOut,
+            elapsed: state.last === null ? 0 : state.last - state.start,
+            total: performance.now() - state.start,
+            mutations: state.mutations,
+        });
+    };
+    const startQuietTimer = () => {
+        clearTimeout(noChangeTimer);
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(false), Math.max(0, quietMs - (performance.now() - state.last)));
+    };
+    state.onMutation = startQuietTimer;
+    if (state.mutations) {
+        startQuietTimer();  // the action already changed something
+    } else if (noChangeMs !== null) {
+        noChangeTimer = setTimeout(() => finish(false), noChangeMs);
+    }
+    deadline = setTimeout(() => finish(true), Math.max(0, timeoutMs - (performance.now() - state.start)));
+})
+"""
+
+_DISARM_SETTLE_JS = """
+el => {
+    const registry = window.__settleObservers;
+    const state = registry && registry.get(el);
+    if (state) {
+        state.observer.disconnect();
+        registry.delete(el);
+    }
+}
+"""
+
+
+def _settle_args(quiet_ms: float, timeout: float, no_change_ms: float | None) -> dict:
+    return {"quietMs": quiet_ms, "timeoutMs": timeout, "noChangeMs": no_change_ms}
+
+
+def _settle_result(locator, result: dict, timeout: float) -> SettleResult:
+    if not result["armed"]:
+        raise RuntimeError(f"{locator} was replaced while waiting for it to settle; observe a stable ancestor")
+    if result["timedOut"]:
+        if result["mutations"]:
+            raise PlaywrightTimeoutError(f"{locator} kept mutating for {timeout}ms ({result['mutations']} mutations)")
+        raise PlaywrightTimeoutError(f"{locator} did not change within {timeout}ms of the action")
+    return SettleResult(elapsed_ms=result["elapsed"], total_ms=result["total"], mutations=result["mutations"])
+
+
+def settle_after(
+    locator: Locator, action: Callable[[], object], quiet_ms: float = 50, timeout: float = 5000,
+    no_change_ms: float | None = None,
+) -> SettleResult:
+    """
+    Run `action` (e.g. a click) with a MutationObserver already attached to the subtree
+    under locator, then wait until it has changed and stayed quiet for quiet_ms.
+    """
+    locator.evaluate(_ARM_SETTLE_JS)
+    try:
+        action()
+    except Exception:
+        try:
+            locator.evaluate(_DISARM_SETTLE_JS)
+        except Exception:
+            pass  # the page may be gone; the action's error is the one that matters
+        raise
+    result = locator.evaluate(_AWAIT_SETTLE_JS, _settle_args(quiet_ms, timeout, no_change_ms), timeout=timeout)
+    return _settle_result(locator, result, timeout)
@@ -0,0 +1,148 @@
+## Reads only the central directory of a ZIP (file, memory or HTTP range requests) into an indexed manifest
+
+import struct
+import urllib.request
+from pathlib import Path
+from typing import Callable, Iterable
+
+_EOCD_SIG = b"PK\x05\x06"
+_EOCD64_LOCATOR_SIG = b"PK\x06\x07"
+_EOCD64_SIG = b"PK\x06\x06"
+_CENTRAL_SIG = b"PK\x01\x02"
+_EOCD_SIZE = 22
+_EOCD64_LOCATOR_SIZE = 20
+# the end record sits in the last 22 bytes plus at most a 64 KiB comment (plus the zip64 locator)
+TAIL_SIZE = _EOCD_SIZE + 0xFFFF + _EOCD64_LOCATOR_SIZE
+
+
+class ZipManifest:
+    """
+    Member names of an archive, indexed by full path and by basename so membership
+    checks are O(1) (GitHub archives nest everything under '<repo>-<branch>/').
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names = list(names)
+        self.paths = set(self.names)
+        self.by_basename: dict[str, list[str]] = {}
+        for name in self.names:
+            if not name.endswith("/"):  # directories
+                self.by_basename.setdefault(name.rsplit("/", 1)[-1], []).append(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, filename: str) -> bool:
+        """True for a full member path or the basename of any file in the archive."""
+        return filename in self.by_basename or filename in self.paths
+
+    def find(self, basename: str) -> list[str]:
+        return self.by_basename.get(basename, [])
+
+
+def _central_directory_location(tail: bytes, tail_offset: int, read: Callable[[int, int], bytes]) -> tuple[int, int]:
+    """(offset, size) of the central directory, from the end records found in `tail`."""
+    eocd = tail.rfind(_EOCD_SIG)
+    if eocd < 0 or len(tail) - eocd < _EOCD_SIZE:
+        raise ValueError("Not a ZIP archive (no end of central directory record)")
+    cd_size, cd_offset = struct.unpack("<II", tail[eocd + 12:eocd + 20])
+
+    locator = eocd - _EOCD64_LOCATOR_SIZE
+    if locator >= 0 and tail[locator:locator + 4] == _EOCD64_LOCATOR_SIG:
+        # zip64: the real sizes are in the zip64 end record the locator points at
+        (eocd64_offset,) = struct.unpack("<Q", tail[locator + 8:locator + 16])
+        start = eocd64_offset - tail_offset
+        record = tail[start:start + 56] if start >= 0 else read(eocd64_offset, 56)
+        if record[:4] != _EOCD64_SIG:
+            raise ValueError("Corrupt ZIP64 end of central directory record")
+        cd_size, cd_offset = struct.unpack("<QQ", record[40:56])
+    return cd_offset, cd_size
+
+
+def _parse_central_directory(data: bytes) -> list[str]:
+    names, pos = [], 0
+    while pos + 46 <= len(data) and data[pos:pos + 4] == _CENTRAL_SIG:
+        flags = struct.unpack("<H", data[pos + 8:pos + 10])[0]
+        name_len, extra_len, comment_len = struct.unpack("<HHH", data[pos + 28:pos + 34])
+        raw = data[pos + 46:pos + 46 + name_len]
+        names.append(raw.decode("utf-8" if flags & 0x800 else "cp437"))
+        pos += 46 + name_len + extra_len + comment_len
+    return names
+
+
+def _manifest(tail_offset: int, tail: bytes, read: Callable[[int, int], bytes]) -> ZipManifest:
+    cd_offset, cd_size = _central_directory_location(tail, tail_offset, read)
+    if cd_offset >= tail_offset:
+        data = tail[cd_offset - tail_offset:cd_offset - tail_offset + cd_size]
+    else:
+        data = read(cd_offset, cd_size)
+    return ZipManifest(_parse_central_directory(data))
+
+
+def read_manifest(size: int, read: Callable[[int, int], bytes]) -> ZipManifest:
+    """
+    Manifest of an archive of `size` bytes, where read(offset, length) returns bytes
+    from it. Reads the tail once, plus the central directory if it starts before the tail.
+    """
+    tail_offset = max(0, size - TAIL_SIZE)
+    return _manifest(tail_offset, read(tail_offset, size - tail_offset), read)
+
+
+def manifest_from_bytes(data: bytes) -> ZipManifest:
+    return read_manifest(len(data), lambda offset, length: data[offset:offset + length])
+
+
+def manifest_from_file(path: str | Path) -> ZipManifest:
+    with open(path, "rb") as f:
+        def read(offset: int, length: int) -> bytes:
+            f.seek(offset)
+            return f.read(length)
+        return read_manifest(Path(path).stat().st_size, read)
+
+
+class RangeReader:
+    """
+    read(offset, length) over HTTP Range requests. `bytes_fetched` counts the body bytes
+    actually transferred; when the server ignores Range the whole body is kept in memory.
+    """
+
+    def __init__(self, url: str, headers: dict[str, str] | None = None, timeout: float = 30):
+        self.url = url
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.size: int | None = None
+        self.requests = 0
+        self.bytes_fetched = 0
+        self._buffer: bytes | None = None  # full body, only when ranges aren't supported
+
+    def _get(self, byte_range: str) -> tuple[int, dict, bytes]:
+        request = urllib.request.Request(self.url, headers={**self.headers, "Range": f"bytes={byte_range}"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            body = response.read()
+            self.requests += 1
+            self.bytes_fetched += len(body)
+            return response.status, response.headers, body
+
+    def tail(self, length: int) -> tuple[int, bytes]:
+        """Last `length` bytes and their offset; also learns the archive size."""
+        status, headers, body = self._get(f"-{length}")
+        if status == 206 and headers.get("Content-Range"):
+            self.size = int(headers["Content-Range"].rsplit("/", 1)[1])
+            return self.size - len(body), body
+        # 200: no range support, we have the whole archive now
+        self._buffer = body
+        self.size = len(body)
+        offset = max(0, self.size - length)
+        return offset, body[offset:]
+
+    def read(self, offset: int, length: int) -> bytes:
+        if self._buffer is not None:
+            return self._buffer[offset:offset + length]
+        return self._get(f"{offset}-{offset + length - 1}")[2]
+
+
+def manifest_from_url(url: str, headers: dict[str, str] | None = None) -> tuple[ZipManifest, RangeReader]:
+    """Manifest of a remote archive, fetching only its tail and central directory where the server allows."""
+    reader = RangeReader(url, headers)
+    tail_offset, tail = reader.tail(TAIL_SIZE)
+    return _manifest(tail_offset, tail, reader.read), reader